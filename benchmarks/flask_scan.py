@@ -0,0 +1,179 @@
+"""
+Scans a large synthetic Flask project with both Flask drivers (import and static)
+and reports the time of the 'routes' stage (building the endpoints) and the memory
+retained by the resulting TeraSchema: bytes and distinct objects reachable from it,
+each shared object counted once.
+
+    python benchmarks/flask_scan.py --endpoints 10000 [--json results.json]
+"""
+import argparse
+import json
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tera.core import timings
+from tera.drivers.flask_driver import FlaskAppDriver
+from tera.drivers.flask_static_driver import FlaskStaticDriver
+
+PACKAGE = "bench_app"
+VIEWS_PER_MODULE = 200
+
+SCHEMAS = '''
+    from typing import List, Optional
+    from pydantic import BaseModel, Field
+
+    class Item(BaseModel):
+        """An item of the catalog."""
+        name: str = Field(..., description="Display name")
+        price: float
+        stock: int = 0
+        tags: List[str] = []
+        note: Optional[str] = None
+
+    class Audit(BaseModel):
+        reason: str = Field(..., description="Why the change was made")
+        ticket: Optional[int] = None
+'''
+
+# One view per route; they cycle through these shapes (path and query params, body models, auth).
+VIEWS = [
+    '''
+    @bp.get("/items{i}/<int:item_id>")
+    def read_{i}(item_id: int, expand: bool = False, page: int = 1, q: str = ""):
+        """Reads item {i}.
+
+        Includes the stock of every warehouse.
+        """
+        return ""
+    ''',
+    '''
+    @bp.post("/items{i}")
+    def create_{i}(item: Item, dry_run: bool = False):
+        """Creates item {i}."""
+        return ""
+    ''',
+    '''
+    @bp.put("/items{i}/<int:item_id>")
+    @token_required
+    def update_{i}(item_id: int, item: Item, audit: Audit):
+        """Replaces item {i}."""
+        return ""
+    ''',
+    '''
+    @bp.delete("/items{i}/<int:item_id>")
+    @token_required
+    def delete_{i}(item_id: int, force: bool = False):
+        """Deletes item {i}."""
+        return ""
+    ''',
+]
+
+def make_project(root: Path, endpoints: int) -> None:
+    package = root / PACKAGE
+    package.mkdir()
+    modules = (endpoints + VIEWS_PER_MODULE - 1) // VIEWS_PER_MODULE
+
+    (package / "schemas.py").write_text(textwrap.dedent(SCHEMAS), encoding="utf-8")
+    (package / "auth.py").write_text("def token_required(f):\n    return f\n", encoding="utf-8")
+    for m in range(modules):
+        views = [
+            textwrap.dedent(VIEWS[i % len(VIEWS)]).format(i=i)
+            for i in range(m * VIEWS_PER_MODULE, min((m + 1) * VIEWS_PER_MODULE, endpoints))
+        ]
+        (package / f"views{m}.py").write_text(
+            "from flask import Blueprint\n"
+            "from .schemas import Item, Audit\n"
+            "from .auth import token_required\n\n"
+            f"bp = Blueprint('views{m}', __name__)\n" + "".join(views),
+            encoding="utf-8"
+        )
+
+    (package / "__init__.py").write_text(
+        "from flask import Flask\n"
+        + "".join(f"from .views{m} import bp as bp{m}\n" for m in range(modules))
+        + "\napp = Flask(__name__)\n"
+        + "".join(f"app.register_blueprint(bp{m}, url_prefix='/m{m}')\n" for m in range(modules)),
+        encoding="utf-8"
+    )
+
+def retained(root: Any) -> Tuple[int, int]:
+    """(bytes, objects) reachable from 'root', every object counted once."""
+    seen, stack, size = set(), [root], 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__pydantic_fields__"):
+            stack.append(obj.__dict__)
+            stack.append(obj.__pydantic_fields_set__)
+    return size, len(seen)
+
+def scan(driver_factory, repeat: int) -> Dict[str, Any]:
+    best, schema = float("inf"), None
+    routes: Dict[str, float] = {}
+    hook = lambda record: routes.__setitem__(record.name, record.wall)
+    timings.add_hook(hook)
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            schema = driver_factory().load()
+            best = min(best, time.perf_counter() - start)
+            routes["best_routes"] = min(routes.get("best_routes", float("inf")), routes["routes"])
+    finally:
+        timings.remove_hook(hook)
+
+    size, objects = retained(schema)
+    return {
+        "endpoints": len(schema.endpoints),
+        "load": best,
+        "routes": routes["best_routes"],
+        "retained_bytes": size,
+        "retained_objects": objects,
+    }
+
+def run(endpoints: int, repeat: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_project(root, endpoints)
+        sys.path.insert(0, tmp)
+        try:
+            return {
+                "import": scan(lambda: FlaskAppDriver(f"{PACKAGE}:app"), repeat),
+                "static": scan(lambda: FlaskStaticDriver(f"{PACKAGE}:app", root=root, jobs=1), repeat),
+            }
+        finally:
+            sys.path.remove(tmp)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoints", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", type=Path, help="Also save the results to this file.")
+    args = parser.parse_args()
+
+    results = run(args.endpoints, args.repeat)
+    print(f"{args.endpoints} views (best of {args.repeat})")
+    print(f"{'driver':<10}{'endpoints':>10}{'load':>10}{'routes':>10}{'retained':>12}{'objects':>10}")
+    for driver, r in results.items():
+        print(f"{driver:<10}{r['endpoints']:>10}{r['load']:>9.3f}s{r['routes']:>9.3f}s"
+              f"{r['retained_bytes'] / 1e6:>10.1f}MB{r['retained_objects']:>10}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+if __name__ == "__main__":
+    main()
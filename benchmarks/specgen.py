@@ -0,0 +1,109 @@
+"""
+Deterministic generator of synthetic Tera specs, shared by the benchmarks.
+The same arguments always produce the same spec (no randomness), so timings
+taken on different commits measure the same workload.
+
+    python benchmarks/specgen.py --endpoints 2000 --params 4 --depth 3 --example-size 5 -o spec.yaml
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tera.core import yaml_io
+
+METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH"]
+PARAM_TYPES = ["string", "integer", "boolean", "number"]
+
+def make_example(depth: int, size: int, seed: int = 0) -> Any:
+    """
+    Nested example: objects and lists alternate down to 'depth' levels,
+    each level holding 'size' entries. Leaves cycle through JSON scalar types.
+    """
+    if depth <= 0:
+        leaves = [seed, f"value {seed}", seed % 2 == 0, seed / 4, None, "çãé — ünï"]
+        return leaves[seed % len(leaves)]
+    if depth % 2:
+        return {f"key{j}": make_example(depth - 1, size, seed + j) for j in range(size)}
+    return [make_example(depth - 1, size, seed + j) for j in range(size)]
+
+def make_spec(
+    endpoints: int,
+    params: int = 3,
+    depth: int = 2,
+    example_size: int = 5,
+    tags: int = 25
+) -> Dict[str, Any]:
+    """
+    Spec with 'endpoints' operations spread over 'tags' tags, 'params' query
+    parameters and body fields each, and examples of the given depth and size.
+    """
+    items = []
+    for i in range(endpoints):
+        method = METHODS[i % len(METHODS)]
+        endpoint = {
+            "path": f"/resources{i % 50}/{{id}}/items{i}",
+            "method": method,
+            "summary": f"Operação {i} — synthetic endpoint",
+            "description": "Long description " * (i % 7),
+            "tag": f"group{i % tags}",
+            "auth_required": i % 2 == 0,
+            "params": {
+                "path": [{"name": "id", "type": "integer", "required": True, "example": i}],
+                "query": [
+                    {
+                        "name": f"filter{j}",
+                        "type": PARAM_TYPES[j % len(PARAM_TYPES)],
+                        "description": f"Filter number {j}",
+                        "example": f"value{j}",
+                    }
+                    for j in range(params)
+                ],
+            },
+            "responses": {
+                "success": {
+                    "status": 201 if method == "POST" else 200,
+                    "example": make_example(depth, example_size, i),
+                },
+                "errors": [{"status": 404, "message": "Not found", "example": {"error": "not_found"}}],
+            },
+        }
+        if method in ("POST", "PUT", "PATCH"):
+            endpoint["body"] = [
+                {"name": f"field{j}", "required": j == 0, "example": make_example(depth - 1, example_size, i + j)}
+                for j in range(params)
+            ]
+        items.append(endpoint)
+
+    return {
+        "api": {"name": "Benchmark API", "version": "1.0.0", "description": "Synthetic", "auth": {"type": "bearer"}},
+        "endpoints": items,
+    }
+
+def write_spec(path: Path, spec: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        yaml_io.dump(spec, f, sort_keys=False, allow_unicode=True, default_flow_style=False, indent=2)
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Generator options, shared by every benchmark script."""
+    parser.add_argument("--endpoints", type=int, default=2000)
+    parser.add_argument("--params", type=int, default=3, help="Query parameters and body fields per endpoint.")
+    parser.add_argument("--depth", type=int, default=2, help="Nesting depth of the examples.")
+    parser.add_argument("--example-size", type=int, default=5, help="Entries per level of the examples.")
+
+def spec_options(args: argparse.Namespace) -> Dict[str, int]:
+    return {"endpoints": args.endpoints, "params": args.params, "depth": args.depth, "example_size": args.example_size}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    parser.add_argument("--output", "-o", type=Path, default=Path("spec.yaml"))
+    args = parser.parse_args()
+
+    write_spec(args.output, make_spec(**spec_options(args)))
+    print(f"{args.output}: {args.output.stat().st_size / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main()
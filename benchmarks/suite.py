@@ -0,0 +1,250 @@
+"""
+Benchmark suite for 'tera build', 'tera lint' and 'tera export' on a synthetic
+spec (see specgen.py). Every stage of each command (load, validate, convert,
+lint rules, each writer) is timed in-process, best of --repeat runs, without any
+cache. The cold-start cost of each CLI command (Python import time reported by
+'-X importtime', and wall time) is measured in fresh interpreters on a tiny project.
+
+    python benchmarks/suite.py --endpoints 2000 --output baseline.json
+    python benchmarks/suite.py --endpoints 2000 --compare baseline.json [--threshold 0.15]
+
+With --compare, a stage slower than the baseline by more than the threshold
+(and by more than --min-delta seconds, to ignore noise on tiny stages) is a
+regression: they are listed and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.specgen import add_arguments, make_spec, spec_options, write_spec
+from tera.core import factory, yaml_io
+from tera.core.cache import TERA_VERSION
+from tera.domain import TeraSchema
+from tera.adapters import FileLoader, TeraOpenApiAdapter
+from tera.services.linter import LinterService
+from tera.services.pipeline import run_pipeline
+from tera.services.rules import RuleEngine
+
+RESULTS_FORMAT = 1
+
+BUILD_WRITERS = ("tera-yaml", "tera-json", "openapi-json", "openapi-yaml")
+EXPORT_WRITERS = ("markdown", "html", "postman")
+
+TINY_APP = textwrap.dedent('''
+    from flask import Flask
+
+    app = Flask("cold_start")
+
+    @app.get("/ping")
+    def ping():
+        """Ping."""
+        return ""
+''')
+
+# Arguments of each command for the cold-start runs, inside the tiny project.
+COLD_START_COMMANDS: Dict[str, List[str]] = {
+    "help": ["--help"],
+    "lint": ["lint", "docs.yaml", "--no-cache"],
+    "build": ["build", "docs.yaml", "-o", "docs.json", "--no-cache"],
+    "export": ["export", "docs.yaml", "-f", "html", "-o", "docs.html", "--no-cache"],
+    "scan": ["scan", "app:app", "-o", "scanned.yaml", "--no-cache"],
+}
+
+PROBE = textwrap.dedent("""
+    import sys
+    from tera.main import app
+    try:
+        app(sys.argv[1:], standalone_mode=False)
+    except SystemExit:
+        pass
+""")
+
+def timed(func: Callable[[Any], Any], repeat: int, setup: Callable[[], Any] = lambda: None) -> Tuple[float, Any]:
+    """Best time of 'repeat' calls of func(setup()); setup runs outside the measure."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        result = func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def bench_commands(spec_path: Path, out_dir: Path, repeat: int) -> Dict[str, float]:
+    """Times the stages of build, lint and export. Keys are 'command.stage'."""
+    stages: Dict[str, float] = {}
+
+    def record(name: str, func: Callable[[Any], Any], setup: Callable[[], Any] = lambda: None) -> Any:
+        stages[name], result = timed(func, repeat, setup)
+        return result
+
+    def load(_):
+        with open(spec_path, encoding="utf-8") as f:
+            return yaml_io.safe_load(f)
+
+    # A copy starts with an empty memo, so nothing converted by a previous run is reused.
+    fresh_schema = lambda: schema.model_copy()
+
+    # build
+    data = record("build.load", load)
+    schema = record("build.validate", lambda _: TeraSchema.model_validate(data))
+    record("build.convert", lambda s: TeraOpenApiAdapter(s).convert(), fresh_schema)
+    for kind in BUILD_WRITERS:
+        writer = factory.get_writer(out_dir / f"out{factory.FORMAT_EXTENSIONS[kind]}", kind)
+        record(f"build.write.{kind}", writer.write, fresh_schema)
+    record("build.total", lambda _: run_pipeline(
+        factory.get_driver(spec_path), factory.get_writer(out_dir / "total.json", "openapi")
+    ))
+
+    # lint
+    data, _, source_index = record("lint.load", lambda _: FileLoader.load_with_index(spec_path))
+    schema = record("lint.validate", lambda _: TeraSchema.model_validate(data))
+    record("lint.rules", lambda s: RuleEngine(source_index=source_index).run(s), fresh_schema)
+    record("lint.total", lambda _: LinterService().lint(spec_path))
+
+    # export
+    for kind in EXPORT_WRITERS:
+        writer = factory.get_writer(out_dir / f"out{factory.FORMAT_EXTENSIONS[kind]}", kind)
+        record(f"export.write.{kind}", writer.write, fresh_schema)
+
+    return stages
+
+def bench_cold_start(repeat: int) -> Dict[str, Dict[str, float]]:
+    """Import and wall time of each CLI command in a fresh interpreter (best of 'repeat')."""
+    results = {}
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp)
+        write_spec(project / "docs.yaml", make_spec(3, params=1, depth=1, example_size=2))
+        (project / "app.py").write_text(TINY_APP, encoding="utf-8")
+
+        for command, args in COLD_START_COMMANDS.items():
+            best = {"imports": float("inf"), "wall": float("inf"), "modules": 0}
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = subprocess.run(
+                    [sys.executable, "-X", "importtime", "-c", PROBE, *args],
+                    cwd=project, env=env, capture_output=True, text=True, check=True
+                )
+                wall = time.perf_counter() - start
+                imports = _import_times(result.stderr)
+                best["wall"] = min(best["wall"], wall)
+                if sum(imports.values()) < best["imports"]:
+                    best["imports"], best["modules"] = sum(imports.values()), len(imports)
+            results[command] = best
+    return results
+
+def _import_times(stderr: str) -> Dict[str, float]:
+    """Self time (seconds) of every module in a '-X importtime' report."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us) / 1e6
+    return times
+
+def run(options: Dict[str, int], repeat: int, cold_start_repeat: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        spec_path = Path(tmp) / "spec.yaml"
+        write_spec(spec_path, make_spec(**options))
+        spec_bytes = spec_path.stat().st_size
+        stages = bench_commands(spec_path, Path(tmp), repeat)
+
+    return {
+        "format": RESULTS_FORMAT,
+        "environment": {
+            "tera": TERA_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "libyaml": yaml_io.HAS_LIBYAML,
+        },
+        "workload": {**options, "spec_bytes": spec_bytes, "repeat": repeat},
+        "stages": stages,
+        "cold_start": bench_cold_start(cold_start_repeat) if cold_start_repeat else {},
+    }
+
+def flatten(results: Dict[str, Any]) -> Dict[str, float]:
+    """Every compared measure as 'name: seconds'."""
+    measures = dict(results["stages"])
+    for command, times in results.get("cold_start", {}).items():
+        measures[f"cold_start.{command}.imports"] = times["imports"]
+        measures[f"cold_start.{command}.wall"] = times["wall"]
+    return measures
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float, min_delta: float
+) -> List[Tuple[str, float, float, float, bool]]:
+    """(name, baseline, current, ratio, regressed) for every measure present in both results."""
+    rows = []
+    base, now = flatten(baseline), flatten(current)
+    for name in now:
+        if name not in base:
+            continue
+        ratio = now[name] / base[name] if base[name] else float("inf")
+        regressed = ratio > 1 + threshold and now[name] - base[name] > min_delta
+        rows.append((name, base[name], now[name], ratio, regressed))
+    return rows
+
+def print_results(results: Dict[str, Any]) -> None:
+    workload = results["workload"]
+    print(f"{workload['endpoints']} endpoints, {workload['spec_bytes'] / 1e6:.1f} MB of YAML "
+          f"(best of {workload['repeat']})")
+    for name, seconds in results["stages"].items():
+        print(f"  {name:<30}{seconds:>10.3f}s")
+    if results["cold_start"]:
+        print(f"\n  {'cold start':<18}{'imports':>10}{'wall':>10}{'modules':>9}")
+        for command, times in results["cold_start"].items():
+            print(f"  {command:<18}{times['imports']:>9.3f}s{times['wall']:>9.3f}s{times['modules']:>9}")
+
+def print_comparison(rows: List[Tuple[str, float, float, float, bool]]) -> None:
+    print(f"\n  {'measure':<30}{'baseline':>10}{'current':>10}{'ratio':>8}")
+    for name, base, now, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"  {name:<30}{base:>9.3f}s{now:>9.3f}s{ratio:>7.2f}x{flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cold-start-repeat", type=int, default=3, help="0 skips the cold-start runs.")
+    parser.add_argument("--output", "-o", type=Path, help="Save the results to this JSON file.")
+    parser.add_argument("--compare", type=Path, help="Baseline results to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Tolerated slowdown (0.15 = 15%%).")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="Ignore slowdowns below this many seconds.")
+    args = parser.parse_args()
+
+    baseline: Optional[Dict[str, Any]] = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        options = spec_options(args)
+        if {key: baseline["workload"].get(key) for key in options} != options:
+            raise SystemExit(f"{args.compare} was measured on another workload: {baseline['workload']}")
+
+    results = run(spec_options(args), args.repeat, args.cold_start_repeat)
+    print_results(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if baseline:
+        rows = compare(results, baseline, args.threshold, args.min_delta)
+        print_comparison(rows)
+        regressions = [row[0] for row in rows if row[4]]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
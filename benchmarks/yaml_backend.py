@@ -0,0 +1,86 @@
+"""
+Compares the pure-Python and libyaml YAML backends used by tera.core.yaml_io
+on a large synthetic Tera spec: load time, dump time (canonical Tera YAML and
+OpenAPI YAML) and whether both backends produce identical results.
+
+    python benchmarks/yaml_backend.py --endpoints 5000 [--json results.json]
+"""
+import argparse
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.specgen import make_spec
+from tera.core import yaml_io
+from tera.domain import TeraSchema
+from tera.adapters import TeraOpenApiAdapter
+from tera.writers.openapi_writer import OpenApiYamlDumper, YAML_OPTIONS
+
+def timed(func, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def run(endpoints: int, repeat: int) -> dict:
+    if not yaml_io.HAS_LIBYAML:
+        raise SystemExit("PyYAML was built without libyaml: nothing to compare.")
+
+    backends = {name: yaml_io._select_backend(name) for name in ("python", "libyaml")}
+    spec = make_spec(endpoints)
+    source = yaml_io.dump(spec, sort_keys=False, allow_unicode=True, default_flow_style=False, indent=2)
+    openapi = TeraOpenApiAdapter(TeraSchema(**spec)).convert()
+
+    results = {"endpoints": endpoints, "source_bytes": len(source.encode()), "backends": {}}
+    outputs = {}
+
+    for name, (_, loader, dumper) in backends.items():
+        class Dumper(dumper):
+            ignore_aliases = OpenApiYamlDumper.ignore_aliases
+
+        load_time, loaded = timed(lambda: yaml_io.safe_load(io.StringIO(source), loader=loader), repeat)
+        tera_time, tera_out = timed(lambda: yaml_io.dump(loaded, dumper=dumper, sort_keys=False, allow_unicode=True,
+                                                         default_flow_style=False, indent=2), repeat)
+        openapi_time, openapi_out = timed(lambda: yaml_io.dump(openapi, dumper=Dumper, **YAML_OPTIONS), repeat)
+
+        outputs[name] = (loaded, tera_out, openapi_out)
+        results["backends"][name] = {"load": load_time, "dump_tera": tera_time, "dump_openapi": openapi_time}
+
+    python, libyaml = outputs["python"], outputs["libyaml"]
+    results["identical"] = {
+        "load": python[0] == libyaml[0],
+        "dump_tera": python[1] == libyaml[1],
+        "dump_openapi": python[2] == libyaml[2],
+    }
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoints", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", type=Path, help="Also save the results to this file.")
+    args = parser.parse_args()
+
+    results = run(args.endpoints, args.repeat)
+    py, c = results["backends"]["python"], results["backends"]["libyaml"]
+
+    print(f"{args.endpoints} endpoints, {results['source_bytes'] / 1e6:.1f} MB of YAML (best of {args.repeat})")
+    print(f"{'stage':<14}{'python':>12}{'libyaml':>12}{'speedup':>10}{'identical':>11}")
+    for stage in ("load", "dump_tera", "dump_openapi"):
+        print(f"{stage:<14}{py[stage]:>11.3f}s{c[stage]:>11.3f}s{py[stage] / c[stage]:>9.1f}x"
+              f"{str(results['identical'][stage]):>11}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if not all(results["identical"].values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,5 @@
-from .openapi import TeraOpenApiAdapter
-from .file_loader import FileLoader
\ No newline at end of file
+from .openapi import TeraOpenApiAdapter, OperationCache
+from .inference import SchemaInferrer
+from .file_loader import FileLoader
+from .source_index import SourceIndex
+from .compiled_cache import CompiledSchemaCache, FragmentCache
@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+import sys
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+import pydantic
+from tera.core.cache import TERA_VERSION, get_cache_dir, hash_file
+from tera.domain import TeraSchema, TeraFragment
+from tera.adapters.source_index import SourceIndex
+
+# Bump when the layout of the stored entries changes.
+COMPILED_FORMAT_VERSION = 2
+# Source indexes are very repetitive: fast compression shrinks entries ~7x for a few ms.
+COMPRESSION_LEVEL = 1
+
+@lru_cache(maxsize=1)
+def model_fingerprint() -> str:
+    """
+    Hash of the TeraSchema JSON schema: any change to the domain models
+    (new field, new constraint) invalidates every compiled entry.
+    """
+    document = json.dumps(TeraSchema.model_json_schema(), sort_keys=True, default=str)
+    return hashlib.sha256(document.encode()).hexdigest()
+
+class CompiledSchemaCache:
+    """
+    Keeps the validated TeraSchema of each source file (plus its SourceIndex) in '.tera/cache/schemas',
+    so commands run after the first one skip YAML parsing and the Python side of validation.
+    There is one entry per source path; it is only used when its key still matches the
+    file content, the Tera/pydantic/Python versions and the domain model fingerprint.
+
+    The cache lives in the project tree, so a repository may ship crafted entries: they are
+    plain data, never pickles. An entry is a JSON header line (version and key, checked before
+    anything else is read) followed by the compressed schema JSON, which pydantic validates
+    again on load, and the source positions.
+    """
+    DIR_NAME = "schemas"
+    ENTRY_TYPE = TeraSchema
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir or get_cache_dir()
+        self.directory = self.cache_dir / self.DIR_NAME
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def compute_key(source_path: Path) -> str:
+        digest = hashlib.sha256()
+        for part in (
+            hash_file(source_path), TERA_VERSION, pydantic.VERSION,
+            f"{sys.version_info.major}.{sys.version_info.minor}",
+            str(COMPILED_FORMAT_VERSION), model_fingerprint()
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def load(
+        self, source_path: Path, key: Optional[str] = None, require_index: bool = False
+    ) -> Optional[Tuple[TeraSchema, Optional[SourceIndex]]]:
+        """
+        Returns (schema, source_index) when a matching entry exists, None otherwise.
+        'require_index' rejects entries stored without a SourceIndex (e.g. written by a build).
+        Unreadable or corrupted entries count as misses.
+        """
+        try:
+            key = key or self.compute_key(source_path)
+            with open(self._entry_path(source_path, key), "rb") as f:
+                header = json.loads(f.readline())
+                if (
+                    header.get("version") != COMPILED_FORMAT_VERSION or header.get("key") != key
+                    or (require_index and not header.get("indexed"))
+                ):
+                    self.misses += 1
+                    return None
+                schema_json, _, positions_json = zlib.decompress(f.read()).partition(b"\n")
+            schema = self.ENTRY_TYPE.model_validate_json(schema_json)
+            positions = json.loads(positions_json)
+            if positions is not None and (not isinstance(positions, list) or len(positions) % 4):
+                raise ValueError("malformed source positions")
+            source_index = None if positions is None else SourceIndex.from_flat(positions)
+        except Exception:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return schema, source_index
+
+    def store(
+        self, source_path: Path, schema: TeraSchema,
+        source_index: Optional[SourceIndex] = None, key: Optional[str] = None
+    ) -> None:
+        """Writes the entry atomically. Cache failures never break a command."""
+        try:
+            key = key or self.compute_key(source_path)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            entry_path = self._entry_path(source_path, key)
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            header = {"version": COMPILED_FORMAT_VERSION, "key": key, "indexed": source_index is not None}
+            positions = None if source_index is None else source_index.to_flat()
+            # Schemas holding values JSON cannot round-trip are not cached: YAML dates or NaN in
+            # examples raise here, non-string keys ({1: a}) would come back as strings.
+            data = schema.model_dump()
+            documents = [
+                json.dumps(document, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+                for document in (data, positions)
+            ]
+            if json.loads(documents[0]) != data:
+                return
+            # Compact JSON escapes newlines, so a raw one separates the documents.
+            payload = "\n".join(documents).encode()
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(header).encode() + b"\n")
+                f.write(zlib.compress(payload, COMPRESSION_LEVEL))
+            os.replace(tmp_path, entry_path)
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def _entry_path(self, source_path: Path, key: str) -> Path:
+        name = hashlib.sha1(str(Path(source_path).resolve()).encode()).hexdigest()
+        return self.directory / f"{name}.json.z"
+
+class FragmentCache(CompiledSchemaCache):
+    """
+    Validated fragments of multi-file sources, in '.tera/cache/fragments'.
+    Entries are addressed by their key (content hash + versions) instead of the source path:
+    a fragment is reused wherever it lives, and one entry per fragment content is kept.
+    Those names can be computed ahead of time, so entries use the same plain-data format
+    (validated on load) as the schema entries.
+    """
+    DIR_NAME = "fragments"
+    ENTRY_TYPE = TeraFragment
+
+    def _entry_path(self, source_path: Path, key: str) -> Path:
+        return self.directory / f"{key}.json.z"
@@ -3,6 +3,8 @@ import yaml
 from pathlib import Path
 from typing import Tuple, Optional, Dict, Any
 from tera.domain.linting import LintIssue, LintSeverity
+from tera.adapters.source_index import SourceIndex
+from tera.core import yaml_io
 
 class FileLoader:
     """
@@ -11,40 +13,58 @@ class FileLoader:
     """   
     @staticmethod
     def load(path: Path) -> Tuple[Optional[Dict[str, Any]], list[LintIssue]]:
+        data, issues, _ = FileLoader.load_with_index(path)
+        return data, issues
+
+    @staticmethod
+    def load_with_index(path: Path) -> Tuple[Optional[Dict[str, Any]], list[LintIssue], SourceIndex]:
+        """
+        Same as 'load', plus a SourceIndex with the line/column of every node.
+        YAML positions come from the same compose pass that builds the data; JSON gets an empty index.
+        """
         issues = []
         
         if not path.exists():
             issues.append(LintIssue(
                 code="file_not_found", message=f"File not found: {path}", severity=LintSeverity.ERROR
             ))
-            return None, issues
+            return None, issues, SourceIndex()
 
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 if path.suffix in ['.yaml', '.yml']:
                     return FileLoader._parse_yaml(f)
                 elif path.suffix == '.json':
-                    return FileLoader._parse_json(f)
+                    data, json_issues = FileLoader._parse_json(f)
+                    return data, json_issues, SourceIndex()
                 else:
                     issues.append(LintIssue(
                         code="unknown_format", message="Unsupported extension.", severity=LintSeverity.ERROR
                     ))
-                    return None, issues
+                    return None, issues, SourceIndex()
         except Exception as e:
             issues.append(LintIssue(
                 code="io_error", message=str(e), severity=LintSeverity.ERROR
             ))
-            return None, issues
+            return None, issues, SourceIndex()
 
     @staticmethod
-    def _parse_yaml(stream) -> Tuple[Optional[Dict], list]:
+    def _parse_yaml(stream) -> Tuple[Optional[Dict], list, SourceIndex]:
+        """Equivalent to yaml.safe_load, keeping the composed node tree long enough to index it."""
+        loader = yaml_io.SafeLoader(stream)
         try:
-            return yaml.safe_load(stream), []
+            node = loader.get_single_node()
+            data = loader.construct_document(node) if node is not None else None
+            return data, [], SourceIndex.from_node(node)
         except yaml.YAMLError as e:
-            line = e.problem_mark.line + 1 if hasattr(e, 'problem_mark') else None
+            mark = getattr(e, 'problem_mark', None)
+            line = mark.line + 1 if mark else None
             return None, [LintIssue(
-                code="yaml_syntax", message=f"Invalid YAML: {e}", severity=LintSeverity.ERROR, line=line
-            )]
+                code="yaml_syntax", message=f"Invalid YAML: {e}", severity=LintSeverity.ERROR,
+                line=line, column=mark.column + 1 if mark else None
+            )], SourceIndex()
+        finally:
+            loader.dispose()
 
     @staticmethod
     def _parse_json(stream) -> Tuple[Optional[Dict], list]:
@@ -52,5 +72,6 @@ class FileLoader:
             return json.load(stream), []
         except json.JSONDecodeError as e:
             return None, [LintIssue(
-                code="json_syntax", message=f"Invalid JSON: {e.msg}", severity=LintSeverity.ERROR, line=e.lineno
+                code="json_syntax", message=f"Invalid JSON: {e.msg}", severity=LintSeverity.ERROR,
+                line=e.lineno, column=e.colno
             )]
\ No newline at end of file
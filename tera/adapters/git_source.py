@@ -0,0 +1,78 @@
+import subprocess
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+class GitSource:
+    """
+    A spec read straight from git's object store ('<rev>:<path>', e.g. 'main:docs.yaml'
+    or 'HEAD~1:./api/'), without touching the working tree.
+    Paths follow git's rules: relative to the repository root, or to the current
+    directory when they start with './'.
+    """
+    def __init__(self, revision: str, path: str, cwd: Optional[Path] = None):
+        self.revision = revision
+        self.path = path
+        self.cwd = cwd
+
+    @property
+    def object_name(self) -> str:
+        return f"{self.revision}:{self.path}"
+
+    @classmethod
+    def parse(cls, text: str, cwd: Optional[Path] = None) -> Optional["GitSource"]:
+        """A GitSource when 'text' looks like '<rev>:<path>' and git resolves it, None otherwise."""
+        revision, separator, path = text.partition(":")
+        if not separator or not revision:
+            return None
+        source = cls(revision, path, cwd)
+        return source if source.object_type() else None
+
+    def object_type(self) -> Optional[str]:
+        """'blob' for a file, 'tree' for a directory, None when git does not know the object."""
+        try:
+            return self._git("cat-file", "-t", self.object_name).decode().strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def read(self) -> bytes:
+        """Content of the file at the revision."""
+        return self._git("cat-file", "blob", self.object_name)
+
+    def parent(self) -> "GitSource":
+        """The directory holding this file at the same revision."""
+        head = self.path.rstrip("/").rpartition("/")[0]
+        return GitSource(self.revision, f"{head}/" if head else "", self.cwd)
+
+    def export_tree(self, destination: Path) -> None:
+        """
+        Writes the files of this directory at the revision under 'destination'.
+        Blobs are read in a single 'git cat-file --batch' call.
+        """
+        listing = self._git("ls-tree", "-r", "-z", self.object_name)
+        entries: List[Tuple[str, str]] = []
+        for record in listing.split(b"\0"):
+            if not record:
+                continue
+            meta, _, name = record.partition(b"\t")
+            _, kind, sha = meta.decode().split()
+            if kind == "blob":
+                entries.append((sha, name.decode("utf-8", "surrogateescape")))
+
+        if not entries:
+            return
+        batch = self._git("cat-file", "--batch", stdin="".join(f"{sha}\n" for sha, _ in entries).encode())
+        position = 0
+        for _, name in entries:
+            header_end = batch.index(b"\n", position)
+            size = int(batch[position:header_end].split()[2])
+            content = batch[header_end + 1:header_end + 1 + size]
+            position = header_end + 1 + size + 1
+
+            target = destination / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+
+    def _git(self, *args: str, stdin: Optional[bytes] = None) -> bytes:
+        return subprocess.run(
+            ["git", *args], cwd=self.cwd, input=stdin, capture_output=True, check=True
+        ).stdout
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+UUID_PATTERN = re.compile(r'^[0-9a-fA-F-]{36}$')
+
+# Fingerprints of scalar values are short codes; composite values get a digest
+# of their keys and children fingerprints, so computing them stays linear.
+_SCALAR_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "s": {"type": "string"},
+    "u": {"type": "string", "format": "uuid"},
+    "b": {"type": "boolean"},
+    "i": {"type": "integer"},
+    "n": {"type": "number"},
+    "x": {"type": "string"},
+}
+
+CACHE_FORMAT_VERSION = 1
+
+class SchemaInferrer:
+    """
+    Example-based OpenAPI schema inference, memoized on a structural fingerprint
+    of the example: two examples with the same shape (keys, nesting and scalar kinds)
+    share one inference, no matter their values.
+    Cached schemas are never handed out directly: 'infer' returns a fresh copy,
+    so callers may mutate the result (e.g. add 'minLength').
+    """
+    def __init__(self, entries: Optional[Dict[str, Dict[str, Any]]] = None):
+        self._cache: Dict[str, Dict[str, Any]] = dict(entries or {})
+        self.hits = 0
+        self.misses = 0
+
+    def infer(self, value: Any) -> Dict[str, Any]:
+        """Returns the OpenAPI schema of an example value (a private copy)."""
+        _, schema = self._infer(value)
+        return _copy_schema(schema)
+
+    def fingerprint(self, value: Any) -> str:
+        return self._infer(value)[0]
+
+    def _infer(self, value: Any) -> Tuple[str, Dict[str, Any]]:
+        if isinstance(value, str):
+            is_uuid = len(value) == 36 and UUID_PATTERN.match(value)
+            return self._scalar("u" if is_uuid else "s")
+
+        if isinstance(value, bool):
+            return self._scalar("b")
+
+        if isinstance(value, int):
+            return self._scalar("i")
+
+        if isinstance(value, float):
+            return self._scalar("n")
+
+        if isinstance(value, dict):
+            children = [(key, self._infer(item)) for key, item in value.items()]
+            digest = hashlib.blake2b(b"{", digest_size=16)
+            for key, (child_fp, _) in children:
+                digest.update(repr(key).encode())
+                digest.update(child_fp.encode())
+            fp = "o" + digest.hexdigest()
+
+            schema = self._lookup(fp)
+            if schema is None:
+                properties = {key: child_schema for key, (_, child_schema) in children}
+                schema = self._store(fp, {"type": "object", "properties": properties})
+            return fp, schema
+
+        if isinstance(value, list):
+            if not value:
+                fp = "[]"
+                schema = self._lookup(fp)
+                if schema is None:
+                    schema = self._store(fp, {"type": "array", "items": {}})
+                return fp, schema
+
+            item_fp, item_schema = self._infer(value[0])
+            fp = "[" + item_fp
+            schema = self._lookup(fp)
+            if schema is None:
+                schema = self._store(fp, {"type": "array", "items": item_schema})
+            return fp, schema
+
+        return self._scalar("x")
+
+    def _scalar(self, code: str) -> Tuple[str, Dict[str, Any]]:
+        return code, _SCALAR_SCHEMAS[code]
+
+    def _lookup(self, fp: str) -> Optional[Dict[str, Any]]:
+        schema = self._cache.get(fp)
+        if schema is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return schema
+
+    def _store(self, fp: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        self._cache[fp] = schema
+        return schema
+
+    @classmethod
+    def load(cls, path: Path) -> "SchemaInferrer":
+        """
+        Restores an inferrer persisted with 'save'.
+        A missing, corrupted or outdated file just gives an empty inferrer.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+
+        if not isinstance(data, dict) or data.get("version") != CACHE_FORMAT_VERSION:
+            return cls()
+        return cls(data.get("entries") or {})
+
+    def save(self, path: Path) -> None:
+        """
+        Persists the memoized schemas so later runs can reuse them.
+        Entries that would not survive a JSON round-trip (e.g. non-string keys) are skipped.
+        """
+        entries = {}
+        for fp, schema in self._cache.items():
+            try:
+                if json.loads(json.dumps(schema)) == schema:
+                    entries[fp] = schema
+            except (TypeError, ValueError):
+                continue
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_FORMAT_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+def _copy_schema(schema: Any) -> Any:
+    """Deep copy restricted to the dict/list/scalar trees produced by the inferrer."""
+    if isinstance(schema, dict):
+        return {key: _copy_schema(value) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_copy_schema(value) for value in schema]
+    return schema
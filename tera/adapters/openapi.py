@@ -1,17 +1,118 @@
-from typing import Any, Dict, List
-import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import hashlib
+import threading
+from tera.core import timings
 from tera.domain import TeraSchema, Endpoint, ParamField, BodyField
+from tera.domain.index import generate_operation_id
+from tera.adapters.inference import SchemaInferrer
+
+class OperationCache:
+    """
+    Operations built by previous conversions, keyed by (method, path) and checked
+    against a digest of the endpoint. Handing the same cache to the adapter of each new
+    schema (e.g. in watch mode) regenerates only the endpoints that actually changed.
+    """
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+        self._seen: set = set()
+        self._lock = threading.Lock()
+        self.reused = 0
+        self.rebuilt = 0
+
+    def begin_cycle(self) -> None:
+        """Resets the counters before converting a new version of the schema."""
+        self._seen = set()
+        self.reused = 0
+        self.rebuilt = 0
+
+    def get_or_build(
+        self, ep: Endpoint, build: Callable[[Endpoint], Dict[str, Any]], dependencies: str = ""
+    ) -> Dict[str, Any]:
+        """'dependencies' is anything outside the endpoint the operation depends on (e.g. its body model)."""
+        key = (ep.method, ep.path)
+        digest = hashlib.sha1((ep.model_dump_json() + dependencies).encode()).hexdigest()
+
+        with self._lock:
+            self._seen.add(key)
+            entry = self._entries.get(key)
+            if entry and entry[0] == digest:
+                self.reused += 1
+                return entry[1]
+
+        operation = build(ep)
+        with self._lock:
+            self._entries[key] = (digest, operation)
+            self.rebuilt += 1
+        return operation
+
+    def prune(self) -> int:
+        """Forgets endpoints that were not part of the last cycle; returns how many were removed."""
+        with self._lock:
+            removed = [key for key in self._entries if key not in self._seen]
+            for key in removed:
+                del self._entries[key]
+        return len(removed)
 
 class TeraOpenApiAdapter:
     """
     Adapter responsible for translating the Domain (TeraSchema)
     for an dict compatible with the OpenAPI 3.0 Spec.
     """
-    def __init__(self, schema: TeraSchema):
+    _shared_lock = threading.Lock()
+
+    # Inferrer used by the shared adapters (see 'for_schema'); set it to reuse
+    # inferences across schemas, e.g. one loaded from disk with SchemaInferrer.load().
+    shared_inferrer: Optional[SchemaInferrer] = None
+
+    def __init__(
+        self,
+        schema: TeraSchema,
+        inferrer: Optional[SchemaInferrer] = None,
+        operation_cache: Optional[OperationCache] = None
+    ):
         self.schema = schema
+        self.inferrer = inferrer or SchemaInferrer()
+        self.operation_cache = operation_cache
+        self._result: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_schema(
+        cls,
+        schema: TeraSchema,
+        inferrer: Optional[SchemaInferrer] = None,
+        operation_cache: Optional[OperationCache] = None
+    ) -> "TeraOpenApiAdapter":
+        """
+        Returns the adapter shared by everyone writing the same schema instance,
+        so several writers (possibly in different threads) convert it only once.
+        'inferrer' and 'operation_cache' are only used when the shared adapter is created.
+        """
+        with cls._shared_lock:
+            adapter = schema._memo.get("openapi_adapter")
+            if adapter is None or adapter.schema is not schema:
+                adapter = cls(schema, inferrer or cls.shared_inferrer, operation_cache)
+                schema._memo["openapi_adapter"] = adapter
+        return adapter
 
     def convert(self) -> Dict[str, Any]:
-        """Generates complete OpenAPI JSON."""
+        """
+        Generates complete OpenAPI JSON.
+        The result is memoized: treat it as read-only, it may be shared by several writers.
+        """
+        with self._lock:
+            if self._result is None:
+                self._result = self._build_document()
+        return self._result
+
+    def _build_document(self) -> Dict[str, Any]:
+        with timings.stage("convert", items=len(self.schema.endpoints)):
+            document = self.build_header()
+            document["paths"] = dict(self.iter_paths())
+        return document
+
+    def build_header(self) -> Dict[str, Any]:
+        """Everything in the document except 'paths' (which always comes last)."""
         return {
             "openapi": "3.0.3",
             "info": {
@@ -22,12 +123,18 @@ class TeraOpenApiAdapter:
             "servers": [
                 {"url": self.schema.api.base_url or "/"}
             ],
-            "components": {
-                "securitySchemes": self._build_security_schemes()
-            },
-            "paths": self._build_paths()
+            "components": self._build_components()
         }
 
+    def _build_components(self) -> Dict[str, Any]:
+        components = {"securitySchemes": self._build_security_schemes()}
+        if self.schema.models:
+            components["schemas"] = {
+                name: self._build_object_schema(model.fields, model.description)
+                for name, model in self.schema.models.items()
+            }
+        return components
+
     def _build_security_schemes(self) -> Dict[str, Any]:
         if not self.schema.api.auth:
             return {}
@@ -47,40 +154,53 @@ class TeraOpenApiAdapter:
         return {}
 
     def _build_paths(self) -> Dict[str, Any]:
-        paths = {}
-        for ep in self.schema.endpoints:
-            path_item = paths.get(ep.path, {})
-            method_lower = ep.method.lower()
-            
-            operation = {
-                "summary": ep.summary,
-                "operationId": self._generate_operation_id(ep),
-                "tags": [ep.tag] if ep.tag else [],
-                "description": ep.description,
-                "parameters": self._build_parameters(ep),
-                "responses": self._build_responses(ep)
-            }
+        return dict(self.iter_paths())
 
-            # Security on endpoint
-            if ep.auth_required:
-                operation["security"] = [{"bearerAuth": []}]
+    def iter_paths(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yields (path, path item) pairs one at a time, in document order.
+        Only endpoint references are grouped upfront, so streaming writers
+        hold a single path item in memory at once.
+        """
+        index = self.schema.index()
+        for path, positions in index.paths.items():
+            path_item = {}
+            for position in positions:
+                if position in index.duplicates:
+                    # A repeated route keeps its first definition (reported by the 'duplicate_route' rule).
+                    continue
+                ep = self.schema.endpoints[position]
+                if self.operation_cache is not None:
+                    operation = self.operation_cache.get_or_build(
+                        ep, self._build_operation, self._body_model_json(ep)
+                    )
+                else:
+                    operation = self._build_operation(ep)
+                path_item[ep.method.lower()] = operation
+            yield path, path_item
 
-            # Request Body
-            if ep.body:
-                operation["requestBody"] = self._build_request_body(ep.body)
+    def _build_operation(self, ep: Endpoint) -> Dict[str, Any]:
+        operation = {
+            "summary": ep.summary,
+            "operationId": generate_operation_id(ep),
+            "tags": [ep.tag] if ep.tag else [],
+            "description": ep.description,
+            "parameters": self._build_parameters(ep),
+            "responses": self._build_responses(ep)
+        }
 
-            path_item[method_lower] = operation
-            paths[ep.path] = path_item
-        
-        return paths
+        # Security on endpoint
+        if ep.auth_required:
+            operation["security"] = [{"bearerAuth": []}]
 
-    def _generate_operation_id(self, ep: Endpoint) -> str:
-        """Generates IDs as 'getUsersId' based on verbs and path."""
-        clean_path = re.sub(r'\{.*?\}', '', ep.path)
-        clean_path = re.sub(r'[^a-zA-Z0-9]', ' ', clean_path)
-        words = clean_path.split()
-        camel_case = ''.join(word.capitalize() for word in words)
-        return f"{ep.method.lower()}{camel_case}"
+        # Request Body
+        if ep.body or ep.body_model:
+            operation["requestBody"] = self._build_request_body(ep)
+
+        return operation
+
+    def _body_model_json(self, ep: Endpoint) -> str:
+        return self.schema.models[ep.body_model].model_dump_json() if ep.body_model else ""
 
     def _build_parameters(self, ep: Endpoint) -> List[Dict[str, Any]]:
         openapi_params = []
@@ -108,30 +228,47 @@ class TeraOpenApiAdapter:
         
         return openapi_params
 
-    def _build_request_body(self, body_fields: List[BodyField]) -> Dict[str, Any]:
+    def _build_request_body(self, ep: Endpoint) -> Dict[str, Any]:
+        """
+        Inline object schema for plain body fields; a $ref to components/schemas
+        when the endpoint uses a body model (combined with allOf if it adds fields).
+        """
+        if ep.body_model:
+            schema = {"$ref": f"#/components/schemas/{ep.body_model}"}
+            if ep.body:
+                schema = {"allOf": [schema, self._build_object_schema(ep.body)]}
+        else:
+            schema = self._build_object_schema(ep.body)
+
+        return {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": schema,
+                    "example": {field.name: field.example for field in self.schema.body_fields(ep)}
+                }
+            }
+        }
+
+    def _build_object_schema(
+        self, body_fields: List[BodyField], description: Optional[str] = None
+    ) -> Dict[str, Any]:
         properties = {}
         required_fields = []
-        example_dict = {}
 
         for field in body_fields:
             properties[field.name] = self._infer_schema_recursive(field.example)
             if field.required:
                 required_fields.append(field.name)
-            example_dict[field.name] = field.example
 
-        return {
-            "required": True,
-            "content": {
-                "application/json": {
-                    "schema": {
-                        "type": "object",
-                        "properties": properties,
-                        "required": required_fields if required_fields else None
-                    },
-                    "example": example_dict
-                }
-            }
+        schema = {
+            "type": "object",
+            "properties": properties,
+            "required": required_fields if required_fields else None
         }
+        if description:
+            schema["description"] = description
+        return schema
 
     def _build_responses(self, ep: Endpoint) -> Dict[str, Any]:
         responses = {}
@@ -165,29 +302,6 @@ class TeraOpenApiAdapter:
         """
         The brain of inference: Receives a Python value (str, int, dict, list)
         and returns the corresponding OpenAPI Schema.
+        Memoized by SchemaInferrer on the example's shape; the result is a private copy.
         """
-        if isinstance(value, str):
-            if len(value) == 36 and re.match(r'^[0-9a-fA-F-]{36}$', value):
-                return {"type": "string", "format": "uuid"}
-            return {"type": "string"}
-        
-        if isinstance(value, bool):
-            return {"type": "boolean"}
-        
-        if isinstance(value, int):
-            return {"type": "integer"}
-        
-        if isinstance(value, float):
-            return {"type": "number"}
-
-        if isinstance(value, dict):
-            properties = {k: self._infer_schema_recursive(v) for k, v in value.items()}
-            return {"type": "object", "properties": properties}
-
-        if isinstance(value, list):
-            if not value:
-                return {"type": "array", "items": {}}
-            item_schema = self._infer_schema_recursive(value[0])
-            return {"type": "array", "items": item_schema}
-
-        return {"type": "string"}
\ No newline at end of file
+        return self.inferrer.infer(value)
@@ -0,0 +1,113 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import yaml
+
+Position = Tuple[int, int]
+
+class SourceIndex:
+    """
+    Maps node paths of a parsed document (e.g. ('endpoints', 0, 'params', 'query', 1))
+    to their (line, column) in the source, both 1-based.
+    Lookups fall back to the closest indexed ancestor, so any path resolves with a few dict hits.
+    """
+    def __init__(self, positions: Optional[Dict[Tuple[Any, ...], Position]] = None):
+        self._positions: Dict[Tuple[Any, ...], Position] = positions or {}
+        # Flat form (see to_flat) not decoded yet: most lint runs never look a position up.
+        self._flat: Optional[List[Any]] = None
+
+    @property
+    def positions(self) -> Dict[Tuple[Any, ...], Position]:
+        if self._flat is not None:
+            try:
+                self._positions = _unflatten(self._flat)
+            except (TypeError, ValueError, IndexError):
+                # A corrupted cache entry only costs the line numbers.
+                self._positions = {}
+            self._flat = None
+        return self._positions
+
+    def __bool__(self) -> bool:
+        return bool(self._flat) or bool(self._positions)
+
+    def to_flat(self) -> List[Any]:
+        """
+        The positions as one flat JSON-friendly list, four items per path:
+        [parent, key, line, column], 'parent' being the number of the entry for path[:-1]
+        (-1 for the root, or when it is not indexed: 'key' is then the whole path).
+        Much cheaper to store and decode than one list per path.
+        """
+        numbers: Dict[Tuple[Any, ...], int] = {}
+        flat: List[Any] = []
+        for number, path in enumerate(sorted(self.positions, key=len)):
+            numbers[path] = number
+            parent = numbers.get(path[:-1], -1) if path else -1
+            flat.extend((parent, path[-1] if parent >= 0 else list(path), *self.positions[path]))
+        return flat
+
+    @classmethod
+    def from_flat(cls, flat: List[Any]) -> "SourceIndex":
+        index = cls()
+        index._flat = flat
+        return index
+
+    def lookup(self, path: Sequence[Any]) -> Optional[Position]:
+        path = tuple(path)
+        for size in range(len(path), -1, -1):
+            position = self.positions.get(path[:size])
+            if position is not None:
+                return position
+        return None
+
+    def line_of(self, path: Sequence[Any]) -> Optional[int]:
+        position = self.lookup(path)
+        return position[0] if position else None
+
+    @classmethod
+    def from_node(cls, root: Optional[yaml.Node]) -> "SourceIndex":
+        """
+        Builds the index from a composed YAML node tree.
+        Mapping entries point at their key (where editors expect the marker),
+        sequence items at the item itself.
+        """
+        positions: Dict[Tuple[Any, ...], Position] = {}
+        if root is None:
+            return cls(positions)
+
+        positions[()] = _position(root)
+        stack = [(root, ())]
+        visited = set()
+
+        while stack:
+            node, path = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+
+            if isinstance(node, yaml.MappingNode):
+                for key_node, value_node in node.value:
+                    key = key_node.value if isinstance(key_node, yaml.ScalarNode) else None
+                    if key is None:
+                        continue
+                    child_path = path + (key,)
+                    positions.setdefault(child_path, _position(key_node))
+                    stack.append((value_node, child_path))
+
+            elif isinstance(node, yaml.SequenceNode):
+                for index, item_node in enumerate(node.value):
+                    child_path = path + (index,)
+                    positions.setdefault(child_path, _position(item_node))
+                    stack.append((item_node, child_path))
+
+        return cls(positions)
+
+def _unflatten(flat: List[Any]) -> Dict[Tuple[Any, ...], Position]:
+    paths: List[Tuple[Any, ...]] = []
+    positions: Dict[Tuple[Any, ...], Position] = {}
+    for parent, key, line, column in zip(flat[0::4], flat[1::4], flat[2::4], flat[3::4]):
+        path = paths[parent] + (key,) if parent >= 0 else tuple(key)
+        paths.append(path)
+        positions[path] = (line, column)
+    return positions
+
+def _position(node: yaml.Node) -> Position:
+    mark = node.start_mark
+    return mark.line + 1, mark.column + 1
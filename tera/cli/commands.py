@@ -1,10 +1,16 @@
 import typer
 import json
-from typing import Optional
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 from pydantic import ValidationError
-from tera.core import factory, loader
-from tera.services import run_pipeline, InitService, LinterService
+from tera.core import factory, includes, loader, timings as stage_timings
+from tera.core.cache import BuildCache, get_cache_dir, hash_file
+from tera.core.discovery import discover_files
+from tera.core.path_filter import PathFilter
+from tera.adapters import SchemaInferrer, TeraOpenApiAdapter, CompiledSchemaCache
+from tera.services import run_pipeline, InitService, LinterService, IncrementalBuilder, FileWatcher, DiffService
 from tera.exceptions import TeraError
 from tera.domain import LintSeverity
 
@@ -19,6 +25,11 @@ def _print_success(input_ref: str, output_path: str):
     typer.echo(f"   Input:  {input_ref}")
     typer.echo(f"   Output: {output_path}\n")
 
+def _print_up_to_date(input_ref: str, output_path: str):
+    typer.secho("\n✅ Up to date (cached), nothing to rebuild.", fg=typer.colors.GREEN, bold=True)
+    typer.echo(f"   Input:  {input_ref}")
+    typer.echo(f"   Output: {output_path}\n")
+
 def _print_validation_error(e: ValidationError):
     typer.secho(f"\n❌ Schema Validation Error:", fg=typer.colors.RED, bold=True)
     for err in e.errors():
@@ -52,22 +63,186 @@ def _print_human_lint_report(issues):
         typer.secho(meta, fg=typer.colors.BRIGHT_BLACK)
         typer.echo("")
 
-def _print_json_lint_report(issues):
-    """Renders output as JSON for cli"""
-    output = [issue.dict() for issue in issues]
-    typer.echo(json.dumps(output, indent=2))
+def _print_file_header(file_report):
+    """Per-file line used when several files are linted together."""
+    color = typer.colors.RED if file_report.errors else typer.colors.GREEN
+    typer.secho(
+        f"\n📄 {file_report.path}: {file_report.errors} error(s), {file_report.warnings} warning(s)",
+        fg=color, bold=True
+    )
+
+def _print_lint_summary(report):
+    if len(report.files) > 1:
+        summary = report.summary()["summary"]
+        typer.echo(
+            f"   {summary['files']} files, {summary['errors']} error(s), {summary['warnings']} warning(s)."
+        )
+
+def _print_diff_report(report):
+    """Changes grouped per endpoint; breaking ones in red."""
+    for endpoint, changes in report.by_endpoint().items():
+        typer.secho(f"\n   {endpoint}", bold=True)
+        for change in changes:
+            color = typer.colors.RED if change.breaking else (
+                typer.colors.GREEN if change.kind.value == "added" else typer.colors.YELLOW
+            )
+            typer.secho(f"     {change}", fg=color)
+
+    summary = report.summary()["summary"]
+    typer.echo(
+        f"\n   {summary['added']} added, {summary['removed']} removed, {summary['changed']} changed, "
+        f"{summary['unchanged']} unchanged endpoint(s); {summary['breaking']} breaking change(s)."
+    )
+
+def _print_rule_timings(timings):
+    typer.secho("\nRule timings:", fg=typer.colors.BLUE, bold=True)
+    for name, elapsed in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        typer.echo(f"   {elapsed * 1000:9.3f} ms  {name}")
+
+TIMINGS_FORMATS = ("table", "json")
+
+@contextmanager
+def _report_timings(enabled: bool, output_format: str) -> Iterator[None]:
+    """Collects the stages run by a command and reports them when it ends, even on failure."""
+    if not enabled:
+        yield
+        return
+
+    if output_format not in TIMINGS_FORMATS:
+        _print_error("Invalid Input", f"Unknown timings format: {output_format} (use table or json)")
+        raise typer.Exit(code=1)
+
+    with stage_timings.collect() as collected:
+        try:
+            yield
+        finally:
+            _print_timings(collected.summary(), output_format)
+
+def _print_timings(stages: List[Dict[str, Any]], output_format: str):
+    """Stage timings go to stderr, so they never mix with a command's own output (e.g. 'lint --json')."""
+    if output_format == "json":
+        typer.echo(json.dumps({"stages": stages}, indent=2), err=True)
+        return
+
+    typer.secho("\nStage timings:", fg=typer.colors.BLUE, bold=True, err=True)
+    typer.secho(f"   {'stage':<20}{'calls':>6}{'wall ms':>12}{'cpu ms':>12}{'items':>8}", fg=typer.colors.BRIGHT_BLACK, err=True)
+    for stage in stages:
+        items = "" if stage["items"] is None else stage["items"]
+        typer.echo(
+            f"   {stage['name']:<20}{stage['calls']:>6}{stage['wall'] * 1000:>12.1f}{stage['cpu'] * 1000:>12.1f}{items:>8}",
+            err=True
+        )
+
+def _print_scan_cache_stats(scan_cache):
+    typer.secho(
+        f"   Routes: {scan_cache.reused} reused, {scan_cache.rescanned} rescanned.",
+        fg=typer.colors.BRIGHT_BLACK
+    )
+
+def _print_json_lint_report(report):
+    """Renders output as JSON for cli: per-file issues plus an aggregated summary."""
+    typer.echo(json.dumps(report.summary(), indent=2, ensure_ascii=False))
+
+def _cache_settings(config) -> dict:
+    """Settings from .teraconfig.toml that can change the generated output, including the user templates."""
+    settings = config.model_dump(mode="json", include={"title", "version", "format", "template_dirs"})
+    settings["templates"] = {str(path): hash_file(path) for path in _template_files(config)}
+    return settings
 
-def _execute_pipeline(input_source: str, output_path: Path, format_style: str = 'tera'):
+def _source_files(input_source: str) -> List[Path]:
+    """
+    Files a build of 'input_source' depends on: the YAML file, or a manifest and its fragments.
+    Empty for app import strings and unreadable manifests (the driver reports those).
+    """
+    path = Path(input_source)
+    if not (path.is_file() or path.is_dir()):
+        return []
+    try:
+        return includes.source_files(path)
+    except Exception:
+        return []
+
+def _template_files(config) -> List[Path]:
+    """Every file of the user template directories."""
+    files = []
+    for directory in config.template_dirs:
+        if directory.is_dir():
+            files.extend(sorted(path for path in directory.rglob("*") if path.is_file()))
+    return files
+
+INFERENCE_CACHE_NAME = "inference.json"
+
+def _load_shared_inferrer(config):
+    """When enabled in .teraconfig.toml, reuses the schema inferences persisted by previous runs."""
+    if not (config and config.cache_inference):
+        return None
+
+    inferrer = SchemaInferrer.load(get_cache_dir() / INFERENCE_CACHE_NAME)
+    TeraOpenApiAdapter.shared_inferrer = inferrer
+    return inferrer
+
+def _execute_pipeline(
+    input_source: str,
+    output_path: Union[Path, List[Tuple[Path, str]]],
+    format_style: str = 'tera',
+    use_cache: bool = False,
+    config=None,
+    streaming: bool = False,
+    driver=None,
+    compression: Optional[List[str]] = None
+):
     """
     Helper function to execute the pipeline safely.
     Connects: Factory -> Pipeline -> UI
+    'output_path' may be a list of (path, format_style) pairs to write several outputs in one pass.
+    When 'use_cache' is set, outputs the build cache reports as fresh are skipped.
+    'streaming' is forwarded to writers able to stream their output.
+    'driver' replaces the one the factory would pick for 'input_source'.
+    'compression' selects the precompressed copies of writers producing static assets.
     """
-    try:
-        driver = factory.get_driver(input_source)
-        writer = factory.get_writer(output_path, format_style=format_style)
+    outputs = output_path if isinstance(output_path, list) else [(output_path, format_style)]
 
-        run_pipeline(driver, writer)
-        _print_success(input_source, str(output_path))
+    try:
+        cache = None
+        cache_keys = {}
+        sources = _source_files(input_source) if use_cache else []
+        if sources:
+            cache = BuildCache()
+            settings = _cache_settings(config) if config else {}
+            if compression is not None:
+                settings["compression"] = compression
+            for path, style in outputs:
+                writer_kind = factory.resolve_writer_kind(path, style)
+                cache_keys[path] = cache.compute_key(sources[0], settings, writer_kind, extra_inputs=sources[1:])
+
+            stale = [(path, style) for path, style in outputs if not cache.is_fresh(path, cache_keys[path])]
+            if not stale:
+                _print_up_to_date(input_source, ", ".join(str(path) for path, _ in outputs))
+                return
+            outputs = stale
+
+        if driver is None:
+            driver = factory.get_driver(input_source, compiled_cache=CompiledSchemaCache() if use_cache else None)
+        writers = [
+            factory.get_writer(
+                path, format_style=style, streaming=streaming,
+                template_dirs=config.template_dirs if config else (),
+                compression=compression
+            )
+            for path, style in outputs
+        ]
+
+        inferrer = _load_shared_inferrer(config)
+        run_pipeline(driver, writers)
+        if inferrer:
+            inferrer.save(get_cache_dir() / INFERENCE_CACHE_NAME)
+
+        if cache:
+            for (path, _), writer in zip(outputs, writers):
+                cache.record(path, cache_keys[path], side_files=getattr(writer, "side_files", ()))
+            cache.save()
+
+        _print_success(input_source, ", ".join(str(path) for path, _ in outputs))
 
     except ValidationError as e:
         _print_validation_error(e)
@@ -133,23 +308,156 @@ def init(
 def build(
     input_file: Path = typer.Argument(
         "docs.yaml",
-        help="Path to the Tera YAML file. Default: docs.yaml"
+        help="Path to the Tera YAML file, or to a multi-file source (a directory or a manifest with 'include'). Default: docs.yaml"
     ),
     output_file: Optional[Path] = typer.Option(
         None, 
         "--output", "-o",
-        help="Path to the output JSON/YAML (OpenAPI format)."
-    )
+        help="Path to the output JSON/YAML (OpenAPI format). With several formats, the base path or a directory."
+    ),
+    formats: Optional[str] = typer.Option(
+        None,
+        "--format", "-f",
+        help="Comma-separated output formats (openapi-json, openapi-yaml, html, postman, markdown)."
+    ),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore the build cache and force a rebuild."),
+    stream: bool = typer.Option(False, "--stream", help="Stream OpenAPI JSON/YAML path by path (bounded memory)."),
+    watch: bool = typer.Option(False, "--watch", "-w", help="Keep running and rebuild incrementally on changes."),
+    timings: bool = typer.Option(False, "--timings", help="Report wall time, CPU time and items of each stage."),
+    timings_format: str = typer.Option("table", "--timings-format", help="Format of --timings: table or json.")
 ):
     """
     Reads a Tera YAML file and generates standard OpenAPI documentation.
+    A directory (or a YAML manifest with 'include' patterns) is read as one source split across files.
     """
     typer.secho(f"Building OpenAPI from {input_file}...", fg=typer.colors.BLUE)
     
     config = loader.load_config()
     final_output = output_file or config.output or input_file.with_suffix('.json')
 
-    _execute_pipeline(str(input_file), final_output, format_style='openapi')
+    outputs: Union[Path, List[Tuple[Path, str]]] = final_output
+    if formats:
+        kinds = [kind.strip() for kind in formats.split(",") if kind.strip()]
+        unknown = [kind for kind in kinds if kind not in factory.FORMAT_EXTENSIONS]
+        if unknown:
+            _print_error("Invalid Input", f"Unknown format(s): {', '.join(unknown)}")
+            raise typer.Exit(code=1)
+
+        base = final_output / input_file.name if final_output.is_dir() else final_output
+        outputs = [(_output_for_format(base, kind), kind) for kind in kinds]
+
+    if watch:
+        _watch(str(input_file), outputs if isinstance(outputs, list) else [(outputs, 'openapi')], config)
+        return
+
+    with _report_timings(timings, timings_format):
+        _execute_pipeline(
+            str(input_file), outputs, format_style='openapi',
+            use_cache=not no_cache, config=config, streaming=stream
+        )
+
+def _watch(input_source: str, outputs: List[Tuple[Path, str]], config):
+    """
+    Watch mode: rebuilds on every change of the input (or of any fragment of a multi-file source,
+    including new ones), of .teraconfig.toml or of a user template, keeping the conversion warm
+    so only changed endpoints are regenerated. The watched files are listed again after each
+    rebuild; a change of .teraconfig.toml reloads the configuration.
+    """
+    config_path = Path(loader.CONFIG_FILENAME).resolve()
+    builder = IncrementalBuilder(input_source, outputs, template_dirs=config.template_dirs)
+    watcher = FileWatcher(_watched_paths(input_source, config))
+    typer.secho(
+        f"👀 Watching {input_source} ({watcher.backend}). Press Ctrl+C to stop.",
+        fg=typer.colors.MAGENTA
+    )
+
+    try:
+        while True:
+            _run_watch_cycle(builder)
+            watcher.watch(_watched_paths(input_source, config))
+            changed = _wait_for_changes(watcher, input_source, config)
+            typer.secho(f"\n✏️  Changed: {', '.join(p.name for p in changed)}", fg=typer.colors.BRIGHT_BLACK)
+
+            if config_path in changed:
+                try:
+                    config = loader.load_config()
+                except ValidationError as e:
+                    _print_validation_error(e)
+                    continue
+                builder = IncrementalBuilder(input_source, outputs, template_dirs=config.template_dirs)
+                typer.secho(f"⚙️  Reloaded {loader.CONFIG_FILENAME}", fg=typer.colors.BRIGHT_BLACK)
+    except KeyboardInterrupt:
+        typer.echo("\nStopped watching.")
+    finally:
+        watcher.close()
+
+def _wait_for_changes(watcher: FileWatcher, input_source: str, config) -> List[Path]:
+    """
+    Waits until a watched file changes or a new one appears (e.g. a fragment matching the include
+    patterns). Directory changes alone, like the temporary files of an editor, do not trigger a rebuild.
+    """
+    while True:
+        changed = [path for path in watcher.wait() if not path.is_dir()]
+        previous = set(watcher.paths)
+        watcher.watch(_watched_paths(input_source, config))
+        added = [path for path in watcher.paths if path not in previous and not path.is_dir()]
+        if changed or added:
+            return changed + added
+
+def _watched_paths(input_source: str, config) -> List[Path]:
+    """
+    What watch mode reacts to: the input files, .teraconfig.toml, the user templates and,
+    for multi-file sources and template directories, the directories new files may appear in.
+    """
+    sources = _source_files(input_source) or [Path(input_source)]
+    directories: List[Path] = []
+    if includes.is_manifest(input_source):
+        directories.extend(_directories(sources[0].parent))
+        directories.extend(fragment.parent for fragment in sources[1:])
+    for template_dir in config.template_dirs:
+        directories.extend(_directories(template_dir))
+    return [*sources, Path(loader.CONFIG_FILENAME), *_template_files(config), *directories]
+
+def _directories(root: Path) -> List[Path]:
+    """'root' and its subdirectories, hidden ones excluded."""
+    if not root.is_dir():
+        return []
+    found = []
+    for current, dirnames, _ in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        found.append(Path(current))
+    return found
+
+def _run_watch_cycle(builder: IncrementalBuilder):
+    """One rebuild; errors are reported and the watcher keeps going."""
+    try:
+        cycle = builder.build()
+    except ValidationError as e:
+        _print_validation_error(e)
+        return
+    except TeraError as e:
+        _print_error(e.title, e.message)
+        return
+    except Exception as e:
+        _print_error("Build Failed", str(e))
+        return
+
+    typer.secho(
+        f"🔁 Rebuilt {', '.join(str(path) for path, _ in builder.outputs)} in {cycle.elapsed * 1000:.1f} ms "
+        f"({cycle.rebuilt} changed, {cycle.reused} reused, {cycle.removed} removed of {cycle.endpoints} endpoints)",
+        fg=typer.colors.GREEN
+    )
+
+def _output_for_format(base: Path, kind: str) -> Path:
+    """
+    Derives the output path of one format from the base output path (e.g. docs.json -> docs.html).
+    Only the extension is replaced, so dotted names are kept (api.v2.json -> api.v2.html):
+    a known format extension ('.openapi.json') if the base has one, its last suffix otherwise.
+    """
+    name = base.name
+    known = [ext for ext in factory.FORMAT_EXTENSIONS.values() if name.endswith(ext) and name != ext]
+    stem = name[:-len(max(known, key=len))] if known else name[:len(name) - len(base.suffix)]
+    return base.with_name(stem + factory.FORMAT_EXTENSIONS[kind])
 
 
 @app.command()
@@ -162,26 +470,55 @@ def scan(
         None, 
         "--output", "-o",
         help="Path to the output Tera YAML file."
-    )
+    ),
+    static: bool = typer.Option(
+        False, "--static",
+        help="Parse the project sources instead of importing the app (no code is executed)."
+    ),
+    jobs: int = typer.Option(0, "--jobs", "-j", help="Worker processes for --static (0 = one per CPU)."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-inspect every route, ignoring the scan cache."),
+    timings: bool = typer.Option(False, "--timings", help="Report wall time, CPU time and items of each stage."),
+    timings_format: str = typer.Option("table", "--timings-format", help="Format of --timings: table or json.")
 ):
     """
     Scans code and generates a canonical Tera YAML file (docs.yaml).
+    Routes whose sources did not change since the previous scan are reused.
     """
     config = loader.load_config()
     final_target = app_id or config.target
     
-    if not final_target:
+    if not final_target and not static:
         _print_error(
             "Missing Target", 
             "Please provide an app string (e.g., 'tera scan main:app') OR set 'target' in .teraconfig.toml"
         )
         raise typer.Exit(code=1)
 
-    typer.secho(f"Scanning Flask App: {final_target}...", fg=typer.colors.MAGENTA)
+    # Imported here: other commands never load the drivers package.
+    from tera.drivers.inspection.scan_cache import ScanCache
 
     final_output = output_file or config.output or Path("docs.yaml")
+    kind = "flask-static" if static else "flask"
+    scan_cache = None if no_cache else ScanCache(f"{kind}:{Path('.').resolve()}:{final_target or ''}")
+
+    if static:
+        typer.secho(f"Statically scanning Flask App: {final_target or 'auto-detect'}...", fg=typer.colors.MAGENTA)
+        driver = factory.load_driver_class(kind)(
+            final_target, root=Path("."), path_filter=PathFilter(config.ignore), jobs=jobs, scan_cache=scan_cache
+        )
+    else:
+        typer.secho(f"Scanning Flask App: {final_target}...", fg=typer.colors.MAGENTA)
+        driver = factory.load_driver_class(kind)(final_target, scan_cache=scan_cache)
 
-    _execute_pipeline(final_target, final_output, format_style='tera')
+    with _report_timings(timings, timings_format):
+        _execute_pipeline(final_target or ".", final_output, format_style='tera', driver=driver)
+
+    for warning in getattr(driver, "warnings", []):
+        typer.secho(f"   ⚠️  {warning}", fg=typer.colors.YELLOW)
+
+    if scan_cache:
+        scan_cache.save()
+        _print_scan_cache_stats(scan_cache)
 
 @app.command()
 def export(
@@ -192,64 +529,153 @@ def export(
     format: str = typer.Option(
         "markdown",
         "--format", "-f",
-        help="Target format (markdown, html, postman)."
+        help="Target format (markdown, markdown-split, html, html-chunked, postman, postman-sharded)."
     ),
     output_file: Optional[Path] = typer.Option(
         None,
         "--output", "-o",
         help="Path to the output file."
+    ),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore the build cache and force a rebuild."),
+    watch: bool = typer.Option(False, "--watch", "-w", help="Keep running and rebuild incrementally on changes."),
+    timings: bool = typer.Option(False, "--timings", help="Report wall time, CPU time and items of each stage."),
+    timings_format: str = typer.Option("table", "--timings-format", help="Format of --timings: table or json."),
+    compress: Optional[str] = typer.Option(
+        None, "--compress",
+        help="Precompressed copies written next to html-chunked assets (comma-separated: gz, br). Default: gz."
     )
 ):
     """
     Export documentation to external formats (Markdown, HTML, Postman).
+    'markdown-split' writes an index plus one Markdown file per tag.
+    'postman-sharded' writes one Postman collection per tag, listed by a manifest.
+    'html-chunked' splits the operations into per-tag JSON files loaded on demand (for very large APIs).
     """
     typer.secho(f"Exporting to {format.upper()}...", fg=typer.colors.CYAN)
 
     if not output_file:
         extension_map = {
             'markdown': '.md',
+            'markdown-split': '.md',
             'html': '.html',
-            'postman': '.json'
+            'html-chunked': '.html',
+            'postman': '.json',
+            'postman-sharded': '.json'
         }
 
         ext = extension_map.get(format, '.txt')
         output_file = input_file.with_suffix(ext)
 
-    _execute_pipeline(str(input_file), output_file, format_style=format)
+    config = loader.load_config()
+    if watch:
+        _watch(str(input_file), [(output_file, format)], config)
+        return
+
+    with _report_timings(timings, timings_format):
+        _execute_pipeline(
+            str(input_file), output_file, format_style=format,
+            use_cache=not no_cache, config=config,
+            compression=None if compress is None else [name.strip() for name in compress.split(",") if name.strip()]
+        )
+
+LINTABLE_SUFFIXES = (".yaml", ".yml")
 
 @app.command()
 def lint(
-    file_path: Path = typer.Argument(..., help="Path to the YAML/JSON file definition."),
-    to_json: bool = typer.Option(False, "--json", "-j", help="Output results as JSON (for CI/CD).")
+    paths: List[Path] = typer.Argument(..., help="YAML files (JSON ones when named explicitly), directories or glob patterns to lint."),
+    to_json: bool = typer.Option(False, "--json", help="Output results as JSON (for CI/CD)."),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Number of worker processes (0 = one per CPU)."),
+    rule_timings: bool = typer.Option(False, "--rule-timings", help="Report the time spent in each lint rule."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Parse and validate every file, ignoring compiled schemas."),
+    timings: bool = typer.Option(False, "--timings", help="Report wall time, CPU time and items of each stage."),
+    timings_format: str = typer.Option("table", "--timings-format", help="Format of --timings: table or json.")
 ):
     """
-    Analyzes the documentation file for syntax errors, schema violations, and quality issues.
+    Analyzes the documentation files for syntax errors, schema violations, and quality issues.
+    Directories are searched recursively for YAML files, honoring .teraignore.
     """
     config = loader.load_config()
-    service = LinterService(config=config)
-    
+    service = LinterService(
+        config=config, profile_rules=rule_timings,
+        compiled_cache=None if no_cache else CompiledSchemaCache()
+    )
+    files = discover_files(paths, LINTABLE_SUFFIXES, PathFilter(config.ignore))
+
+    if not files:
+        _print_error("Nothing to lint", f"No Tera files found in: {', '.join(str(p) for p in paths)}")
+        raise typer.Exit(code=1)
+
     if not to_json:
-        typer.secho(f"Linting '{file_path}'...", fg=typer.colors.BLUE)
+        target = f"'{files[0]}'" if len(files) == 1 else f"{len(files)} files"
+        typer.secho(f"Linting {target}...", fg=typer.colors.BLUE)
         if config.lint.ignore:
             typer.secho(f"Ignoring rules: {', '.join(config.lint.ignore)}", fg=typer.colors.BRIGHT_BLACK)
-    
-    # 3. Executa... (o resto continua igual)
-    issues = service.lint(file_path)
+
+    with _report_timings(timings, timings_format):
+        report = service.lint_files(files, jobs=jobs)
+
+        if to_json:
+            _print_json_lint_report(report)
+        else:
+            for file_report in report.files:
+                if len(report.files) > 1:
+                    _print_file_header(file_report)
+                _print_human_lint_report(file_report.issues)
+            if rule_timings:
+                _print_rule_timings(report.rule_timings)
+
+        if report.has_errors:
+            if not to_json:
+                typer.secho("\nValidation failed with errors.", fg=typer.colors.RED, bold=True)
+                _print_lint_summary(report)
+            raise typer.Exit(code=1)
+
+        if not to_json:
+            if report.issues:
+                typer.secho("\n⚠️  Passed with warnings.", fg=typer.colors.YELLOW, bold=True)
+            else:
+                typer.secho("\n✅ No issues found. Good job!", fg=typer.colors.GREEN, bold=True)
+            _print_lint_summary(report)
+
+@app.command()
+def diff(
+    old: str = typer.Argument(
+        ..., help="Old version: a Tera/OpenAPI file, a multi-file source or '<rev>:<path>' (read from git, e.g. main:docs.yaml)."
+    ),
+    new: str = typer.Argument(..., help="New version, in any of the same forms."),
+    to_json: bool = typer.Option(False, "--json", help="Output the changes as JSON (for CI/CD)."),
+    fail_on_breaking: bool = typer.Option(False, "--fail-on-breaking", help="Exit with code 1 on breaking changes."),
+    timings: bool = typer.Option(False, "--timings", help="Report wall time, CPU time and items of each stage."),
+    timings_format: str = typer.Option("table", "--timings-format", help="Format of --timings: table or json.")
+):
+    """
+    Compares two versions of an API: added, removed and changed endpoints, params,
+    body fields and responses, flagging the changes that break existing clients.
+    """
+    if not to_json:
+        typer.secho(f"Comparing {old} -> {new}...", fg=typer.colors.BLUE)
+
+    try:
+        with _report_timings(timings, timings_format):
+            report = DiffService().diff(old, new)
+    except ValidationError as e:
+        _print_validation_error(e)
+        raise typer.Exit(code=1)
+    except TeraError as e:
+        _print_error(e.title, e.message)
+        raise typer.Exit(code=1)
+    except (FileNotFoundError, ValueError) as e:
+        _print_error("Invalid Input", str(e))
+        raise typer.Exit(code=1)
 
     if to_json:
-        _print_json_lint_report(issues)
+        typer.echo(json.dumps(report.summary(), indent=2, ensure_ascii=False, default=str))
+    elif not report.changes:
+        typer.secho("\n✅ No changes.", fg=typer.colors.GREEN, bold=True)
     else:
-        _print_human_lint_report(issues)
+        _print_diff_report(report)
+        if report.breaking:
+            typer.secho("\n💥 Breaking changes found.", fg=typer.colors.RED, bold=True)
 
-    has_errors = any(i.severity == LintSeverity.ERROR for i in issues)
-    
-    if has_errors:
-        if not to_json:
-            typer.secho("\nValidation failed with errors.", fg=typer.colors.RED, bold=True)
+    if fail_on_breaking and report.breaking:
         raise typer.Exit(code=1)
-    
-    if not to_json:
-        if issues:
-            typer.secho("\n⚠️  Passed with warnings.", fg=typer.colors.YELLOW, bold=True)
-        else:
-            typer.secho("\n✅ No issues found. Good job!", fg=typer.colors.GREEN, bold=True)
\ No newline at end of file
@@ -5,6 +5,8 @@ class TeraWriter(Protocol):
     """
     Contract for the data output.
     Responsible for taking a validated TeraSchema and persisting it (disk, screen, cloud).
+    Writers producing files besides their output path list them, after 'write', in a
+    'side_files' attribute (the build cache checks them too).
     """
     def write(self, schema: TeraSchema) -> None:
         """
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+from importlib import metadata
+
+CACHE_DIR = Path(".tera") / "cache"
+
+def _detect_version() -> str:
+    try:
+        return metadata.version("tera-cli")
+    except metadata.PackageNotFoundError:
+        return "0.0.0+local"
+
+TERA_VERSION = _detect_version()
+
+def get_cache_dir(root_path: Path = Path(".")) -> Path:
+    """
+    Returns the directory where Tera keeps its caches (not created here).
+    """
+    return root_path / CACHE_DIR
+
+def get_user_cache_dir() -> Path:
+    """
+    Per-user cache directory, outside any project (not created here): $XDG_CACHE_HOME/tera,
+    or the platform default (~/.cache/tera, ~/Library/Caches/tera, %LOCALAPPDATA%\\tera).
+    Caches whose format can run code when loaded live here, never in a project tree
+    that a repository could ship.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        elif sys.platform == "darwin":
+            base = str(Path.home() / "Library" / "Caches")
+        else:
+            base = str(Path.home() / ".cache")
+    return Path(base) / "tera"
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of the file content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class BuildCache:
+    """
+    Content-addressed manifest of previous builds, stored in '.tera/cache'.
+    Each output path is associated with the key of the inputs that produced it;
+    when the key still matches (and the output was not touched), the build can be skipped.
+    Outputs spread over several files (tag files, shards, chunks) record those too:
+    deleting or editing any of them makes the output stale.
+    """
+    MANIFEST_NAME = "builds.json"
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir or get_cache_dir()
+        self.manifest_path = self.cache_dir / self.MANIFEST_NAME
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @staticmethod
+    def compute_key(
+        input_path: Path, settings: Dict[str, Any], writer_kind: str, extra_inputs: Sequence[Path] = ()
+    ) -> str:
+        """
+        Hashes everything that influences the output: the input bytes (plus the ones of
+        'extra_inputs', e.g. the fragments of a multi-file source), the relevant settings,
+        the writer kind and the Tera version.
+        """
+        digest = hashlib.sha256()
+        digest.update(hash_file(input_path).encode())
+        for path in extra_inputs:
+            digest.update(f"{path}\0{hash_file(path)}".encode())
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+        digest.update(writer_kind.encode())
+        digest.update(TERA_VERSION.encode())
+        return digest.hexdigest()
+
+    def is_fresh(self, output_path: Path, key: str) -> bool:
+        entry = self._load().get(self._entry_name(output_path))
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return False
+        if self._stat(output_path) != entry.get("stat"):
+            return False
+        files = entry.get("files", {})
+        return isinstance(files, dict) and all(self._stat(Path(path)) == stat for path, stat in files.items())
+
+    def record(self, output_path: Path, key: str, side_files: Sequence[Path] = ()) -> None:
+        """'side_files' are the other files the writer produced for this output."""
+        stats = [self._stat(path) for path in (output_path, *side_files)]
+        if None in stats:
+            self._load().pop(self._entry_name(output_path), None)
+            return
+        entry: Dict[str, Any] = {"key": key, "stat": stats[0]}
+        if side_files:
+            entry["files"] = {self._entry_name(path): stat for path, stat in zip(side_files, stats[1:])}
+        self._load()[self._entry_name(output_path)] = entry
+
+    def save(self) -> None:
+        """Persists the manifest atomically. Cache failures never break a build."""
+        if self._entries is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError:
+            pass
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    @staticmethod
+    def _entry_name(output_path: Path) -> str:
+        return str(Path(output_path).resolve())
+
+    @staticmethod
+    def _stat(output_path: Path) -> Optional[list]:
+        """Size + mtime of the output, used to detect outputs edited or deleted by hand."""
+        try:
+            st = os.stat(output_path)
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
@@ -22,4 +22,9 @@ class TeraConfig(BaseModel):
     format: Literal["json", "yaml"] = Field("yaml", description="Output format preference.")
     title: Optional[str] = None
     version: str = "1.0.0"
+    cache_inference: bool = Field(False, description="Persist example-based schema inference in .tera/cache between runs.")
+    template_dirs: List[Path] = Field(
+        default_factory=list,
+        description="Directories with Markdown/HTML templates overriding the built-in ones (searched in order)."
+    )
     lint: LintConfig = Field(default_factory=LintConfig)
\ No newline at end of file
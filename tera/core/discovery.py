@@ -0,0 +1,63 @@
+import glob
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Union
+from tera.core.path_filter import PathFilter
+
+GLOB_CHARS = set("*?[")
+
+def walk_files(root: Path, suffixes: Sequence[str], path_filter: PathFilter) -> Iterator[Path]:
+    """
+    Recursively yields files under 'root' with one of the given suffixes, in a stable order.
+    Ignored and hidden directories are pruned without being visited.
+    Paths are matched relative to the project root ('services/legacy/' also applies to
+    'tera lint services'); under a root outside the project, relative to 'root'.
+    """
+    base = path_filter.project_path(root)
+    if base is None:
+        base = Path()
+
+    for current, dirnames, filenames in os.walk(root):
+        current_path = Path(current)
+        rel_dir = base / current_path.relative_to(root)
+
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if not d.startswith(".") and not path_filter.should_ignore(f"{(rel_dir / d).as_posix()}/")
+        )
+
+        for filename in sorted(filenames):
+            if not filename.endswith(tuple(suffixes)):
+                continue
+            if path_filter.should_ignore((rel_dir / filename).as_posix()):
+                continue
+            yield current_path / filename
+
+def discover_files(
+    inputs: Iterable[Union[str, Path]],
+    suffixes: Sequence[str],
+    path_filter: PathFilter
+) -> List[Path]:
+    """
+    Expands a mix of files, directories and glob patterns into a de-duplicated file list.
+    Explicit files are always kept; directories and globs go through the suffix and ignore filters.
+    """
+    found: List[Path] = []
+
+    for item in inputs:
+        text = str(item)
+        path = Path(text)
+
+        if path.is_dir():
+            found.extend(walk_files(path, suffixes, path_filter))
+        elif GLOB_CHARS & set(text) and not path.exists():
+            for match in sorted(glob.glob(text, recursive=True)):
+                match_path = Path(match)
+                if match_path.is_dir():
+                    found.extend(walk_files(match_path, suffixes, path_filter))
+                elif not path_filter.should_ignore((path_filter.project_path(match_path) or match_path).as_posix()):
+                    found.append(match_path)
+        else:
+            found.append(path)
+
+    return list(dict.fromkeys(found))
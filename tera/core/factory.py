@@ -1,63 +1,133 @@
+import importlib
 from pathlib import Path
-from typing import Union, Literal
+from typing import Any, Dict, Optional, Sequence, Union, Literal
 from tera.contracts import TeraDriver, TeraWriter
-from tera.drivers import YamlFileDriver, FlaskAppDriver
-from tera.writers import (
-    JsonFileWriter, 
-    YamlFileWriter, 
-    OpenApiJsonWriter, 
-    OpenApiYamlWriter,
-    MarkdownWriter,
-    HtmlWriter,
-    PostmanWriter
-)
-
-def get_driver(source: Union[str, Path]) -> TeraDriver:
+from tera.core import includes
+
+# Implementations are registered by name as 'module:Class' strings and only
+# imported when selected, so commands like 'tera lint' never pay for Jinja2 & co.
+DRIVER_REGISTRY: Dict[str, str] = {
+    "yaml": "tera.drivers.yaml_driver:YamlFileDriver",
+    "yaml-multi": "tera.drivers.multi_file_driver:MultiFileDriver",
+    "flask": "tera.drivers.flask_driver:FlaskAppDriver",
+    "flask-static": "tera.drivers.flask_static_driver:FlaskStaticDriver",
+}
+
+WRITER_REGISTRY: Dict[str, str] = {
+    "tera-json": "tera.writers.json_writer:JsonFileWriter",
+    "tera-yaml": "tera.writers.yaml_writer:YamlFileWriter",
+    "openapi-json": "tera.writers.openapi_writer:OpenApiJsonWriter",
+    "openapi-yaml": "tera.writers.openapi_writer:OpenApiYamlWriter",
+    "markdown": "tera.writers.markdown_writer:MarkdownWriter",
+    "markdown-split": "tera.writers.markdown_writer:SplitMarkdownWriter",
+    "html": "tera.writers.html_writer:HtmlWriter",
+    "html-chunked": "tera.writers.html_writer:ChunkedHtmlWriter",
+    "postman": "tera.writers.postman_writer:PostmanWriter",
+    "postman-sharded": "tera.writers.postman_writer:ShardedPostmanWriter",
+}
+
+# Default file extension of each writer, used when one build writes several formats.
+FORMAT_EXTENSIONS: Dict[str, str] = {
+    "tera-json": ".tera.json",
+    "tera-yaml": ".tera.yaml",
+    "openapi-json": ".openapi.json",
+    "openapi-yaml": ".openapi.yaml",
+    "markdown": ".md",
+    "markdown-split": ".index.md",
+    "html": ".html",
+    "html-chunked": ".chunked.html",
+    "postman": ".postman.json",
+    "postman-sharded": ".postman-shards.json",
+}
+
+def _resolve(reference: str) -> Any:
+    """
+    Imports and returns the object pointed by a 'module:attribute' reference.
+    """
+    module_name, attr_name = reference.split(":", 1)
+    module = importlib.import_module(module_name)
+    return getattr(module, attr_name)
+
+def load_driver_class(name: str) -> Any:
+    """Returns the driver class registered under 'name', importing it on demand."""
+    if name not in DRIVER_REGISTRY:
+        raise ValueError(f"Unknown driver: {name}")
+    return _resolve(DRIVER_REGISTRY[name])
+
+def load_writer_class(name: str) -> Any:
+    """Returns the writer class registered under 'name', importing it on demand."""
+    if name not in WRITER_REGISTRY:
+        raise ValueError(f"Unknown writer: {name}")
+    return _resolve(WRITER_REGISTRY[name])
+
+def get_driver(source: Union[str, Path], compiled_cache: Any = None) -> TeraDriver:
     """
     Factory Method for input drivers.
     Decides which driver to instantiate based on the input string format.
+    Directories and YAML files with a top-level 'include' key are multi-file sources.
+    'compiled_cache' (a CompiledSchemaCache) is used by file based drivers.
     """
     source_str = str(source)
-    
+
+    if Path(source_str).is_dir() or (source_str.endswith(('.yaml', '.yml')) and includes.is_manifest(source_str)):
+        return load_driver_class("yaml-multi")(Path(source_str), compiled_cache=compiled_cache)
+
     if source_str.endswith(('.yaml', '.yml')):
-        return YamlFileDriver(Path(source_str))
+        return load_driver_class("yaml")(Path(source_str), compiled_cache=compiled_cache)
 
     if ":" in source_str:
-        return FlaskAppDriver(source_str)
-        
+        return load_driver_class("flask")(source_str)
+
     raise ValueError(
         f"Could not determine driver for input: '{source}'. "
-        "Supported formats: .yaml files or 'module:app' strings."
+        "Supported formats: .yaml files, directories with an api.yaml manifest or 'module:app' strings."
     )
 
-def get_writer(output_path: Path, format_style: Literal['tera', 'openapi'] = 'tera') -> TeraWriter:
+def resolve_writer_kind(output_path: Path, format_style: str) -> str:
+    """
+    Maps a (path, format style) pair to the name of a registered writer.
+    """
+    is_yaml = output_path.suffix in ['.yaml', '.yml']
+
+    if format_style == 'tera':
+        return "tera-yaml" if is_yaml else "tera-json"
+
+    if format_style == 'openapi':
+        return "openapi-yaml" if is_yaml else "openapi-json"
+
+    if format_style in WRITER_REGISTRY:
+        return format_style
+
+    raise ValueError(f"Unknown format style: {format_style}")
+
+def get_writer(
+    output_path: Path,
+    format_style: Literal['tera', 'openapi'] = 'tera',
+    streaming: bool = False,
+    template_dirs: Sequence[Path] = (),
+    compression: Optional[Sequence[str]] = None
+) -> TeraWriter:
     """
     Factory Method for output writers.
     Decides based on file extension AND the desired format style.
-    
+
     Args:
         output_path: Destination path.
-        format_style: 'tera' (Canonical YAML/JSON) or 'openapi' (Export format).
+        format_style: 'tera' (Canonical YAML/JSON), 'openapi' (Export format)
+            or the name of any registered writer (e.g. 'markdown', 'html').
+        streaming: Ask writers that support it to stream the output incrementally.
+        template_dirs: Directories searched before the built-in templates by template based writers.
+        compression: Precompressed copies ('gz', 'br') for writers producing static assets;
+            None keeps the writer's default.
     """
-    is_yaml = output_path.suffix in ['.yaml', '.yml']
-    
-    if format_style == 'tera':
-        if is_yaml:
-            return YamlFileWriter(output_path)
-        return JsonFileWriter(output_path)
-    
-    if format_style == 'openapi':
-        if is_yaml:
-            return OpenApiYamlWriter(output_path)
-        return OpenApiJsonWriter(output_path)
-    
-    if format_style == 'markdown':
-        return MarkdownWriter(output_path)
-    
-    if format_style == 'html':
-        return HtmlWriter(output_path)
-    
-    if format_style == 'postman':
-        return PostmanWriter(output_path)
-        
-    raise ValueError(f"Unknown format style: {format_style}")
\ No newline at end of file
+    kind = resolve_writer_kind(output_path, format_style)
+    writer_class = load_writer_class(kind)
+
+    options: Dict[str, Any] = {}
+    if streaming and getattr(writer_class, "supports_streaming", False):
+        options["streaming"] = True
+    if template_dirs and getattr(writer_class, "supports_templates", False):
+        options["template_dirs"] = template_dirs
+    if compression is not None and getattr(writer_class, "supports_compression", False):
+        options["compression"] = compression
+    return writer_class(output_path, **options)
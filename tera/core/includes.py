@@ -0,0 +1,107 @@
+import glob
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+import yaml
+from tera.core import yaml_io
+
+# Manifest read when the input is a directory.
+MANIFEST_NAME = "api.yaml"
+INCLUDE_KEY = "include"
+# Fragments of a directory whose manifest has no 'include' key.
+DEFAULT_INCLUDE = ("endpoints/**/*.yaml", "endpoints/**/*.yml")
+
+_INCLUDE_LINE = re.compile(rb"^include\s*:", re.MULTILINE)
+
+def manifest_path(source: Union[str, Path]) -> Path:
+    """The manifest of a multi-file source: the file itself, or 'api.yaml' inside a directory."""
+    path = Path(source)
+    return path / MANIFEST_NAME if path.is_dir() else path
+
+def is_manifest(source: Union[str, Path]) -> bool:
+    """
+    True for directories and for YAML files with a top-level 'include' key.
+    Only scans the raw bytes: deciding must stay cheaper than parsing a large single-file source.
+    """
+    path = Path(source)
+    if path.is_dir():
+        return True
+    try:
+        return is_manifest_content(path.read_bytes())
+    except OSError:
+        return False
+
+def is_manifest_content(content: bytes) -> bool:
+    """Same check as 'is_manifest', on the raw bytes of a YAML file."""
+    return bool(_INCLUDE_LINE.search(content))
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml_io.safe_load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"The manifest '{path}' must be a mapping with at least an 'api' block.")
+    return data
+
+def include_patterns(manifest: Dict[str, Any]) -> List[str]:
+    patterns = manifest.get(INCLUDE_KEY, list(DEFAULT_INCLUDE))
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    if not isinstance(patterns, list) or not all(isinstance(p, str) for p in patterns):
+        raise ValueError(f"'{INCLUDE_KEY}' must be a glob pattern or a list of glob patterns.")
+    return patterns
+
+def resolve_includes(path: Path, patterns: Sequence[str]) -> List[Path]:
+    """
+    Fragment files matched by the include patterns (relative to the manifest's directory):
+    pattern by pattern, sorted within each pattern, without duplicates nor the manifest itself.
+    The order of the files is the order of the endpoints in the merged schema.
+    """
+    found: List[Path] = []
+    for pattern in patterns:
+        matches = glob.glob(str(path.parent / pattern), recursive=True)
+        found.extend(sorted(Path(match) for match in matches if Path(match).is_file()))
+
+    manifest = path.resolve()
+    return [fragment for fragment in dict.fromkeys(found) if fragment.resolve() != manifest]
+
+def source_files(source: Union[str, Path]) -> List[Path]:
+    """
+    Every file a YAML source is built from: the file itself, or a manifest followed by its fragments.
+    Used to key caches and watchers on the whole source.
+    """
+    if not is_manifest(source):
+        return [Path(source)]
+    path = manifest_path(source)
+    return [path, *resolve_includes(path, include_patterns(load_manifest(path)))]
+
+def is_source_manifest(path: Union[str, Path]) -> bool:
+    """
+    True for a file that is the manifest of a multi-file source: a YAML file with 'include',
+    or an 'api.yaml' with fragments under the default patterns ('tera build <dir>' reads it so).
+    """
+    path = Path(path)
+    if not path.is_file():
+        return False
+    return is_manifest(path) or (path.name == MANIFEST_NAME and bool(resolve_includes(path, DEFAULT_INCLUDE)))
+
+def manifest_fragments(path: Path) -> List[Path]:
+    """Fragments of a manifest file; an unreadable manifest has none (the manifest itself reports the error)."""
+    try:
+        return resolve_includes(path, include_patterns(load_manifest(path)))
+    except (OSError, ValueError, yaml.YAMLError):
+        return []
+
+def enclosing_manifest(
+    path: Union[str, Path], fragments_of: Callable[[Path], Sequence[Path]] = manifest_fragments
+) -> Optional[Path]:
+    """
+    The manifest ('api.yaml' in a parent directory) of the nearest multi-file source that
+    includes 'path' as a fragment, or None for a file that is not part of one.
+    """
+    target = Path(path).resolve()
+    for directory in target.parents:
+        candidate = directory / MANIFEST_NAME
+        if candidate.resolve() != target and is_source_manifest(candidate):
+            if any(fragment.resolve() == target for fragment in fragments_of(candidate)):
+                return candidate
+    return None
@@ -1,5 +1,5 @@
 import pathspec
-from typing import List, Union
+from typing import List, Optional, Union
 from pathlib import Path
 
 DEFAULT_IGNORES = [
@@ -18,14 +18,23 @@ DEFAULT_IGNORES = [
 class PathFilter:
     """
     Responsible for determining whether a file or directory should be ignored.
-    Uses 'gitwildmatch' syntax (same as .gitignore).
+    Uses 'gitwildmatch' syntax (same as .gitignore): patterns are relative to the
+    project root ('root', the current directory by default, where .teraignore lives).
     """
-    def __init__(self, user_patterns: List[str] = None):
+    def __init__(self, user_patterns: List[str] = None, root: Optional[Path] = None):
         patterns = set(DEFAULT_IGNORES)
         if user_patterns:
             patterns.update(user_patterns)
 
         self.spec = pathspec.PathSpec.from_lines('gitwildmatch', patterns)
+        self.root = Path(root) if root else Path.cwd()
+
+    def project_path(self, path: Union[str, Path]) -> Optional[Path]:
+        """'path' relative to the project root, or None when it lies outside of it."""
+        try:
+            return Path(path).resolve().relative_to(self.root.resolve())
+        except (ValueError, OSError):
+            return None
 
     def should_ignore(self, path: Union[str, Path]) -> bool:
         """
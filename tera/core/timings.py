@@ -0,0 +1,114 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+@dataclass
+class StageRecord:
+    """
+    One measured run of a stage: wall time, CPU time (seconds) and how many
+    items it handled (endpoints, files, routes... None when not meaningful).
+    'started' is a timestamp (time.time()), comparable across threads and processes.
+    """
+    name: str
+    started: float = 0.0
+    wall: float = 0.0
+    cpu: float = 0.0
+    items: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+StageHook = Callable[[StageRecord], None]
+
+_HOOKS: List[StageHook] = []
+_HOOKS_LOCK = threading.Lock()
+
+def add_hook(hook: StageHook) -> None:
+    """Calls 'hook' with the record of every stage that finishes, from any thread."""
+    with _HOOKS_LOCK:
+        _HOOKS.append(hook)
+
+def remove_hook(hook: StageHook) -> None:
+    with _HOOKS_LOCK:
+        if hook in _HOOKS:
+            _HOOKS.remove(hook)
+
+def enabled() -> bool:
+    return bool(_HOOKS)
+
+def emit(record: StageRecord) -> None:
+    """Sends a record to the hooks, e.g. one measured in a worker process."""
+    for hook in list(_HOOKS):
+        hook(record)
+
+@contextmanager
+def stage(name: str, items: Optional[int] = None) -> Iterator[StageRecord]:
+    """
+    Measures the enclosed block as stage 'name'. The record is yielded so the block
+    can fill 'items' once known. Stages may nest: a parent's times include its children.
+    CPU time is the calling thread's, plus worker processes that exited during the stage.
+    Without hooks nothing is measured.
+    """
+    record = StageRecord(name, items=items)
+    if not _HOOKS:
+        yield record
+        return
+
+    record.started = time.time()
+    wall, cpu = time.perf_counter(), _cpu_time()
+    try:
+        yield record
+    finally:
+        record.wall = time.perf_counter() - wall
+        record.cpu = _cpu_time() - cpu
+        emit(record)
+
+def _cpu_time() -> float:
+    if not HAS_RESOURCE:
+        return time.thread_time()
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.thread_time() + children.ru_utime + children.ru_stime
+
+class StageTimings:
+    """
+    Hook summing the records of each stage name (calls, wall, CPU, items).
+    The summary lists stages by first start, so a stage comes before the ones nested in it.
+    """
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: StageRecord) -> None:
+        with self._lock:
+            totals = self.stages.setdefault(
+                record.name, {"name": record.name, "calls": 0, "wall": 0.0, "cpu": 0.0, "items": None}
+            )
+            totals["started"] = min(totals.get("started", record.started), record.started)
+            totals["calls"] += 1
+            totals["wall"] += record.wall
+            totals["cpu"] += record.cpu
+            if record.items is not None:
+                totals["items"] = (totals["items"] or 0) + record.items
+
+    def summary(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            ordered = sorted(self.stages.values(), key=lambda totals: totals["started"])
+            return [{k: v for k, v in totals.items() if k != "started"} for totals in ordered]
+
+@contextmanager
+def collect() -> Iterator[StageTimings]:
+    """Sums every stage run inside the block: 'with collect() as timings: ...; timings.summary()'."""
+    timings = StageTimings()
+    add_hook(timings)
+    try:
+        yield timings
+    finally:
+        remove_hook(timings)
@@ -0,0 +1,29 @@
+import os
+from typing import Any, Optional, TextIO
+import yaml
+
+# Every YAML read/write in Tera goes through this module, so all of them
+# get the libyaml C implementation when PyYAML was built with it.
+# TERA_YAML_BACKEND=python forces the pure-Python classes (debugging, benchmarks).
+try:
+    from yaml import CSafeLoader, CSafeDumper
+    HAS_LIBYAML = True
+except ImportError:
+    CSafeLoader = CSafeDumper = None
+    HAS_LIBYAML = False
+
+def _select_backend(name: Optional[str] = None):
+    name = (name or os.environ.get("TERA_YAML_BACKEND") or "auto").lower()
+    if name in ("auto", "c", "libyaml") and HAS_LIBYAML:
+        return "libyaml", CSafeLoader, CSafeDumper
+    return "python", yaml.SafeLoader, yaml.SafeDumper
+
+BACKEND, SafeLoader, SafeDumper = _select_backend()
+
+def safe_load(stream: Any, loader: Optional[type] = None) -> Any:
+    """Drop-in replacement for yaml.safe_load using the fastest available loader."""
+    return yaml.load(stream, Loader=loader or SafeLoader)
+
+def dump(data: Any, stream: Optional[TextIO] = None, dumper: Optional[type] = None, **options: Any) -> Any:
+    """Drop-in replacement for yaml.safe_dump using the fastest available dumper."""
+    return yaml.dump(data, stream, Dumper=dumper or SafeDumper, **options)
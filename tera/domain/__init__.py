@@ -1,15 +1,27 @@
 from .models import (
     TeraSchema, 
+    TeraFragment,
     Endpoint, 
     ApiConfig, 
     EndpointParams, 
     ParamField, 
     BodyField,
+    BodyModel,
     EndpointResponses, 
     ResponseSuccess
 )
 
+from .index import SchemaIndex
+from .builder import TrustedBuilder
+
 from .linting import (
     LintSeverity,
-    LintIssue
-)
\ No newline at end of file
+    LintIssue,
+    LintFileReport,
+    LintReport
+)
+from .diffing import (
+    ChangeKind,
+    SpecChange,
+    DiffReport
+)
@@ -0,0 +1,89 @@
+import json
+import sys
+from typing import Any, Dict, Hashable, List, Optional, Type, TypeVar
+from pydantic import BaseModel
+from tera.domain.models import (
+    Endpoint,
+    EndpointParams,
+    ParamField,
+    BodyField,
+    BodyModel,
+    EndpointResponses,
+    ResponseSuccess
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+class TrustedBuilder:
+    """
+    Builds domain objects from data Tera produced itself (e.g. a Flask scan) with
+    pydantic's model_construct: the values already have the right types, so they
+    are not validated again.
+    Identical objects (a 'page: int = 1' query parameter, a '200 Success' response...)
+    are built once and shared by every endpoint, with their strings interned.
+    Like any schema, what it builds must be treated as read-only.
+    """
+    def __init__(self):
+        self._shared: Dict[Hashable, BaseModel] = {}
+
+    def param(self, **values: Any) -> ParamField:
+        return self._share(ParamField, values)
+
+    def body_field(self, **values: Any) -> BodyField:
+        return self._share(BodyField, values)
+
+    def params(
+        self, path: List[ParamField], query: List[ParamField], header: List[ParamField]
+    ) -> EndpointParams:
+        return self._share(EndpointParams, {"path": path, "query": query, "header": header})
+
+    def responses(self, status: int = 200, example: Any = None) -> EndpointResponses:
+        success = self._share(ResponseSuccess, {"status": status, "example": example})
+        return self._share(EndpointResponses, {"success": success})
+
+    def body_model(self, description: Optional[str], fields: List[BodyField]) -> BodyModel:
+        return BodyModel.model_construct(description=description, fields=fields)
+
+    def validated(self, model: Type[M], data: Any) -> M:
+        """
+        A model validated from plain data (e.g. a cache entry, which is not trusted),
+        shared with every identical piece of data validated by this builder.
+        """
+        # JSON text is a cheap exact key for plain data (true/1/1.0 stay distinct).
+        key = (model, json.dumps(data, separators=(",", ":")))
+        shared = self._shared.get(key)
+        if shared is None:
+            shared = self._shared[key] = model.model_validate(data)
+        return shared
+
+    def endpoint(self, **values: Any) -> Endpoint:
+        """Endpoints are never shared (each one has its own path and docs)."""
+        for name in ("method", "tag"):
+            if name in values:
+                values[name] = _intern(values[name])
+        return Endpoint.model_construct(**values)
+
+    def _share(self, model: Type[M], values: Dict[str, Any]) -> M:
+        key = (model, tuple((name, _freeze(value)) for name, value in values.items()))
+        shared = self._shared.get(key)
+        if shared is None:
+            shared = self._shared[key] = model.model_construct(
+                **{name: _intern(value) for name, value in values.items()}
+            )
+        return shared
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Hashable key of a value. The type is part of it (True == 1 == 1.0 would share an
+    example otherwise); objects built by the builder are already shared, so their identity is enough.
+    """
+    if isinstance(value, BaseModel):
+        return (BaseModel, id(value))
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    return (type(value), value)
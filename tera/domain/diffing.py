@@ -0,0 +1,64 @@
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+class ChangeKind(str, Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+class SpecChange(BaseModel):
+    """
+    One difference between two versions of an API, e.g. a body field that became required.
+    'section' is what changed: endpoint, auth, param, body, response or meta.
+    """
+    endpoint: str
+    section: str
+    kind: ChangeKind
+    name: Optional[str] = None
+    breaking: bool = False
+    old: Any = None
+    new: Any = None
+
+    def __str__(self):
+        marker = "💥" if self.breaking else {"added": "+", "removed": "-", "changed": "~"}[self.kind.value]
+        target = self.section
+        if self.name:
+            target += f" '{self.name}'"
+        detail = f": {self.old!r} -> {self.new!r}" if self.kind == ChangeKind.CHANGED else ""
+        return f"{marker} {target} {self.kind.value}{detail}"
+
+class DiffReport(BaseModel):
+    """
+    Differences between an old and a new version of an API.
+    """
+    old: str
+    new: str
+    changes: List[SpecChange] = Field(default_factory=list)
+    # Endpoints present on both sides with identical content.
+    unchanged: int = 0
+
+    @property
+    def breaking(self) -> List[SpecChange]:
+        return [change for change in self.changes if change.breaking]
+
+    def by_endpoint(self) -> Dict[str, List[SpecChange]]:
+        grouped: Dict[str, List[SpecChange]] = {}
+        for change in self.changes:
+            grouped.setdefault(change.endpoint, []).append(change)
+        return grouped
+
+    def summary(self) -> Dict[str, Any]:
+        endpoint_changes = [c for c in self.changes if c.section == "endpoint"]
+        return {
+            "old": self.old,
+            "new": self.new,
+            "summary": {
+                "added": sum(1 for c in endpoint_changes if c.kind == ChangeKind.ADDED),
+                "removed": sum(1 for c in endpoint_changes if c.kind == ChangeKind.REMOVED),
+                "changed": len({c.endpoint for c in self.changes if c.section != "endpoint"}),
+                "unchanged": self.unchanged,
+                "breaking": len(self.breaking),
+            },
+            "changes": [change.model_dump(mode="json") for change in self.changes]
+        }
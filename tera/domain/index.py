@@ -0,0 +1,77 @@
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from tera.domain.models import Endpoint
+
+Route = Tuple[str, str]
+
+_PATH_PARAM = re.compile(r"\{([^}]*)\}")
+
+def generate_operation_id(ep: "Endpoint") -> str:
+    """
+    Generates IDs from the verb and the path, path parameters included:
+    GET /users -> 'getUsers', GET /users/{id}/posts/{post_id} -> 'getUsersByIdPostsByPostId'.
+    """
+    parts = _PATH_PARAM.split(ep.path)
+    # split() alternates static text and parameter names.
+    words = [
+        f"By{_camel(part)}" if position % 2 else _camel(part)
+        for position, part in enumerate(parts)
+    ]
+    return f"{ep.method.lower()}{''.join(words)}"
+
+def _camel(text: str) -> str:
+    return ''.join(word.capitalize() for word in re.sub(r'[^a-zA-Z0-9]', ' ', text).split())
+
+class SchemaIndex:
+    """
+    Lookups over the endpoints of a schema, built in one pass (see TeraSchema.index)
+    and shared by the OpenAPI adapter, the lint rules and the writers.
+    Endpoints are referred to by their position in 'TeraSchema.endpoints'.
+
+    operationIds only depend on the endpoint itself, so they stay stable when endpoints
+    are added or reordered. Two routes that still generate the same one (GET /users/list
+    and GET /users-list both give 'getUsersList') are recorded in 'collisions' and
+    reported by the 'operation_id_collision' rule; they are not renamed.
+    """
+    def __init__(self, endpoints: Sequence["Endpoint"]):
+        self.endpoints = endpoints
+        # First position of each (method, path).
+        self.routes: Dict[Route, int] = {}
+        # Position of a repeated route -> position of its first occurrence.
+        self.duplicates: Dict[int, int] = {}
+        # Positions grouped by path and by tag, in order of first appearance.
+        self.paths: Dict[str, List[int]] = {}
+        self.tags: Dict[Optional[str], List[int]] = {}
+        # operationId of each position, and the first position that generates each one.
+        self.operation_ids: List[str] = []
+        self.operations: Dict[str, int] = {}
+        # Position -> first position that generated the same operationId (another route).
+        self.collisions: Dict[int, int] = {}
+
+        for position, ep in enumerate(endpoints):
+            first = self.routes.setdefault((ep.method, ep.path), position)
+            if first != position:
+                self.duplicates[position] = first
+            self.paths.setdefault(ep.path, []).append(position)
+            self.tags.setdefault(ep.tag or None, []).append(position)
+
+            operation_id = generate_operation_id(ep)
+            self.operation_ids.append(operation_id)
+            owner = self.operations.setdefault(operation_id, position)
+            if owner != position and first == position:
+                self.collisions[position] = owner
+
+    def get(self, method: str, path: str) -> Optional["Endpoint"]:
+        """The endpoint of a route (the first one, if the route is repeated)."""
+        position = self.routes.get((method.upper(), path))
+        return None if position is None else self.endpoints[position]
+
+    def operation(self, operation_id: str) -> Optional["Endpoint"]:
+        position = self.operations.get(operation_id)
+        return None if position is None else self.endpoints[position]
+
+    def by_tag(self) -> List[Tuple[Optional[str], List["Endpoint"]]]:
+        """Endpoints grouped by tag in order of first appearance (untagged ones under None)."""
+        return [(tag, [self.endpoints[p] for p in positions]) for tag, positions in self.tags.items()]
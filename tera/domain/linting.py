@@ -1,6 +1,6 @@
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
 
 class LintSeverity(str, Enum):
     ERROR = "error"
@@ -15,9 +15,74 @@ class LintIssue(BaseModel):
     severity: LintSeverity
     location: Optional[str] = None
     line: Optional[int] = None
+    column: Optional[int] = None
 
     def __str__(self):
         prefix = f"[{self.severity.value.upper()}]"
         loc = f" at {self.location}" if self.location else ""
         line = f" (Line {self.line})" if self.line else ""
-        return f"{prefix} {self.message}{loc}{line}"
\ No newline at end of file
+        return f"{prefix} {self.message}{loc}{line}"
+
+class LintFileReport(BaseModel):
+    """
+    Issues found in a single file.
+    """
+    path: str
+    issues: List[LintIssue] = Field(default_factory=list)
+    rule_timings: Dict[str, float] = Field(default_factory=dict)
+    # Stage timings measured in a worker process (see tera.core.timings).
+    stages: List[Dict[str, Any]] = Field(default_factory=list)
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for i in self.issues if i.severity == LintSeverity.ERROR)
+
+    @property
+    def warnings(self) -> int:
+        return sum(1 for i in self.issues if i.severity == LintSeverity.WARNING)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "issues": [issue.model_dump(mode="json") for issue in self.issues]
+        }
+
+
+class LintReport(BaseModel):
+    """
+    Combined result of linting several files.
+    """
+    files: List[LintFileReport] = Field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return any(f.errors for f in self.files)
+
+    @property
+    def issues(self) -> List[LintIssue]:
+        return [issue for f in self.files for issue in f.issues]
+
+    @property
+    def rule_timings(self) -> Dict[str, float]:
+        """Seconds spent in each rule, summed over all files."""
+        totals: Dict[str, float] = {}
+        for f in self.files:
+            for name, elapsed in f.rule_timings.items():
+                totals[name] = totals.get(name, 0.0) + elapsed
+        return totals
+
+    def summary(self) -> Dict[str, Any]:
+        output = {
+            "summary": {
+                "files": len(self.files),
+                "errors": sum(f.errors for f in self.files),
+                "warnings": sum(f.warnings for f in self.files),
+            },
+            "files": [f.summary() for f in self.files]
+        }
+        timings = self.rule_timings
+        if timings:
+            output["rule_timings"] = timings
+        return output
@@ -1,5 +1,6 @@
-from typing import List, Optional, Any, Literal
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Dict, List, Optional, Any, Literal
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, model_validator
+from tera.domain.index import SchemaIndex
 
 HTTPMethod = Literal['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS', 'HEAD']
 AuthType = Literal['bearer', 'basic', 'apikey']
@@ -24,6 +25,16 @@ class ParamField(BaseField):
 class BodyField(BaseField):
     pass
 
+class BodyModel(BaseModel):
+    """
+    Named request body shared by several endpoints (a DTO, e.g. a Pydantic model).
+    Becomes a 'components/schemas' entry in OpenAPI.
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    description: Optional[str] = None
+    fields: List[BodyField] = Field(default_factory=list)
+
 class AuthConfig(BaseModel):
     model_config = ConfigDict(extra='forbid')
     
@@ -77,8 +88,30 @@ class Endpoint(BaseModel):
     auth_required: bool = False
     params: Optional[EndpointParams] = None
     body: List[BodyField] = Field(default_factory=list)
+    # Name of an entry of TeraSchema.models; its fields come before the ones in 'body'.
+    body_model: Optional[str] = None
     responses: EndpointResponses
 
+class SchemaMemo(dict):
+    """
+    Cache of views derived from a schema (e.g. its OpenAPI conversion).
+    It is not part of the schema's value: it never affects equality,
+    and copies/pickles of the schema start with an empty memo.
+    """
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, SchemaMemo)
+
+    __hash__ = None
+
+    def __copy__(self) -> "SchemaMemo":
+        return SchemaMemo()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "SchemaMemo":
+        return SchemaMemo()
+
+    def __reduce__(self):
+        return (SchemaMemo, ())
+
 class TeraSchema(BaseModel):
     """
     Root schema, representing the entire API.
@@ -86,4 +119,47 @@ class TeraSchema(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
     api: ApiConfig
-    endpoints: List[Endpoint]
\ No newline at end of file
+    endpoints: List[Endpoint]
+    models: Optional[Dict[str, BodyModel]] = None
+
+    # Treat the schema as read-only once something was memoized.
+    _memo: SchemaMemo = PrivateAttr(default_factory=SchemaMemo)
+
+    @model_validator(mode='after')
+    def check_body_models(self) -> "TeraSchema":
+        models = self.models or {}
+        for ep in self.endpoints:
+            if ep.body_model and ep.body_model not in models:
+                raise ValueError(
+                    f"Endpoint '{ep.method} {ep.path}' references unknown body model '{ep.body_model}'."
+                )
+        return self
+
+    def __copy__(self) -> "TeraSchema":
+        # model_copy() shares private attributes by reference; the copy may get other endpoints.
+        copied = super().__copy__()
+        copied._memo = SchemaMemo()
+        return copied
+
+    def index(self) -> SchemaIndex:
+        """Lookups by route, path, tag and operationId, built once per schema instance."""
+        index = self._memo.get("index")
+        if index is None:
+            index = self._memo["index"] = SchemaIndex(self.endpoints)
+        return index
+
+    def body_fields(self, ep: Endpoint) -> List[BodyField]:
+        """Resolved request body of an endpoint: its body model fields, then its own fields."""
+        if not ep.body_model:
+            return ep.body
+        return self.models[ep.body_model].fields + ep.body
+
+class TeraFragment(BaseModel):
+    """
+    Part of a schema split across files: endpoints and body models only,
+    the 'api' block lives in the manifest that includes the fragment.
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    endpoints: List[Endpoint] = Field(default_factory=list)
+    models: Optional[Dict[str, BodyModel]] = None
@@ -1,2 +1,16 @@
-from .yaml_driver import YamlFileDriver
-from .flask_driver import FlaskAppDriver
\ No newline at end of file
+from importlib import import_module
+
+# Drivers are exported lazily (PEP 562), see tera.writers.
+_EXPORTS = {
+    "YamlFileDriver": ".yaml_driver",
+    "MultiFileDriver": ".multi_file_driver",
+    "FlaskAppDriver": ".flask_driver",
+    "FlaskStaticDriver": ".flask_static_driver",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
@@ -1,39 +1,63 @@
+import inspect
 import re
-from typing import Any, List, Set
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+from tera.core import timings
 from tera.drivers.inspection import loader, parser, ast_parser, type_utils
+from tera.drivers.inspection.scan_cache import ScanCache
 from tera.domain import (
-    TeraSchema, 
-    ApiConfig, 
-    Endpoint, 
-    EndpointParams, 
-    ParamField, 
-    BodyField,
-    EndpointResponses, 
-    ResponseSuccess
+    TeraSchema, ApiConfig, Endpoint, EndpointParams, EndpointResponses, ParamField, BodyField, BodyModel
 )
+from tera.domain.builder import TrustedBuilder
+
+AUTH_KEYWORDS = ('jwt', 'login', 'auth', 'token', 'api_key', 'permission', 'admin', 'secure')
+AUTH_PATTERN = re.compile("|".join(map(re.escape, AUTH_KEYWORDS)), re.IGNORECASE)
+FLASK_PATH_VARIABLE = re.compile(r"<(?:\w+:)?(\w+)>")
+
+@dataclass(frozen=True)
+class ViewInfo:
+    """What is read from a view function, independent of the rule/method it serves."""
+    doc: parser.DocStringInfo
+    signature: parser.FunctionSignature
+    auth_required: bool
 
 class FlaskAppDriver:
     """
     Driver capable of reading an Flask app via instrospection + static analysis.
     Detects: Routes, Docs, Auth (Decorators) and Body (Pydantic).
+    Each view function is inspected once, however many rules and methods it serves.
+    With a 'scan_cache', routes whose sources did not change since the last scan are reused.
+    Body models are converted once per class and shared through TeraSchema.models.
+    Endpoints are built from values the driver produced itself, so they skip validation
+    and share their repeated parts (see TrustedBuilder).
     """
-    def __init__(self, app_import_string: str):
+    def __init__(self, app_import_string: str, scan_cache: Optional[ScanCache] = None):
         self.import_string = app_import_string
+        self.scan_cache = scan_cache
+        self._views: Dict[Callable, ViewInfo] = {}
+        self._models: Dict[str, BodyModel] = {}
+        # Model key (qualified class name) <-> name in self._models.
+        self._model_names: Dict[str, str] = {}
+        self._model_keys: Dict[str, str] = {}
+        self._builder = TrustedBuilder()
 
     def load(self) -> TeraSchema:
-        app = loader.load_app_instance(self.import_string)
+        with timings.stage("import"):
+            app = loader.load_app_instance(self.import_string)
         endpoints: List[Endpoint] = []
         
-        for rule in app.url_map.iter_rules():
-            if rule.endpoint == 'static':
-                continue
-
-            for method in rule.methods:
-                if method in ['HEAD', 'OPTIONS']:
+        with timings.stage("routes") as stage:
+            for rule in app.url_map.iter_rules():
+                if rule.endpoint == 'static':
                     continue
-                
-                endpoint = self._process_rule(app, rule, method)
-                endpoints.append(endpoint)
+
+                for method in rule.methods:
+                    if method in ['HEAD', 'OPTIONS']:
+                        continue
+                    
+                    endpoint = self._process_rule(app, rule, method)
+                    endpoints.append(endpoint)
+            stage.items = len(endpoints)
 
         return TeraSchema(
             api=ApiConfig(
@@ -41,25 +65,107 @@ class FlaskAppDriver:
                 version="1.0.0",
                 description="Auto-generated by Tera"
             ),
-            endpoints=endpoints
+            endpoints=endpoints,
+            models=self._models or None
         )
 
     def _process_rule(self, app: Any, rule: Any, method: str) -> Endpoint:
         """Transforms a Rule in an Endpoint"""  
-        view_func = app.view_functions[rule.endpoint]
-        doc_info = parser.parse_docstring(view_func)
-        sig_info = parser.parse_signature(view_func)
-        decorators = ast_parser.get_decorators(view_func)
-        auth_required = self._detect_auth(decorators)
-        path_openapi = self._convert_flask_path_to_openapi(str(rule))
-        path_vars: Set[str] = set(rule.arguments)
+        view_ref = app.view_functions[rule.endpoint]
+        # The endpoint name does not identify the view: 'add_url_rule' may bind it to another function
+        # (possibly in an unchanged module), so the view's identity and location are part of the key.
+        location = ast_parser.source_location(view_ref) or (None, None)
+        key = (
+            str(rule), method, rule.endpoint,
+            getattr(view_ref, "__module__", None), getattr(view_ref, "__qualname__", None), *location
+        )
+        return self._endpoint_for(key, str(rule), set(rule.arguments), method, view_ref)
+
+    def _endpoint_for(
+        self, key: Hashable, flask_path: str, path_vars: Set[str], method: str, view_ref: Any
+    ) -> Endpoint:
+        """Endpoint of one (rule, method) pair, from the scan cache when its sources are unchanged."""
+        if self.scan_cache:
+            cached = self.scan_cache.get(key, self._decode_cached)
+            if cached is not None:
+                return self._restore_cached(*cached)
+
+        view = self._view_info(view_ref)
+        endpoint = self._build_endpoint(flask_path, path_vars, method, view)
+
+        if self.scan_cache:
+            model_key = self._model_keys.get(endpoint.body_model)
+            model = self._models.get(endpoint.body_model)
+            entry = {
+                "endpoint": endpoint.model_dump(mode="json"),
+                "model_key": model_key,
+                "model": model.model_dump(mode="json") if model else None,
+            }
+            self.scan_cache.put(key, entry, self._source_files(view_ref, view))
+        return endpoint
+
+    def _decode_cached(self, cached: Any) -> Optional[Tuple[Endpoint, Optional[str], Optional[BodyModel]]]:
+        """
+        Validates a scan cache entry back into domain objects (None if it is not valid:
+        the route is scanned again). Identical parameters, responses and fields are shared.
+        """
+        try:
+            data = dict(cached["endpoint"])
+            if data.get("params") is not None:
+                data["params"] = self._builder.validated(EndpointParams, data["params"])
+            data["responses"] = self._builder.validated(EndpointResponses, data["responses"])
+            data["body"] = [self._builder.validated(BodyField, field) for field in data.get("body", [])]
+            endpoint = Endpoint.model_validate(data)
+            model = BodyModel.model_validate(cached["model"]) if cached["model"] is not None else None
+            model_key = cached["model_key"]
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not (endpoint.body_model is None) == (model is None) == (model_key is None):
+            return None
+        if model_key is not None and not isinstance(model_key, str):
+            return None
+        return endpoint, model_key, model
+
+    def _restore_cached(self, endpoint: Endpoint, model_key: Optional[str], model: Optional[BodyModel]) -> Endpoint:
+        """Registers the body model of a cached endpoint, renaming the reference if needed."""
+        if model_key is None:
+            return endpoint
+        name = self._add_body_model(model_key, endpoint.body_model, lambda: model)
+        if name != endpoint.body_model:
+            endpoint = endpoint.model_copy(update={"body_model": name})
+        return endpoint
+
+    def _view_info(self, view_ref: Any) -> ViewInfo:
+        return self._inspect_view(view_ref)
+
+    def _source_files(self, view_ref: Any, view: ViewInfo) -> List[Optional[str]]:
+        """
+        Files an endpoint is built from: the view's module and the modules
+        defining its body models (and their parent models).
+        """
+        location = ast_parser.source_location(view_ref)
+        files = [location[0] if location else None]
+        for type_hint in view.signature.parameters.values():
+            if self._is_body_model(type_hint):
+                for cls in type_hint.__mro__:
+                    if type_utils.is_pydantic_model(cls) and cls.__module__ != "pydantic.main":
+                        files.append(_source_file(cls))
+        return files
+
+    def _build_endpoint(self, flask_path: str, path_vars: Set[str], method: str, view: ViewInfo) -> Endpoint:
+        """Builds the Endpoint of one (rule, method) pair from what was read from its view."""
+        doc_info = view.doc
+        sig_info = view.signature
+        auth_required = view.auth_required
+        path_openapi = self._convert_flask_path_to_openapi(flask_path)
         query_params: List[ParamField] = []
         path_params: List[ParamField] = []
         body_fields: List[BodyField] = []
+        body_model: Optional[str] = None
 
         for name, type_hint in sig_info.parameters.items():
             if name in path_vars:
-                path_params.append(ParamField(
+                path_params.append(self._builder.param(
                     name=name,
                     required=True,
                     example=self._get_example_for_type(type_hint),
@@ -67,45 +173,90 @@ class FlaskAppDriver:
                 ))
                 continue
 
-            if method in ['POST', 'PUT', 'PATCH'] and type_utils.is_pydantic_model(type_hint):
-                extracted_fields = self._extract_pydantic_fields(type_hint)
-                body_fields.extend(extracted_fields)
+            if method in ['POST', 'PUT', 'PATCH'] and self._is_body_model(type_hint):
+                # The first model is the body model; any other one is flattened into the body.
+                if body_model is None:
+                    body_model = self._register_body_model(type_hint)
+                else:
+                    body_fields.extend(self._extract_pydantic_fields(type_hint))
                 continue
 
-            query_params.append(ParamField(
+            query_params.append(self._builder.param(
                 name=name,
                 required=False,
                 example=self._get_example_for_type(type_hint),
                 description="Query Parameter"
             ))
 
-        return Endpoint(
+        return self._builder.endpoint(
             path=path_openapi,
             method=method,
             summary=doc_info.summary,
             description=doc_info.description,
             auth_required=auth_required,
-            params=EndpointParams(
+            params=self._builder.params(
                 path=path_params,
                 query=query_params,
                 header=[]
             ),
             body=body_fields,
-            responses=EndpointResponses(
-                success=ResponseSuccess(
-                    status=200 if method != 'POST' else 201,
-                    example={"message": "Success"}
-                )
+            body_model=body_model,
+            responses=self._builder.responses(
+                status=200 if method != 'POST' else 201,
+                example={"message": "Success"}
             )
         )
 
+    def _inspect_view(self, view_func: Callable) -> ViewInfo:
+        """Docstring, signature and auth of a view function, memoized per function."""
+        view = self._views.get(view_func)
+        if view is None:
+            view = ViewInfo(
+                doc=parser.parse_docstring(view_func),
+                signature=parser.parse_signature(view_func),
+                auth_required=self._detect_auth(ast_parser.get_decorators(view_func))
+            )
+            self._views[view_func] = view
+        return view
+
     def _detect_auth(self, decorators: List[str]) -> bool:
         """Verifies keywords in decorators to detect auth requirements."""
-        security_keywords = {'jwt', 'login', 'auth', 'token', 'api_key', 'permission', 'admin', 'secure'}
-        for dec in decorators:
-            if any(keyword in dec.lower() for keyword in security_keywords):
-                return True
-        return False
+        return any(AUTH_PATTERN.search(dec) for dec in decorators)
+
+    def _is_body_model(self, type_hint: Any) -> bool:
+        """Whether a parameter annotation is a body model (its fields go to the body)."""
+        return type_utils.is_pydantic_model(type_hint)
+
+    def _register_body_model(self, model_class: Any) -> str:
+        """Converts a body model the first time it is seen; returns its name in TeraSchema.models."""
+        key, name = self._model_identity(model_class)
+        return self._add_body_model(key, name, lambda: self._builder.body_model(
+            description=self._model_description(model_class),
+            fields=self._extract_pydantic_fields(model_class)
+        ))
+
+    def _add_body_model(self, key: str, name: str, build: Callable[[], BodyModel]) -> str:
+        registered = self._model_names.get(key)
+        if registered is not None:
+            return registered
+
+        # Two classes with the same name in different modules: 'Item', 'Item2', ...
+        unique, counter = name, 1
+        while unique in self._models:
+            counter += 1
+            unique = f"{name}{counter}"
+
+        self._model_names[key] = unique
+        self._model_keys[unique] = key
+        self._models[unique] = build()
+        return unique
+
+    def _model_identity(self, model_class: Any) -> Tuple[str, str]:
+        """(unique key, preferred name) of a model class."""
+        return f"{model_class.__module__}.{model_class.__qualname__}", model_class.__name__
+
+    def _model_description(self, model_class: Any) -> Optional[str]:
+        return type_utils.get_pydantic_schema(model_class).get('description')
 
     def _extract_pydantic_fields(self, model_class: Any) -> List[BodyField]:
         """Converts Pydantic model fields into BodyField list."""
@@ -118,7 +269,7 @@ class FlaskAppDriver:
             prop_type = props.get('type', 'string')
             example = self._get_example_from_schema_type(prop_type)
             
-            fields.append(BodyField(
+            fields.append(self._builder.body_field(
                 name=name,
                 required=(name in required_fields),
                 description=props.get('description'),
@@ -137,7 +288,7 @@ class FlaskAppDriver:
         (\w+)   : Variable name (captured)
         >       : End
         """
-        return re.sub(r"<(?:\w+:)?(\w+)>", r"{\1}", flask_path)
+        return FLASK_PATH_VARIABLE.sub(r"{\1}", flask_path)
 
     def _get_example_from_schema_type(self, schema_type: str) -> Any:
         """Generates example based on JSON Schema type."""
@@ -155,4 +306,10 @@ class FlaskAppDriver:
         if type_hint is bool: return True
         if type_hint is dict: return {}
         if type_hint is list: return []
-        return "string"
\ No newline at end of file
+        return "string"
+
+def _source_file(obj: Any) -> Optional[str]:
+    try:
+        return inspect.getsourcefile(obj)
+    except TypeError:
+        return None
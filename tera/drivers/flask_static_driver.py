@@ -0,0 +1,339 @@
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from tera.core import timings
+from tera.core.discovery import walk_files
+from tera.core.path_filter import PathFilter
+from tera.drivers.flask_driver import FlaskAppDriver, ViewInfo, FLASK_PATH_VARIABLE
+from tera.drivers.inspection import parser, static_parser
+from tera.drivers.inspection.scan_cache import ScanCache
+from tera.drivers.inspection.static_parser import (
+    ModuleScan, StaticClass, StaticFunction, StaticRoute, StaticRegistration
+)
+from tera.domain import TeraSchema, ApiConfig, Endpoint, BodyField
+from tera.exceptions import TeraError
+
+BASE_MODEL_NAMES = {"pydantic.BaseModel", "pydantic.main.BaseModel"}
+# Following aliases (re-exports) beyond this depth means a cycle.
+MAX_ALIAS_DEPTH = 16
+
+class FlaskStaticDriver(FlaskAppDriver):
+    """
+    Import-free variant of FlaskAppDriver.
+    Parses every Python file of the project with 'ast' (in a process pool) and resolves
+    routes, blueprints and 'add_url_rule' registrations statically, so the user's app
+    (DB pools, models, secrets) is never executed. Builds endpoints exactly like FlaskAppDriver,
+    with type hints being qualified names ('int', 'app.schemas.Item') instead of objects.
+    """
+    def __init__(
+        self,
+        app_import_string: Optional[str] = None,
+        root: Path = Path("."),
+        path_filter: Optional[PathFilter] = None,
+        jobs: int = 0,
+        scan_cache: Optional[ScanCache] = None
+    ):
+        super().__init__(app_import_string or "", scan_cache=scan_cache)
+        self.root = Path(root).resolve()
+        self.path_filter = path_filter or PathFilter()
+        self.jobs = jobs
+        self.warnings: List[str] = []
+
+        self._module_files: Dict[str, str] = {}
+        self._aliases: Dict[str, str] = {}
+        self._classes: Dict[str, StaticClass] = {}
+        self._functions: Dict[str, StaticFunction] = {}
+        self._apps: Dict[str, str] = {}
+        self._blueprints: Dict[str, Optional[str]] = {}
+        self._calls: Dict[str, str] = {}
+        self._routes: Dict[str, List[StaticRoute]] = defaultdict(list)
+        self._registrations: Dict[str, List[StaticRegistration]] = defaultdict(list)
+
+    def load(self) -> TeraSchema:
+        with timings.stage("parse") as stage:
+            scans = self._scan_files()
+            stage.items = len(scans)
+        with timings.stage("link", items=len(scans)):
+            self._link(scans)
+        app = self._select_app()
+        endpoints: List[Endpoint] = []
+
+        with timings.stage("routes") as stage:
+            for flask_path, methods, view_name in self._iter_rules(app, None, ()):
+                view_name = self._resolve(view_name)
+                path_vars = set(FLASK_PATH_VARIABLE.findall(flask_path))
+                for method in methods:
+                    if method in ['HEAD', 'OPTIONS']:
+                        continue
+                    endpoints.append(self._endpoint_for(
+                        (flask_path, method, view_name), flask_path, path_vars, method, view_name
+                    ))
+            stage.items = len(endpoints)
+
+        return TeraSchema(
+            api=ApiConfig(
+                name=self._apps[app],
+                version="1.0.0",
+                description="Auto-generated by Tera"
+            ),
+            endpoints=endpoints,
+            models=self._models or None
+        )
+
+    def _scan_files(self) -> List[ModuleScan]:
+        """Parses the project files; with a scan cache, only the ones whose content changed."""
+        paths = list(walk_files(self.root, (".py",), self.path_filter))
+        scans: Dict[Path, ModuleScan] = {}
+        if self.scan_cache:
+            for path in paths:
+                cached = self.scan_cache.get_module(str(path), _decode_module)
+                if cached is not None:
+                    scans[path] = cached
+
+        todo = [path for path in paths if path not in scans]
+        for path, scan in zip(todo, self._parse_files(todo)):
+            scans[path] = scan
+            if self.scan_cache and not scan.error:
+                self.scan_cache.put_module(str(path), static_parser.module_to_data(scan))
+
+        self._module_files = {scans[path].module: str(path) for path in paths}
+        return [scans[path] for path in paths]
+
+    def _parse_files(self, paths: List[Path]) -> List[ModuleScan]:
+        tasks = [(path, self.root) for path in paths]
+        jobs = self.jobs if self.jobs > 0 else (os.cpu_count() or 1)
+        jobs = min(jobs, len(tasks))
+
+        if jobs <= 1:
+            return [static_parser.scan_file(task) for task in tasks]
+
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(static_parser.scan_file, tasks, chunksize=chunksize))
+
+    def _link(self, scans: List[ModuleScan]) -> None:
+        """Merges the per-module scans into project wide tables keyed by qualified name."""
+        routes: List[StaticRoute] = []
+        registrations: List[StaticRegistration] = []
+
+        for scan in scans:
+            if scan.error:
+                self.warnings.append(scan.error)
+            prefix = f"{scan.module}." if scan.module else ""
+            for local, target in scan.bindings.items():
+                if prefix + local != target:
+                    self._aliases[prefix + local] = target
+            self._classes.update(scan.classes)
+            self._functions.update(scan.functions)
+            self._apps.update(scan.apps)
+            self._blueprints.update(scan.blueprints)
+            self._calls.update(scan.calls)
+            routes.extend(scan.routes)
+            registrations.extend(scan.registrations)
+
+        for route in routes:
+            self._routes[self._resolve(route.owner)].append(route)
+
+        # 'def init_app(app): app.register_blueprint(bp)': the owner is a parameter.
+        # With a single app in the project, such registrations can only target it.
+        single_app = next(iter(self._apps)) if len(self._apps) == 1 else None
+        for registration in registrations:
+            owner = self._resolve(registration.owner)
+            if owner not in self._apps and owner not in self._blueprints and single_app:
+                owner = single_app
+            self._registrations[owner].append(registration)
+
+    def _resolve(self, name: Optional[str]) -> Optional[str]:
+        """Follows imports and re-exports ('pkg.Item' -> 'pkg.models.Item') to the defining name."""
+        if not name:
+            return name
+        known = (self._classes, self._functions, self._apps, self._blueprints, self._calls)
+
+        for _ in range(MAX_ALIAS_DEPTH):
+            if any(name in table for table in known):
+                return name
+            parts = name.split(".")
+            for size in range(len(parts), 0, -1):
+                head = ".".join(parts[:size])
+                if head in self._aliases:
+                    name = ".".join([self._aliases[head], *parts[size:]])
+                    break
+            else:
+                return name
+        return name
+
+    def _select_app(self) -> str:
+        if not self._apps:
+            raise TeraError("Static Scan Error", f"No Flask application found under '{self.root}'.")
+
+        if not self.import_string:
+            if len(self._apps) > 1:
+                raise TeraError(
+                    "Static Scan Error",
+                    f"Several Flask applications found ({', '.join(sorted(self._apps))}). "
+                    "Pass one as 'module:attribute'."
+                )
+            return next(iter(self._apps))
+
+        target = self._resolve(self.import_string.replace(":", "."))
+        if target in self._apps:
+            return target
+
+        # 'wsgi:app' with 'app = create_app()': follow the call to the factory.
+        if target in self._calls:
+            target = self._resolve(self._calls[target])
+
+        # 'module:create_app' points at an app factory: use the app created inside it.
+        created = [name for name in self._apps if name.startswith(f"{target}.")]
+        if len(created) == 1:
+            return created[0]
+
+        raise TeraError(
+            "Static Scan Error",
+            f"'{self.import_string}' is not a Flask application. Found: {', '.join(sorted(self._apps))}."
+        )
+
+    def _iter_rules(
+        self, owner: str, url_prefix: Optional[str], stack: Tuple[str, ...]
+    ) -> Iterator[Tuple[str, List[str], Optional[str]]]:
+        """
+        Yields (rule, methods, view) for an app or blueprint, then for the blueprints
+        registered on it, joining URL prefixes the way Flask does.
+        """
+        for route in self._routes.get(owner, []):
+            yield _join_rule(url_prefix, route.rule), route.methods, route.view
+
+        for registration in self._registrations.get(owner, []):
+            blueprint = self._resolve(registration.blueprint)
+            if blueprint not in self._blueprints:
+                self.warnings.append(f"Unresolved blueprint '{registration.blueprint}' registered on '{owner}'.")
+                continue
+            if blueprint in stack:
+                continue
+
+            prefix = registration.url_prefix
+            if prefix is None:
+                prefix = self._blueprints[blueprint]
+            if url_prefix is not None and prefix is not None:
+                prefix = url_prefix.rstrip("/") + "/" + prefix.lstrip("/")
+            elif prefix is None:
+                prefix = url_prefix
+
+            yield from self._iter_rules(blueprint, prefix, stack + (owner,))
+
+    def _view_info(self, view_ref: Any) -> ViewInfo:
+        return self._inspect_static_view(view_ref)
+
+    def _source_files(self, view_ref: Any, view: ViewInfo) -> List[Optional[str]]:
+        files = [self._file_of(self._resolve(view_ref)) if view_ref else None]
+        for type_hint in view.signature.parameters.values():
+            if self._is_body_model(type_hint):
+                for name in self._model_chain(self._resolve(type_hint), ()):
+                    files.append(self._file_of(name))
+        return files
+
+    def _file_of(self, qualname: str) -> Optional[str]:
+        """Source file of the module defining 'qualname' (longest matching module name)."""
+        module = qualname
+        while module:
+            if module in self._module_files:
+                return self._module_files[module]
+            module = module.rpartition(".")[0]
+        return self._module_files.get("")
+
+    def _inspect_static_view(self, view_name: Optional[str]) -> ViewInfo:
+        """Static counterpart of '_inspect_view', memoized per view function too."""
+        qualname = self._resolve(view_name)
+        view = self._views.get(qualname)
+        if view is not None:
+            return view
+
+        function = self._functions.get(qualname)
+        if function is None:
+            view = ViewInfo(
+                doc=parser.parse_docstring_text(None),
+                signature=parser.FunctionSignature(),
+                auth_required=False
+            )
+        else:
+            view = ViewInfo(
+                doc=parser.parse_docstring_text(function.docstring),
+                signature=parser.FunctionSignature(parameters=dict(function.parameters)),
+                auth_required=self._detect_auth(function.decorators)
+            )
+        self._views[qualname] = view
+        return view
+
+    def _is_body_model(self, type_hint: Any) -> bool:
+        return self._is_model_class(self._resolve(type_hint), ())
+
+    def _is_model_class(self, name: Optional[str], stack: Tuple[str, ...]) -> bool:
+        if name in BASE_MODEL_NAMES:
+            return False
+        cls = self._classes.get(name)
+        if cls is None or name in stack:
+            return False
+        return any(
+            base in BASE_MODEL_NAMES or self._is_model_class(base, stack + (name,))
+            for base in map(self._resolve, cls.bases)
+        )
+
+    def _extract_pydantic_fields(self, model_class: Any) -> List[BodyField]:
+        """Fields of a model read from the source, inherited ones first (pydantic's order)."""
+        fields = {}
+        for name in self._model_chain(self._resolve(model_class), ()):
+            for static_field in self._classes[name].fields:
+                fields[static_field.name] = static_field
+
+        return [
+            self._builder.body_field(
+                name=f.name,
+                required=f.required,
+                description=f.description,
+                example=self._get_example_from_schema_type(f.json_type or 'string')
+            )
+            for f in fields.values()
+        ]
+
+    def _model_identity(self, model_class: Any) -> Tuple[str, str]:
+        qualname = self._resolve(model_class)
+        return qualname, qualname.rsplit(".", 1)[-1]
+
+    def _model_description(self, model_class: Any) -> Optional[str]:
+        return self._classes[self._resolve(model_class)].docstring
+
+    def _model_chain(self, name: str, stack: Tuple[str, ...]) -> List[str]:
+        """The model and the project classes it inherits from, bases first."""
+        cls = self._classes.get(name)
+        if cls is None or name in stack:
+            return []
+        chain = []
+        for base in map(self._resolve, cls.bases):
+            chain.extend(self._model_chain(base, stack + (name,)))
+        return chain + [name]
+
+    def _get_example_for_type(self, type_hint: Any) -> Any:
+        """Same examples as FlaskAppDriver, for builtins named in the annotation."""
+        if type_hint == 'int': return 0
+        if type_hint == 'float': return 0.0
+        if type_hint == 'bool': return True
+        if type_hint == 'dict': return {}
+        if type_hint == 'list': return []
+        return "string"
+
+def _join_rule(url_prefix: Optional[str], rule: str) -> str:
+    """Prefixes a blueprint rule like flask.blueprints.BlueprintSetupState.add_url_rule."""
+    if url_prefix is None:
+        return rule
+    if rule:
+        return "/".join((url_prefix.rstrip("/"), rule.lstrip("/")))
+    return url_prefix
+
+def _decode_module(data: Any) -> Optional[ModuleScan]:
+    """A module scan from the scan cache (None if the entry is not a valid one)."""
+    try:
+        return static_parser.module_from_data(data)
+    except ValueError:
+        return None
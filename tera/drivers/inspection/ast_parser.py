@@ -1,7 +1,9 @@
 import ast
 import inspect
+import linecache
 import textwrap
-from typing import List, Callable, Any
+from functools import lru_cache
+from typing import Dict, List, Callable, Any, Optional, Tuple
 
 def get_decorators(func: Callable) -> List[str]:
     """
@@ -15,7 +17,52 @@ def get_decorators(func: Callable) -> List[str]:
         
     Returns:
         ['app.route', 'jwt_required']
+
+    The function's module is parsed once and all its functions indexed (see 'index_module'),
+    so scanning many views of the same module costs a single ast.parse.
+    """
+    location = source_location(func)
+    if location:
+        decorators = index_module(location[0]).get(location[1])
+        if decorators is not None:
+            return list(decorators)
+
+    return _parse_function_decorators(func)
+
+@lru_cache(maxsize=None)
+def index_module(filename: str) -> Dict[int, Tuple[str, ...]]:
+    """
+    Parses a source file once and maps the first line of every function
+    (its first decorator, as in code.co_firstlineno) to its decorator names.
+    Unreadable or invalid files give an empty index.
     """
+    source = "".join(linecache.getlines(filename))
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError):
+        return {}
+
+    index: Dict[int, Tuple[str, ...]] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            first_line = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            index[first_line] = tuple(
+                name for name in map(_extract_decorator_name, node.decorator_list) if name
+            )
+    return index
+
+def source_location(func: Callable) -> Optional[Tuple[str, int]]:
+    """(source file, first line) of the function that inspect.getsource would read."""
+    try:
+        target = inspect.unwrap(func)
+        filename = inspect.getsourcefile(target)
+        first_line = target.__code__.co_firstlineno
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return (filename, first_line) if filename else None
+
+def _parse_function_decorators(func: Callable) -> List[str]:
+    """Fallback for functions missing from the module index: parses their own source."""
     try:
         source = inspect.getsource(func)
         source = textwrap.dedent(source)
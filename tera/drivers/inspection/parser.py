@@ -17,8 +17,10 @@ def parse_docstring(func: Callable) -> DocStringInfo:
     Extract and cleans the function's docstring.
     Separates the first line (Summary) from the rest (Description).
     """
-    raw_doc = inspect.getdoc(func)
-    
+    return parse_docstring_text(inspect.getdoc(func))
+
+def parse_docstring_text(raw_doc: Optional[str]) -> DocStringInfo:
+    """Same as 'parse_docstring', for a docstring already extracted (e.g. from the AST)."""
     if not raw_doc:
         return DocStringInfo(summary="No summary available")
 
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+from tera.core.cache import TERA_VERSION, get_cache_dir, hash_file
+from tera.adapters.compiled_cache import model_fingerprint
+
+# Bump when the layout of the stored entries changes.
+SCAN_CACHE_VERSION = 3
+
+def _identity(value: Any) -> Any:
+    return value
+
+class ScanCache:
+    """
+    Results of previous 'tera scan' runs, stored in '.tera/cache'.
+    Each route (rule + method + view) keeps what the driver built for it (its Endpoint and body model)
+    plus the content hash of every source file it was built from (the view module and the modules of its body models),
+    so a later scan only re-inspects routes whose sources changed.
+    The static scan also keeps the parsed form of each module, keyed by its hash.
+    One file per scope (driver + target): scanning another app never evicts this one.
+
+    The cache lives in the project tree, so a repository may ship a crafted one: it is
+    plain JSON (never a pickle), whose first line (the versions) is checked before the rest
+    is read. Keys are tuples of strings/numbers; values are JSON data, encoded and
+    validated back by the drivers.
+    """
+    def __init__(self, scope: str, cache_dir: Optional[Path] = None):
+        name = hashlib.sha1(scope.encode()).hexdigest()[:16]
+        self.path = (cache_dir or get_cache_dir()) / f"scan-{name}.json"
+        self.reused = 0
+        self.rescanned = 0
+        self.modules_reused = 0
+        self.modules_parsed = 0
+        self._hashes: Dict[str, Optional[str]] = {}
+        self._routes: Optional[Dict[Hashable, Tuple[Dict[str, str], Any]]] = None
+        self._modules: Dict[str, Tuple[str, Any]] = {}
+        self._touched_routes: Dict[Hashable, Tuple[Dict[str, str], Any]] = {}
+        self._touched_modules: Dict[str, Tuple[str, Any]] = {}
+
+    def file_hash(self, path: str) -> Optional[str]:
+        """Content hash of a source file, computed once per scan (None if unreadable)."""
+        if path not in self._hashes:
+            try:
+                self._hashes[path] = hash_file(Path(path))
+            except OSError:
+                self._hashes[path] = None
+        return self._hashes[path]
+
+    def get(self, key: Hashable, decode: Callable[[Any], Any] = _identity) -> Any:
+        """
+        The value stored for 'key' if none of its source files changed, else None.
+        'decode' turns the stored data back into objects; when it returns None the entry is a miss.
+        """
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        sources, data = entry
+        if any(self.file_hash(path) != digest for path, digest in sources.items()):
+            return None
+        value = decode(data)
+        if value is None:
+            return None
+        self._touched_routes[key] = entry
+        self.reused += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, sources: Iterable[Optional[str]]) -> None:
+        """Stores a freshly built route. Routes with an unknown source are never cached."""
+        self.rescanned += 1
+        sources = list(dict.fromkeys(sources))
+        hashes = {path: self.file_hash(path) for path in sources if path}
+        if not sources or len(hashes) != len(sources) or None in hashes.values():
+            return
+        self._touched_routes[key] = (hashes, value)
+
+    def get_module(self, path: str, decode: Callable[[Any], Any] = _identity) -> Any:
+        self._load()
+        entry = self._modules.get(path)
+        if entry is None or entry[0] != self.file_hash(path):
+            return None
+        value = decode(entry[1])
+        if value is None:
+            return None
+        self._touched_modules[path] = entry
+        self.modules_reused += 1
+        return value
+
+    def put_module(self, path: str, module: Any) -> None:
+        self.modules_parsed += 1
+        digest = self.file_hash(path)
+        if digest is not None:
+            self._touched_modules[path] = (digest, module)
+
+    def save(self) -> None:
+        """
+        Persists what this scan used or produced, atomically; routes and modules that
+        disappeared are dropped. Cache failures never break a scan.
+        """
+        unchanged = (
+            self.rescanned == self.modules_parsed == 0 and self._routes is not None
+            and self._touched_routes.keys() == self._routes.keys()
+            and self._touched_modules.keys() == self._modules.keys()
+        )
+        if unchanged and self.path.exists():
+            # Everything was reused: the file already holds exactly this.
+            return
+        data = {
+            "routes": [[list(key), sources, value] for key, (sources, value) in self._touched_routes.items()],
+            "modules": self._touched_modules,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(list(self._version_key())) + "\n")
+                f.write(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_path, self.path)
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def _load(self) -> Dict[Hashable, Tuple[Dict[str, str], Any]]:
+        if self._routes is None:
+            self._routes = {}
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    if json.loads(f.readline()) != list(self._version_key()):
+                        return self._routes
+                    data = json.load(f)
+                routes = {tuple(key): (sources, value) for key, sources, value in data["routes"]}
+                modules = {path: (digest, module) for path, (digest, module) in data["modules"].items()}
+                if not all(isinstance(sources, dict) for sources, _ in routes.values()):
+                    raise ValueError("malformed scan cache")
+                self._routes, self._modules = routes, modules
+            except Exception:
+                pass
+        return self._routes
+
+    @staticmethod
+    def _version_key() -> Tuple[str, ...]:
+        return (str(SCAN_CACHE_VERSION), TERA_VERSION, model_fingerprint())
@@ -0,0 +1,346 @@
+import ast
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import TypeAdapter
+from tera.drivers.inspection.ast_parser import _extract_decorator_name
+
+# Decorator shortcuts of Flask >= 2.0 ('@app.get(...)') and the method they imply.
+ROUTE_SHORTCUTS = {"get": "GET", "post": "POST", "put": "PUT", "patch": "PATCH", "delete": "DELETE"}
+
+# JSON Schema type pydantic gives to plain annotations (anything else has no 'type').
+JSON_TYPES = {
+    "int": "integer", "float": "number", "bool": "boolean", "str": "string",
+    "list": "array", "List": "array", "set": "array", "Set": "array", "tuple": "array",
+    "Tuple": "array", "Sequence": "array", "typing.List": "array", "typing.Sequence": "array",
+    "dict": "object", "Dict": "object", "Mapping": "object", "typing.Dict": "object",
+}
+
+@dataclass
+class StaticField:
+    name: str
+    json_type: Optional[str]
+    required: bool
+    description: Optional[str] = None
+
+@dataclass
+class StaticClass:
+    bases: List[str]
+    fields: List[StaticField]
+    docstring: Optional[str] = None
+
+@dataclass
+class StaticFunction:
+    """A function as the Flask driver sees it: docstring, typed parameters, decorators."""
+    docstring: Optional[str]
+    # Parameter name -> annotation (qualified when it names something importable), in order.
+    parameters: List[Tuple[str, Optional[str]]]
+    decorators: List[str]
+
+@dataclass
+class StaticRoute:
+    owner: str
+    rule: str
+    methods: List[str]
+    view: Optional[str]
+
+@dataclass
+class StaticRegistration:
+    owner: str
+    blueprint: str
+    url_prefix: Optional[str]
+
+@dataclass
+class ModuleScan:
+    """
+    Everything the static Flask scan needs from one module. Names are qualified
+    as 'package.module.attr' (the keys too) so modules can be linked together afterwards.
+    Plain data only: it crosses process boundaries.
+    """
+    module: str
+    # Module level name -> what it refers to (e.g. 'Item' -> 'pkg.models.Item').
+    bindings: Dict[str, str] = field(default_factory=dict)
+    classes: Dict[str, StaticClass] = field(default_factory=dict)
+    functions: Dict[str, StaticFunction] = field(default_factory=dict)
+    apps: Dict[str, str] = field(default_factory=dict)
+    blueprints: Dict[str, Optional[str]] = field(default_factory=dict)
+    # Names assigned from other calls ('app = create_app()') -> the called function.
+    calls: Dict[str, str] = field(default_factory=dict)
+    routes: List[StaticRoute] = field(default_factory=list)
+    registrations: List[StaticRegistration] = field(default_factory=list)
+    error: Optional[str] = None
+
+def module_to_data(scan: ModuleScan) -> Dict[str, Any]:
+    """JSON form of a scan, for the scan cache."""
+    return _module_adapter().dump_python(scan, mode="json")
+
+def module_from_data(data: Any) -> ModuleScan:
+    """Validates the JSON form of a scan back (raises ValueError if it is not one)."""
+    return _module_adapter().validate_python(data)
+
+@lru_cache(maxsize=1)
+def _module_adapter() -> TypeAdapter:
+    return TypeAdapter(ModuleScan)
+
+def module_name(path: Path, root: Path) -> Tuple[str, bool]:
+    """('pkg.mod', is_package) for a file under 'root'."""
+    parts = list(path.relative_to(root).with_suffix("").parts)
+    is_package = parts[-1] == "__init__"
+    if is_package:
+        parts = parts[:-1]
+    return ".".join(parts), is_package
+
+def scan_file(task: Tuple[Path, Path]) -> ModuleScan:
+    """
+    Parses one Python file without importing it. Process pool entry point.
+    Unreadable or invalid files give an empty scan with 'error' set.
+    """
+    path, root = task
+    name, is_package = module_name(path, root)
+    scan = ModuleScan(module=name)
+
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError) as e:
+        scan.error = f"{path}: {e}"
+        return scan
+
+    _ModuleVisitor(scan, is_package).run(tree)
+    return scan
+
+class _ModuleVisitor:
+    """
+    Collects definitions and Flask registrations of a module, including the ones made
+    inside functions (app factories): names local to a function are qualified as
+    'module.function.name'.
+    """
+    def __init__(self, scan: ModuleScan, is_package: bool):
+        self.scan = scan
+        self.package = scan.module if is_package else scan.module.rpartition(".")[0]
+        self.scopes: List[Tuple[str, Dict[str, str]]] = []
+
+    def run(self, tree: ast.Module) -> None:
+        # Definitions first, so names used before being bound in the file still resolve.
+        self._enter(self.scan.module, tree.body, self.scan.bindings)
+        self._collect_body(tree.body)
+
+    def qualify(self, node: Optional[ast.expr]) -> Optional[str]:
+        """Qualified name of a Name/Attribute expression, or its source text for anything else."""
+        if node is None:
+            return None
+        dotted = _dotted_name(node)
+        if dotted is None:
+            return ast.unparse(node)
+
+        head, _, rest = dotted.partition(".")
+        for _, bindings in reversed(self.scopes):
+            target = bindings.get(head)
+            if target is not None:
+                return f"{target}.{rest}" if rest else target
+        return dotted
+
+    def _enter(self, prefix: str, body: List[ast.stmt], bindings: Dict[str, str]) -> None:
+        self.scopes.append((prefix, bindings))
+        for node in _flatten(body):
+            self._bind(node, bindings, f"{prefix}." if prefix else "")
+
+    def _bind(self, node: ast.stmt, bindings: Dict[str, str], local: str) -> None:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    bindings[alias.asname] = alias.name
+                else:
+                    head = alias.name.split(".")[0]
+                    bindings[head] = head
+        elif isinstance(node, ast.ImportFrom):
+            base = self._resolve_from(node)
+            for alias in node.names:
+                if alias.name != "*":
+                    bindings[alias.asname or alias.name] = f"{base}.{alias.name}" if base else alias.name
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bindings[node.name] = local + node.name
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    bindings[target.id] = local + target.id
+
+    def _resolve_from(self, node: ast.ImportFrom) -> str:
+        if not node.level:
+            return node.module or ""
+        parts = self.package.split(".") if self.package else []
+        if node.level > 1:
+            parts = parts[:len(parts) - (node.level - 1)]
+        if node.module:
+            parts.append(node.module)
+        return ".".join(parts)
+
+    def _collect_body(self, body: List[ast.stmt]) -> None:
+        for node in _flatten(body):
+            self._collect(node)
+
+    def _collect(self, node: ast.stmt) -> None:
+        prefix = self.scopes[-1][0]
+        if isinstance(node, ast.ClassDef):
+            self.scan.classes[_join(prefix, node.name)] = StaticClass(
+                bases=[self.qualify(base) for base in node.bases],
+                fields=_model_fields(node),
+                docstring=ast.get_docstring(node, clean=True)
+            )
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            self._collect_function(node, _join(prefix, node.name))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)) and isinstance(node.value, ast.Call):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            names = [_join(prefix, t.id) for t in targets if isinstance(t, ast.Name)]
+            self._collect_constructor(names, node.value)
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+            self._collect_call(node.value)
+
+    def _collect_function(self, node: ast.FunctionDef, qualname: str) -> None:
+        args = node.args
+        parameters = [
+            (arg.arg, self._annotation(arg.annotation))
+            for arg in [*args.posonlyargs, *args.args, *([args.vararg] if args.vararg else []), *args.kwonlyargs]
+            if arg.arg not in ("self", "cls")
+        ]
+        self.scan.functions[qualname] = StaticFunction(
+            docstring=ast.get_docstring(node, clean=True),
+            parameters=parameters,
+            decorators=[name for name in map(_extract_decorator_name, node.decorator_list) if name]
+        )
+
+        for decorator in node.decorator_list:
+            if not (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute)):
+                continue
+            verb = decorator.func.attr
+            if verb != "route" and verb not in ROUTE_SHORTCUTS:
+                continue
+            rule = _literal_str(decorator.args[0]) if decorator.args else _literal_str(_keyword(decorator, "rule"))
+            if rule is None:
+                continue
+            methods = [ROUTE_SHORTCUTS[verb]] if verb in ROUTE_SHORTCUTS else _methods(decorator)
+            self.scan.routes.append(StaticRoute(self.qualify(decorator.func.value), rule, methods, qualname))
+
+        self._enter(qualname, node.body, {})
+        self._collect_body(node.body)
+        self.scopes.pop()
+
+    def _collect_constructor(self, names: List[str], call: ast.Call) -> None:
+        constructor = self.qualify(call.func) or ""
+        kind = constructor.rsplit(".", 1)[-1]
+
+        if kind == "Flask":
+            import_name = call.args[0] if call.args else _keyword(call, "import_name")
+            app_name = self.scan.module if _is_dunder_name(import_name) else _literal_str(import_name)
+            for name in names:
+                self.scan.apps[name] = app_name or "Flask App"
+        elif kind == "Blueprint":
+            prefix = _literal_str(_keyword(call, "url_prefix"))
+            for name in names:
+                self.scan.blueprints[name] = prefix
+        else:
+            for name in names:
+                self.scan.calls[name] = constructor
+            self._collect_call(call)
+
+    def _collect_call(self, call: ast.Call) -> None:
+        if not isinstance(call.func, ast.Attribute):
+            return
+        owner = self.qualify(call.func.value)
+
+        if call.func.attr == "add_url_rule":
+            rule = _literal_str(call.args[0]) if call.args else _literal_str(_keyword(call, "rule"))
+            view_node = call.args[2] if len(call.args) > 2 else _keyword(call, "view_func")
+            if rule is not None and view_node is not None:
+                self.scan.routes.append(StaticRoute(owner, rule, _methods(call), self.qualify(view_node)))
+
+        elif call.func.attr == "register_blueprint" and call.args:
+            self.scan.registrations.append(StaticRegistration(
+                owner=owner,
+                blueprint=self.qualify(call.args[0]),
+                url_prefix=_literal_str(_keyword(call, "url_prefix"))
+            ))
+
+    def _annotation(self, node: Optional[ast.expr]) -> Optional[str]:
+        # String annotations stay text: the runtime driver does not resolve them either.
+        if node is None or isinstance(node, ast.Constant):
+            return None if node is None else ast.unparse(node)
+        return self.qualify(node)
+
+def _flatten(body: List[ast.stmt]):
+    """
+    Statements of a body, descending into 'if'/'with'/'try'/'for' blocks:
+    registrations guarded by them are still registrations.
+    """
+    for node in body:
+        if isinstance(node, (ast.If, ast.With, ast.AsyncWith, ast.Try, ast.For, ast.AsyncFor, ast.While)):
+            for attr in ("body", "orelse", "finalbody"):
+                yield from _flatten(getattr(node, attr, []))
+            for handler in getattr(node, "handlers", []):
+                yield from _flatten(handler.body)
+        else:
+            yield node
+
+def _join(prefix: str, name: str) -> str:
+    return f"{prefix}.{name}" if prefix else name
+
+def _model_fields(node: ast.ClassDef) -> List[StaticField]:
+    """Annotated class attributes, read the way pydantic turns them into JSON Schema properties."""
+    fields = []
+    for stmt in node.body:
+        if not (isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name)):
+            continue
+        name = stmt.target.id
+        annotation = ast.unparse(stmt.annotation)
+        if name.startswith("_") or annotation.startswith(("ClassVar", "typing.ClassVar")):
+            continue
+
+        required, description = stmt.value is None, None
+        value = stmt.value
+        if isinstance(value, ast.Call) and (_dotted_name(value.func) or "").endswith("Field"):
+            has_default = (
+                (value.args and not _is_ellipsis(value.args[0]))
+                or any(kw.arg in ("default", "default_factory") for kw in value.keywords)
+            )
+            required = not has_default
+            description = _literal_str(_keyword(value, "description"))
+            name = _literal_str(_keyword(value, "alias")) or name
+
+        base_type = annotation.split("[", 1)[0]
+        fields.append(StaticField(name, JSON_TYPES.get(base_type), required, description))
+    return fields
+
+def _dotted_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        prefix = _dotted_name(node.value)
+        return f"{prefix}.{node.attr}" if prefix else None
+    return None
+
+def _keyword(call: ast.Call, name: str) -> Optional[ast.expr]:
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return keyword.value
+    return None
+
+def _literal_str(node: Optional[ast.expr]) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+def _is_ellipsis(node: ast.expr) -> bool:
+    return isinstance(node, ast.Constant) and node.value is Ellipsis
+
+def _is_dunder_name(node: Optional[ast.expr]) -> bool:
+    return isinstance(node, ast.Name) and node.id == "__name__"
+
+def _methods(call: ast.Call) -> List[str]:
+    """Literal 'methods=[...]' of a route, GET (Flask's default) when absent or dynamic."""
+    node = _keyword(call, "methods")
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        methods = [m.upper() for m in map(_literal_str, node.elts) if m]
+        if methods:
+            return list(dict.fromkeys(methods))
+    return ["GET"]
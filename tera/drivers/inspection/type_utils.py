@@ -1,4 +1,5 @@
 import dataclasses
+from functools import lru_cache
 from typing import Any, Dict
 try:
     from pydantic import BaseModel
@@ -20,10 +21,12 @@ def is_pydantic_model(type_hint: Any) -> bool:
         
     return issubclass(type_hint, BaseModel)
 
+@lru_cache(maxsize=None)
 def get_pydantic_schema(model_class: Any) -> Dict[str, Any]:
     """
     Extracts JSON Schema from a Pydantic model.
     Supports Pydantic V2 (model_json_schema) and V1 (schema).
+    Computed once per class: treat the result as read-only.
     """
     if not is_pydantic_model(model_class):
         return {}
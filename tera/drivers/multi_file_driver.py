@@ -0,0 +1,134 @@
+import os
+import yaml
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from tera.domain import TeraSchema, TeraFragment
+from tera.contracts import TeraDriver
+from tera.exceptions import TeraError
+from tera.core import includes, timings, yaml_io
+from tera.adapters import CompiledSchemaCache, FragmentCache
+
+# Below this many fragments to parse, starting worker processes costs more than parsing.
+PARALLEL_MIN_FRAGMENTS = 8
+MANIFEST_KEYS = {"api", "models", "endpoints", includes.INCLUDE_KEY}
+
+class MultiFileDriver(TeraDriver):
+    """
+    Concrete implementation of TeraDriver for a source split across files.
+    The manifest ('api.yaml', or the directory holding it) has the 'api' block, optional
+    'models'/'endpoints' and 'include' glob patterns (default: 'endpoints/**/*.yaml').
+    Each fragment has 'endpoints' and optionally 'models' (a bare list of endpoints also works).
+    Fragments are parsed and validated independently, by a process pool when many of them
+    changed, then merged in include order into one TeraSchema.
+    With a 'compiled_cache', validated fragments are cached by content hash,
+    so editing one file re-parses only that file.
+    """
+    def __init__(
+        self,
+        source: Union[str, Path],
+        compiled_cache: Optional[CompiledSchemaCache] = None,
+        jobs: int = 0
+    ):
+        self.manifest_path = includes.manifest_path(source)
+        self.fragment_cache = FragmentCache(compiled_cache.cache_dir) if compiled_cache else None
+        self.jobs = jobs
+
+    def load(self) -> TeraSchema:
+        if not self.manifest_path.exists():
+            raise FileNotFoundError(f"The file '{self.manifest_path}' does not exist.")
+
+        try:
+            with timings.stage("parse"):
+                manifest = includes.load_manifest(self.manifest_path)
+                fragment_paths = includes.resolve_includes(self.manifest_path, includes.include_patterns(manifest))
+        except yaml.YAMLError as e:
+            raise TeraError("YAML Parsing Error", f"Invalid YAML syntax in '{self.manifest_path}': {e}")
+        except ValueError as e:
+            raise TeraError("Schema Validation Error", str(e))
+
+        fragments = self._load_fragments(fragment_paths)
+
+        try:
+            with timings.stage("validate") as stage:
+                unknown = sorted(set(manifest) - MANIFEST_KEYS)
+                if unknown:
+                    raise ValueError(f"Unknown key(s) in manifest '{self.manifest_path}': {', '.join(unknown)}")
+
+                endpoints = list(manifest.get("endpoints") or [])
+                models: Dict[str, Any] = dict(manifest.get("models") or {})
+                origins = {name: self.manifest_path for name in models}
+
+                for path, fragment in zip(fragment_paths, fragments):
+                    endpoints.extend(fragment.endpoints)
+                    for name, model in (fragment.models or {}).items():
+                        if name in origins:
+                            raise ValueError(f"Body model '{name}' is defined in both '{origins[name]}' and '{path}'.")
+                        models[name], origins[name] = model, path
+
+                # Fragment endpoints/models are already validated instances: pydantic keeps them as is.
+                schema = TeraSchema(
+                    api=manifest.get("api"),
+                    endpoints=endpoints,
+                    models=models or None
+                )
+                stage.items = len(schema.endpoints)
+        except Exception as e:
+            raise TeraError("Schema Validation Error", f"Could not load Tera Schema: {e}")
+
+        return schema
+
+    def _load_fragments(self, paths: List[Path]) -> List[TeraFragment]:
+        fragments: List[Optional[TeraFragment]] = [None] * len(paths)
+        keys: Dict[int, str] = {}
+
+        if self.fragment_cache:
+            with timings.stage("cache", items=len(paths)):
+                for position, path in enumerate(paths):
+                    keys[position] = self.fragment_cache.compute_key(path)
+                    cached = self.fragment_cache.load(path, key=keys[position])
+                    if cached:
+                        fragments[position] = cached[0]
+
+        missing = [position for position, fragment in enumerate(fragments) if fragment is None]
+        with timings.stage("parse", items=len(missing)):
+            jobs = min(self.jobs if self.jobs > 0 else (os.cpu_count() or 1), len(missing))
+            targets = [paths[position] for position in missing]
+            if jobs <= 1 or len(missing) < PARALLEL_MIN_FRAGMENTS:
+                results = [load_fragment(path) for path in targets]
+            else:
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    results = list(pool.map(load_fragment, targets, chunksize=max(1, len(targets) // (jobs * 4))))
+
+        for position, (fragment, error) in zip(missing, results):
+            if error:
+                raise TeraError(*error)
+            fragments[position] = fragment
+            if self.fragment_cache:
+                self.fragment_cache.store(paths[position], fragment, key=keys[position])
+        return fragments
+
+def load_fragment(path: Path) -> Tuple[Optional[TeraFragment], Optional[Tuple[str, str]]]:
+    """
+    Parses and validates one fragment file (process pool entry point).
+    Returns (fragment, None) or (None, (error title, message)): TeraError does not survive pickling.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml_io.safe_load(f)
+    except yaml.YAMLError as e:
+        return None, ("YAML Parsing Error", f"Invalid YAML syntax in '{path}': {e}")
+    except OSError as e:
+        return None, ("File Not Found", str(e))
+
+    if data is None:
+        data = {}
+    elif isinstance(data, list):
+        data = {"endpoints": data}
+
+    try:
+        if not isinstance(data, dict):
+            raise ValueError("a fragment must be a mapping with 'endpoints'/'models' or a list of endpoints.")
+        return TeraFragment(**data), None
+    except Exception as e:
+        return None, ("Schema Validation Error", f"Invalid fragment '{path}': {e}")
@@ -1,31 +1,50 @@
 import yaml
 from pathlib import Path
+from typing import Optional
 from tera.domain import TeraSchema
 from tera.contracts import TeraDriver
 from tera.exceptions import TeraError
+from tera.core import timings, yaml_io
+from tera.adapters import CompiledSchemaCache
 
 class YamlFileDriver(TeraDriver):
     """
     Concrete implementation of TeraDriver.
     Reads a YAML file from disk and converts it to TeraSchema.
+    With a 'compiled_cache', a schema validated by a previous command is rehydrated instead.
     """
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, compiled_cache: Optional[CompiledSchemaCache] = None):
         self.file_path = file_path
+        self.compiled_cache = compiled_cache
 
     def load(self) -> TeraSchema:
         if not self.file_path.exists():
             raise FileNotFoundError(f"The file '{self.file_path}' does not exist.")
 
+        key = None
+        if self.compiled_cache:
+            key = self.compiled_cache.compute_key(self.file_path)
+            with timings.stage("cache"):
+                cached = self.compiled_cache.load(self.file_path, key=key)
+            if cached:
+                return cached[0]
+
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                raw_data = yaml.safe_load(f)
+            with timings.stage("parse"), open(self.file_path, 'r', encoding='utf-8') as f:
+                raw_data = yaml_io.safe_load(f)
 
             if raw_data is None:
                 raise ValueError("The YAML file is empty.")
 
-            return TeraSchema(**raw_data)
+            with timings.stage("validate") as stage:
+                schema = TeraSchema(**raw_data)
+                stage.items = len(schema.endpoints)
 
         except yaml.YAMLError as e:
             raise TeraError("YAML Parsing Error", f"Invalid YAML syntax: {e}")
         except Exception as e:
-            raise TeraError("Schema Validation Error", f"Could not load Tera Schema: {e}")
\ No newline at end of file
+            raise TeraError("Schema Validation Error", f"Could not load Tera Schema: {e}")
+
+        if self.compiled_cache:
+            self.compiled_cache.store(self.file_path, schema, key=key)
+        return schema
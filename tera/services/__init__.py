@@ -1,3 +1,6 @@
-from .pipeline import run_pipeline
+from .pipeline import run_pipeline, run_writers
 from .init import InitService
-from .linter import LinterService
\ No newline at end of file
+from .linter import LinterService
+from .incremental import IncrementalBuilder, BuildCycle
+from .watcher import FileWatcher
+from .differ import DiffService
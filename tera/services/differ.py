@@ -0,0 +1,312 @@
+import hashlib
+import json
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from tera.core import factory, includes, timings, yaml_io
+from tera.domain import TeraSchema
+from tera.domain.diffing import ChangeKind, SpecChange, DiffReport
+from tera.adapters.inference import SchemaInferrer
+from tera.adapters.git_source import GitSource
+
+HTTP_METHODS = ("get", "post", "put", "delete", "patch", "options", "head")
+SECTIONS = ("auth", "params", "body", "responses", "meta")
+# Path parameters are matched by position: renaming '{id}' to '{user_id}' keeps the endpoint
+# and its parameter ('path:#1').
+_PATH_PARAM = re.compile(r"\{([^}]*)\}")
+
+EndpointKey = Tuple[str, str]
+
+class EndpointEntry:
+    """
+    Normalized view of one operation (same shape for Tera and OpenAPI sources),
+    with a digest per section and one for the whole endpoint.
+    """
+    __slots__ = ("label", "view", "digests", "digest")
+
+    def __init__(self, label: str, view: Dict[str, Any]):
+        self.label = label
+        self.view = view
+        self.digests = {section: _digest(view[section]) for section in SECTIONS}
+        self.digest = hashlib.sha1(b"".join(self.digests.values())).digest()
+
+class SpecIndex:
+    """Endpoints of one version of an API, indexed by (method, path template)."""
+    def __init__(self, name: str, entries: Dict[EndpointKey, EndpointEntry]):
+        self.name = name
+        self.entries = entries
+
+class DiffService:
+    """
+    Compares two versions of an API: Tera sources (single file, multi-file, Flask app),
+    OpenAPI documents (JSON/YAML), or either of them read from git ('<rev>:<path>').
+    Endpoints are matched by (method, path) and skipped when their digests are equal;
+    only the sections whose digest differs are compared field by field.
+    """
+    def diff(self, old_source: str, new_source: str) -> DiffReport:
+        with timings.stage("load"):
+            old, new = self.load(old_source), self.load(new_source)
+        with timings.stage("diff", items=len(old.entries) + len(new.entries)):
+            return compare(old, new)
+
+    def load(self, source: str) -> SpecIndex:
+        path = Path(source)
+        if path.exists():
+            return SpecIndex(source, _index(_load_local(path)))
+
+        git_source = GitSource.parse(source)
+        if git_source:
+            return SpecIndex(source, _index(_load_git(git_source)))
+
+        # Anything else the build accepts (e.g. a 'module:app' Flask string).
+        return SpecIndex(source, _index(factory.get_driver(source).load()))
+
+def compare(old: SpecIndex, new: SpecIndex) -> DiffReport:
+    report = DiffReport(old=old.name, new=new.name)
+    changes = report.changes
+
+    for key, entry in old.entries.items():
+        if key not in new.entries:
+            changes.append(SpecChange(endpoint=entry.label, section="endpoint", kind=ChangeKind.REMOVED, breaking=True))
+
+    for key, entry in new.entries.items():
+        previous = old.entries.get(key)
+        if previous is None:
+            changes.append(SpecChange(endpoint=entry.label, section="endpoint", kind=ChangeKind.ADDED))
+        elif previous.digest == entry.digest:
+            report.unchanged += 1
+        else:
+            for section in SECTIONS:
+                if previous.digests[section] != entry.digests[section]:
+                    changes.extend(_COMPARATORS[section](entry.label, previous.view[section], entry.view[section]))
+    return report
+
+# --- Loading -------------------------------------------------------------------
+
+def _load_local(path: Path) -> Any:
+    """A TeraSchema, or the raw dict of an OpenAPI document."""
+    if includes.is_manifest(path) or path.suffix not in (".json", ".yaml", ".yml"):
+        return factory.get_driver(path).load()
+    return _parse_document(path.read_bytes(), path.suffix, str(path))
+
+def _load_git(source: GitSource) -> Any:
+    kind = source.object_type()
+    if kind == "blob":
+        content = source.read()
+        suffix = Path(source.path).suffix
+        if not includes.is_manifest_content(content):
+            return _parse_document(content, suffix, source.object_name)
+        tree, manifest_name = source.parent(), Path(source.path).name
+    else:
+        tree, manifest_name = source, ""
+
+    # Multi-file source: its directory is exported from the object store to a scratch directory.
+    with tempfile.TemporaryDirectory(prefix="tera-diff-") as scratch:
+        tree.export_tree(Path(scratch))
+        return factory.get_driver(Path(scratch) / manifest_name).load()
+
+def _parse_document(content: bytes, suffix: str, name: str) -> Any:
+    data = json.loads(content) if suffix == ".json" else yaml_io.safe_load(content.decode("utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"'{name}' is neither a Tera schema nor an OpenAPI document.")
+    if "openapi" in data or "swagger" in data:
+        return data
+    return TeraSchema(**data)
+
+def _index(spec: Any) -> Dict[EndpointKey, EndpointEntry]:
+    views = _tera_views(spec) if isinstance(spec, TeraSchema) else _openapi_views(spec)
+    return {
+        (method, _PATH_PARAM.sub("{}", path)): EndpointEntry(f"{method} {path}", view)
+        for method, path, view in views
+    }
+
+def _param_key(path: str, location: Optional[str], name: Optional[str]) -> str:
+    """'query:page'; path parameters are keyed by their position in the template ('path:#1')."""
+    if location == "path":
+        names = _PATH_PARAM.findall(path)
+        if name in names:
+            return f"path:#{names.index(name) + 1}"
+    return f"{location}:{name}"
+
+def _tera_views(schema: TeraSchema) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    # Types are the ones the OpenAPI export gives (inferred from the examples), so a Tera
+    # source and its own export compare equal.
+    inferrer, resolve = SchemaInferrer(), _Resolver({})
+    type_of = lambda field: _schema_type(resolve, inferrer.infer(field.example))
+
+    for ep in schema.endpoints:
+        params = {}
+        if ep.params:
+            for location in ("path", "query", "header"):
+                for field in getattr(ep.params, location):
+                    params[_param_key(ep.path, location, field.name)] = {
+                        "type": type_of(field), "required": field.required
+                    }
+
+        success = ep.responses.success
+        responses = {str(success.status): {"description": success.description, "example": success.example}}
+        for error in ep.responses.errors:
+            responses[str(error.status)] = {"description": error.message, "example": error.example}
+
+        yield ep.method, ep.path, {
+            "auth": ep.auth_required,
+            "params": params,
+            "body": {field.name: {"type": type_of(field), "required": field.required} for field in schema.body_fields(ep)},
+            "responses": responses,
+            "meta": {"summary": ep.summary, "description": ep.description, "tag": ep.tag},
+        }
+
+def _openapi_views(document: Dict[str, Any]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    resolve = _Resolver(document)
+    global_auth = bool(document.get("security"))
+
+    for path, path_item in (document.get("paths") or {}).items():
+        path_item = resolve(path_item)
+        for method, operation in path_item.items():
+            if method not in HTTP_METHODS:
+                continue
+
+            params = {}
+            for param in [*path_item.get("parameters", []), *operation.get("parameters", [])]:
+                param = resolve(param)
+                params[_param_key(path, param.get("in"), param.get("name"))] = {
+                    "type": _schema_type(resolve, param.get("schema")), "required": bool(param.get("required"))
+                }
+
+            responses = {}
+            for status, response in (operation.get("responses") or {}).items():
+                response = resolve(response)
+                content = (response.get("content") or {}).get("application/json") or {}
+                responses[str(status)] = {"description": response.get("description"), "example": content.get("example")}
+
+            security = operation.get("security")
+            yield method.upper(), path, {
+                "auth": global_auth if security is None else bool(security),
+                "params": params,
+                "body": _body_fields(resolve, operation.get("requestBody")),
+                "responses": responses,
+                "meta": {
+                    "summary": operation.get("summary"),
+                    "description": operation.get("description"),
+                    "tag": (operation.get("tags") or [None])[0],
+                },
+            }
+
+class _Resolver:
+    """Follows local '$ref's ('#/components/...') of an OpenAPI document."""
+    def __init__(self, document: Dict[str, Any]):
+        self.document = document
+
+    def __call__(self, node: Any) -> Any:
+        seen = set()
+        while isinstance(node, dict) and isinstance(node.get("$ref"), str) and node["$ref"] not in seen:
+            seen.add(node["$ref"])
+            target: Any = self.document
+            for part in node["$ref"].lstrip("#/").split("/"):
+                target = target.get(part.replace("~1", "/").replace("~0", "~"), {}) if isinstance(target, dict) else {}
+            node = target
+        return node if node is not None else {}
+
+def _body_fields(resolve: _Resolver, request_body: Any) -> Dict[str, Any]:
+    if not request_body:
+        return {}
+    content = (resolve(request_body).get("content") or {}).get("application/json") or {}
+    fields: Dict[str, Any] = {}
+
+    def collect(schema: Any) -> None:
+        schema = resolve(schema)
+        for part in schema.get("allOf", []):
+            collect(part)
+        required = set(schema.get("required") or [])
+        for name, prop in (schema.get("properties") or {}).items():
+            fields[name] = {"type": _schema_type(resolve, prop), "required": name in required}
+
+    collect(content.get("schema"))
+    return fields
+
+def _schema_type(resolve: _Resolver, schema: Any) -> Optional[str]:
+    if isinstance(schema, dict) and "$ref" in schema:
+        return schema["$ref"].rsplit("/", 1)[-1]
+    schema = resolve(schema)
+    kind = schema.get("type")
+    if kind == "array":
+        return f"array[{_schema_type(resolve, schema.get('items'))}]"
+    return kind
+
+def _digest(value: Any) -> bytes:
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode()).digest()
+
+# --- Classification ------------------------------------------------------------
+
+def _compare_auth(label: str, old: bool, new: bool) -> List[SpecChange]:
+    # Requiring credentials breaks existing clients; dropping the requirement does not.
+    return [SpecChange(endpoint=label, section="auth", kind=ChangeKind.CHANGED, old=old, new=new, breaking=new)]
+
+def _compare_fields(section: str):
+    """
+    Params and body fields: removing one, adding a required one, making one required
+    or changing its type breaks clients; the other changes do not.
+    """
+    def compare_fields(label: str, old: Dict[str, Any], new: Dict[str, Any]) -> List[SpecChange]:
+        changes = []
+        for name, field in old.items():
+            if name not in new:
+                changes.append(SpecChange(
+                    endpoint=label, section=section, name=name, kind=ChangeKind.REMOVED, old=field, breaking=True
+                ))
+        for name, field in new.items():
+            previous = old.get(name)
+            if previous is None:
+                changes.append(SpecChange(
+                    endpoint=label, section=section, name=name, kind=ChangeKind.ADDED,
+                    new=field, breaking=bool(field["required"])
+                ))
+                continue
+            for attribute in ("type", "required"):
+                if previous[attribute] != field[attribute]:
+                    changes.append(SpecChange(
+                        endpoint=label, section=section, name=f"{name}.{attribute}", kind=ChangeKind.CHANGED,
+                        old=previous[attribute], new=field[attribute],
+                        breaking=attribute == "type" or bool(field[attribute])
+                    ))
+        return changes
+    return compare_fields
+
+def _compare_responses(label: str, old: Dict[str, Any], new: Dict[str, Any]) -> List[SpecChange]:
+    """Removing a success (2xx) response breaks clients; every other response change does not."""
+    changes = []
+    for status, response in old.items():
+        if status not in new:
+            changes.append(SpecChange(
+                endpoint=label, section="response", name=status, kind=ChangeKind.REMOVED,
+                old=response["description"], breaking=status.startswith("2")
+            ))
+    for status, response in new.items():
+        previous = old.get(status)
+        if previous is None:
+            changes.append(SpecChange(
+                endpoint=label, section="response", name=status, kind=ChangeKind.ADDED, new=response["description"]
+            ))
+        elif previous != response:
+            for attribute in ("description", "example"):
+                if previous[attribute] != response[attribute]:
+                    changes.append(SpecChange(
+                        endpoint=label, section="response", name=f"{status}.{attribute}", kind=ChangeKind.CHANGED,
+                        old=previous[attribute], new=response[attribute]
+                    ))
+    return changes
+
+def _compare_meta(label: str, old: Dict[str, Any], new: Dict[str, Any]) -> List[SpecChange]:
+    return [
+        SpecChange(endpoint=label, section="meta", name=name, kind=ChangeKind.CHANGED, old=old.get(name), new=value)
+        for name, value in new.items() if old.get(name) != value
+    ]
+
+_COMPARATORS = {
+    "auth": _compare_auth,
+    "params": _compare_fields("param"),
+    "body": _compare_fields("body"),
+    "responses": _compare_responses,
+    "meta": _compare_meta,
+}
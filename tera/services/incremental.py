@@ -0,0 +1,52 @@
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence, Tuple
+from tera.core import factory
+from tera.adapters import TeraOpenApiAdapter, OperationCache, SchemaInferrer
+from tera.services.pipeline import run_writers
+
+@dataclass
+class BuildCycle:
+    """Outcome of one incremental rebuild."""
+    elapsed: float
+    endpoints: int
+    rebuilt: int
+    reused: int
+    removed: int
+
+class IncrementalBuilder:
+    """
+    Keeps the conversion state warm between builds of the same input (watch mode).
+    Each cycle reloads the source, but only endpoints whose (method, path) entry
+    changed are converted again; unchanged operations come from the OperationCache.
+    """
+    def __init__(self, input_source: str, outputs: List[Tuple[Path, str]], template_dirs: Sequence[Path] = ()):
+        self.input_source = input_source
+        self.outputs = outputs
+        self.template_dirs = template_dirs
+        self.operations = OperationCache()
+        self.inferrer = SchemaInferrer()
+
+    def build(self) -> BuildCycle:
+        start = time.perf_counter()
+        self.operations.begin_cycle()
+
+        schema = factory.get_driver(self.input_source).load()
+
+        # Registers the warm adapter as the schema's shared one, so every writer reuses it.
+        TeraOpenApiAdapter.for_schema(schema, inferrer=self.inferrer, operation_cache=self.operations)
+
+        writers = [
+            factory.get_writer(path, format_style=style, template_dirs=self.template_dirs)
+            for path, style in self.outputs
+        ]
+        run_writers(schema, writers)
+
+        return BuildCycle(
+            elapsed=time.perf_counter() - start,
+            endpoints=len(schema.endpoints),
+            rebuilt=self.operations.rebuilt,
+            reused=self.operations.reused,
+            removed=self.operations.prune()
+        )
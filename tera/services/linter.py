@@ -1,40 +1,127 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
-from pydantic import ValidationError
-from tera.core import TeraConfig
-from tera.domain import TeraSchema
-from tera.domain.linting import LintIssue, LintSeverity
-from tera.adapters import FileLoader
-from tera.services.rules import ALL_RULES
+from typing import Any, List, Dict, Optional, Sequence, Set, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from tera.core import TeraConfig, factory, includes, timings
+from tera.domain import TeraSchema, TeraFragment
+from tera.domain.linting import LintIssue, LintSeverity, LintFileReport, LintReport
+from tera.adapters import FileLoader, SourceIndex, CompiledSchemaCache
+from tera.exceptions import TeraError
+from tera.services.rules import RuleEngine
+
+# What a linted file is: a single-file schema, the manifest of a multi-file source
+# (linted as the merged schema), or a fragment of one (validated on its own).
+SINGLE_FILE = "file"
+MULTI_FILE = "source"
+FRAGMENT = "fragment"
 
 class LinterService:
     """
     Reads and validates Tera documentation files (YAML/JSON). 
+    A multi-file source is linted through its manifest, as the merged schema; a fragment
+    linted without its manifest is validated as a TeraFragment.
+    With a 'compiled_cache', files that already passed validation skip parsing and validation.
     """
-    def __init__(self, config: Optional[TeraConfig] = None):
+    def __init__(
+        self,
+        config: Optional[TeraConfig] = None,
+        profile_rules: bool = False,
+        compiled_cache: Optional[CompiledSchemaCache] = None
+    ):
+        self.config = config
         self.ignore_list = config.lint.ignore if config else []
+        self.profile_rules = profile_rules
+        self.compiled_cache = compiled_cache
+        self.rule_timings: Dict[str, float] = {}
+
+    def lint_files(self, files: Sequence[Path], jobs: int = 1) -> LintReport:
+        """
+        Lints several files and aggregates the results, keeping the input order.
+        Fragments of a multi-file source whose manifest is in 'files' are linted with it, not on their own.
+        With jobs > 1 (or 0 for one per CPU), files are spread across a process pool;
+        the stages timed in the workers are then reported to this process' timing hooks.
+        """
+        targets = lint_targets(files)
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        jobs = min(jobs, len(targets))
+
+        with timings.stage("lint", items=len(targets)):
+            collect = jobs > 1 and timings.enabled()
+            tasks = [
+                (self.config, path, kind, self.profile_rules, self.compiled_cache, collect) for path, kind in targets
+            ]
+            if jobs <= 1:
+                reports = [_lint_one(task) for task in tasks]
+            else:
+                chunksize = max(1, len(tasks) // (jobs * 4))
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    reports = list(pool.map(_lint_one, tasks, chunksize=chunksize))
+                for report in reports:
+                    for record in report.stages:
+                        timings.emit(timings.StageRecord(**record))
+
+        return LintReport(files=reports)
+
+    def lint(self, file_path: Path, kind: Optional[str] = None) -> List[LintIssue]:
+        """Lints one file; 'kind' (SINGLE_FILE, MULTI_FILE, FRAGMENT) is detected when not given."""
+        kind = kind or source_kind(file_path)
+        if kind == MULTI_FILE:
+            return self._lint_source(file_path)
+
+        key = None
+        if self.compiled_cache and kind == SINGLE_FILE and file_path.is_file():
+            key = self.compiled_cache.compute_key(file_path)
+            with timings.stage("cache"):
+                cached = self.compiled_cache.load(file_path, key=key, require_index=True)
+            if cached:
+                return self._run_rules(*cached)
 
-    def lint(self, file_path: Path) -> List[LintIssue]:
-        raw_data, issues = FileLoader.load(file_path)
+        with timings.stage("parse"):
+            raw_data, issues, source_index = FileLoader.load_with_index(file_path)
         if raw_data is None:
             return issues
 
-        schema_issues = self._validate_structure(raw_data)
+        if kind == FRAGMENT:
+            # Rules need the 'api' block of the manifest: they run when the manifest is linted.
+            with timings.stage("validate"):
+                _, fragment_issues = self._validate_structure(raw_data, source_index, TeraFragment)
+            return self._filter_ignored(issues + fragment_issues)
+
+        with timings.stage("validate") as stage:
+            schema, schema_issues = self._validate_structure(raw_data, source_index)
+            stage.items = len(schema.endpoints) if schema else None
         issues.extend(schema_issues)
         
-        if any(i.severity == LintSeverity.ERROR for i in issues):
+        if schema is None or any(i.severity == LintSeverity.ERROR for i in issues):
             return issues
 
+        if key:
+            self.compiled_cache.store(file_path, schema, source_index, key=key)
+        return self._run_rules(schema, source_index, issues)
+
+    def _lint_source(self, manifest: Path) -> List[LintIssue]:
+        """A multi-file source is loaded (merged and validated) by its driver, then linted as one schema."""
+        driver = factory.load_driver_class("yaml-multi")(manifest, compiled_cache=self.compiled_cache, jobs=1)
         try:
-            schema = TeraSchema(**raw_data)
-            for rule_function in ALL_RULES:
-                issues.extend(rule_function(schema))
-        except Exception as e:
-             issues.append(LintIssue(
-                code="rule_engine_error", 
-                message=str(e), 
-                severity=LintSeverity.ERROR
-            ))
+            schema = driver.load()
+        except TeraError as e:
+            code = "yaml_syntax" if e.title == "YAML Parsing Error" else "schema_error"
+            return [LintIssue(code=code, message=e.message, severity=LintSeverity.ERROR)]
+        except FileNotFoundError as e:
+            return [LintIssue(code="file_not_found", message=str(e), severity=LintSeverity.ERROR)]
+        return self._run_rules(schema, None)
+
+    def _run_rules(
+        self, schema: TeraSchema, source_index: Optional[SourceIndex], issues: Optional[List[LintIssue]] = None
+    ) -> List[LintIssue]:
+        issues = list(issues or [])
+        engine = RuleEngine(profile=self.profile_rules, source_index=source_index)
+        with timings.stage("rules", items=len(schema.endpoints)):
+            issues.extend(engine.run(schema))
+        for name, elapsed in engine.timings.items():
+            self.rule_timings[name] = self.rule_timings.get(name, 0.0) + elapsed
 
         return self._filter_ignored(issues)
     
@@ -49,17 +136,81 @@ class LinterService:
         
         return filtered
 
-    def _validate_structure(self, data: Dict) -> List[LintIssue]:
+    def _validate_structure(
+        self, data: Any, source_index: Optional[SourceIndex] = None, model: Type[BaseModel] = TeraSchema
+    ) -> Tuple[Optional[BaseModel], List[LintIssue]]:
+        """Validates the raw data once, returning the schema (or None) and the schema errors."""
         issues = []
+        # A fragment may be a bare list of endpoints; positions are then looked up without the 'endpoints' key.
+        bare_list = model is TeraFragment and isinstance(data, list)
+        if model is TeraFragment and data is None:
+            data = {}
         try:
-            TeraSchema(**data)
+            return model.model_validate({"endpoints": data} if bare_list else data), issues
         except ValidationError as e:
             for err in e.errors():
                 loc = " -> ".join(str(x) for x in err['loc'])
+                node = err['loc'][1:] if bare_list else err['loc']
+                position = source_index.lookup(node) if source_index else None
                 issues.append(LintIssue(
                     code="schema_error",
                     message=err['msg'],
                     severity=LintSeverity.ERROR,
-                    location=loc
+                    location=loc,
+                    line=position[0] if position else None,
+                    column=position[1] if position else None
                 ))
-        return issues
\ No newline at end of file
+        return None, issues
+
+
+def source_kind(path: Path, fragments_of=includes.manifest_fragments) -> str:
+    """SINGLE_FILE, MULTI_FILE (the manifest of a multi-file source) or FRAGMENT (a file it includes)."""
+    if path.suffix in (".yaml", ".yml"):
+        if includes.is_source_manifest(path):
+            return MULTI_FILE
+        if includes.enclosing_manifest(path, fragments_of) is not None:
+            return FRAGMENT
+    return SINGLE_FILE
+
+def lint_targets(files: Sequence[Path]) -> List[Tuple[Path, str]]:
+    """
+    (file, kind) of each file to lint, in order. Fragments of a manifest that is also
+    being linted are dropped: linting the manifest covers them.
+    """
+    fragments: Dict[Path, List[Path]] = {}
+
+    def fragments_of(manifest: Path) -> List[Path]:
+        key = manifest.resolve()
+        if key not in fragments:
+            fragments[key] = includes.manifest_fragments(manifest)
+        return fragments[key]
+
+    targets = [(path, source_kind(path, fragments_of)) for path in files]
+    covered: Set[Path] = {
+        fragment.resolve() for path, kind in targets if kind == MULTI_FILE for fragment in fragments_of(path)
+    }
+    return [(path, kind) for path, kind in targets if kind == MULTI_FILE or path.resolve() not in covered]
+
+def _lint_one(
+    task: Tuple[Optional[TeraConfig], Path, str, bool, Optional[CompiledSchemaCache], bool]
+) -> LintFileReport:
+    """
+    Process pool entry point: lints one file with a service built from the given config.
+    With 'collect_stages', the stage timings are returned in the report for the parent process.
+    """
+    config, path, kind, profile_rules, compiled_cache, collect_stages = task
+    service = LinterService(config=config, profile_rules=profile_rules, compiled_cache=compiled_cache)
+
+    records: List[timings.StageRecord] = []
+    if collect_stages:
+        timings.add_hook(records.append)
+    try:
+        issues = service.lint(Path(path), kind)
+    finally:
+        if collect_stages:
+            timings.remove_hook(records.append)
+
+    return LintFileReport(
+        path=str(path), issues=issues, rule_timings=service.rule_timings,
+        stages=[record.to_dict() for record in records]
+    )
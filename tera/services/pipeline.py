@@ -1,9 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence, Union
+from tera.core import timings
 from tera.contracts import TeraDriver
 from tera.contracts import TeraWriter
+from tera.domain import TeraSchema
 
-def run_pipeline(driver: TeraDriver, writer: TeraWriter) -> None:
+def run_pipeline(
+    driver: TeraDriver,
+    writers: Union[TeraWriter, Sequence[TeraWriter]],
+    max_workers: Optional[int] = None
+) -> TeraSchema:
     """
-    Connects the IN (driver) to the OUT (writer).
+    Connects the IN (driver) to the OUT (writers).
+    The schema is loaded and validated once and shared by every writer;
+    with several writers, rendering and disk I/O run in a thread pool.
+    Reports the 'load' and 'write' stages to the timing hooks (see tera.core.timings).
     """
-    schema = driver.load()
-    writer.write(schema)
\ No newline at end of file
+    with timings.stage("load") as stage:
+        schema = driver.load()
+        stage.items = len(schema.endpoints)
+    with timings.stage("write", items=len(writers) if isinstance(writers, (list, tuple)) else 1):
+        run_writers(schema, writers, max_workers)
+    return schema
+
+def run_writers(
+    schema: TeraSchema,
+    writers: Union[TeraWriter, Sequence[TeraWriter]],
+    max_workers: Optional[int] = None
+) -> None:
+    """
+    Writes an already loaded schema with every writer (concurrently when there are several).
+    """
+    if not isinstance(writers, (list, tuple)):
+        writers = [writers]
+
+    if len(writers) == 1:
+        writers[0].write(schema)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(writers)) as pool:
+        futures = [pool.submit(writer.write, schema) for writer in writers]
+        for future in futures:
+            future.result()
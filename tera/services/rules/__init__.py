@@ -1 +1,2 @@
-from .semantic import ALL_RULES
\ No newline at end of file
+from .engine import ALL_RULES, Rule, RuleContext, RuleEngine, rule
+from . import semantic
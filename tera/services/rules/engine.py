@@ -0,0 +1,125 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple
+from tera.domain import TeraSchema, Endpoint
+from tera.domain.linting import LintIssue, LintSeverity
+from tera.adapters.source_index import SourceIndex
+
+NodeKind = Literal["api", "endpoint", "param", "body", "response"]
+NODE_KINDS: Tuple[str, ...] = ("api", "endpoint", "param", "body", "response")
+
+@dataclass
+class RuleContext:
+    """
+    Where the visited node lives: the schema, the endpoint it belongs to (if any),
+    a human location ("POST /users") and the node path inside the document.
+    """
+    schema: TeraSchema
+    location: str
+    path: Tuple[Any, ...]
+    endpoint: Optional[Endpoint] = None
+
+RuleFunction = Callable[[Any, RuleContext], Iterable[LintIssue]]
+
+@dataclass
+class Rule:
+    name: str
+    node: str
+    check: RuleFunction
+
+ALL_RULES: List[Rule] = []
+
+def rule(node: NodeKind) -> Callable[[RuleFunction], RuleFunction]:
+    """
+    Registers a function as a lint rule for one node kind.
+    The function receives the node and its RuleContext and returns the issues found.
+    """
+    if node not in NODE_KINDS:
+        raise ValueError(f"Unknown node kind for rule: {node}")
+
+    def register(func: RuleFunction) -> RuleFunction:
+        ALL_RULES.append(Rule(name=func.__name__, node=node, check=func))
+        return func
+    return register
+
+@dataclass
+class RuleEngine:
+    """
+    Runs every rule in a single traversal of the schema:
+    api -> endpoints -> params/body fields/responses -> body model fields,
+    dispatching each node to the rules registered for its kind.
+    With 'profile', the time spent in each rule is accumulated in 'timings'.
+    With a 'source_index', issues without a line get the one of the node they were raised on.
+    """
+    rules: List[Rule] = field(default_factory=lambda: list(ALL_RULES))
+    profile: bool = False
+    timings: Dict[str, float] = field(default_factory=dict)
+    source_index: Optional[SourceIndex] = None
+
+    def __post_init__(self):
+        self._by_node: Dict[str, List[Rule]] = {kind: [] for kind in NODE_KINDS}
+        for r in self.rules:
+            self._by_node[r.node].append(r)
+
+    def run(self, schema: TeraSchema) -> List[LintIssue]:
+        issues: List[LintIssue] = []
+        self._dispatch("api", schema.api, RuleContext(schema, "api", ("api",)), issues)
+
+        wants_params = bool(self._by_node["param"])
+        wants_body = bool(self._by_node["body"])
+        wants_responses = bool(self._by_node["response"])
+
+        for index, ep in enumerate(schema.endpoints):
+            ep_path = ("endpoints", index)
+            ep_loc = f"{ep.method} {ep.path}"
+            self._dispatch("endpoint", ep, RuleContext(schema, ep_loc, ep_path, ep), issues)
+
+            if wants_params and ep.params:
+                for param_in in ("path", "query", "header"):
+                    for i, param in enumerate(getattr(ep.params, param_in)):
+                        ctx = RuleContext(schema, ep_loc, ep_path + ("params", param_in, i), ep)
+                        self._dispatch("param", param, ctx, issues)
+
+            if wants_body:
+                for i, body_field in enumerate(ep.body):
+                    ctx = RuleContext(schema, ep_loc, ep_path + ("body", i), ep)
+                    self._dispatch("body", body_field, ctx, issues)
+
+            if wants_responses:
+                success_ctx = RuleContext(schema, ep_loc, ep_path + ("responses", "success"), ep)
+                self._dispatch("response", ep.responses.success, success_ctx, issues)
+                for i, error in enumerate(ep.responses.errors):
+                    ctx = RuleContext(schema, ep_loc, ep_path + ("responses", "errors", i), ep)
+                    self._dispatch("response", error, ctx, issues)
+
+        # Fields of shared body models are visited once, not once per endpoint using them.
+        if wants_body and schema.models:
+            for name, model in schema.models.items():
+                for i, body_field in enumerate(model.fields):
+                    ctx = RuleContext(schema, f"model {name}", ("models", name, "fields", i))
+                    self._dispatch("body", body_field, ctx, issues)
+
+        return issues
+
+    def _dispatch(self, kind: str, node: Any, ctx: RuleContext, issues: List[LintIssue]) -> None:
+        for r in self._by_node[kind]:
+            start = time.perf_counter() if self.profile else 0.0
+            try:
+                for issue in r.check(node, ctx):
+                    if issue.line is None and self.source_index:
+                        self._locate(issue, ctx.path)
+                    issues.append(issue)
+            except Exception as e:
+                issues.append(LintIssue(
+                    code="rule_engine_error",
+                    message=f"{r.name}: {e}",
+                    severity=LintSeverity.ERROR,
+                    location=ctx.location
+                ))
+            if self.profile:
+                self.timings[r.name] = self.timings.get(r.name, 0.0) + time.perf_counter() - start
+
+    def _locate(self, issue: LintIssue, path: Tuple[Any, ...]) -> None:
+        position = self.source_index.lookup(path)
+        if position:
+            issue.line, issue.column = position
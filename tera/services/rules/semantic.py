@@ -1,52 +1,86 @@
 from typing import List
-from tera.domain import TeraSchema
+from tera.domain import ApiConfig, Endpoint
 from tera.domain.linting import LintIssue, LintSeverity
+from tera.services.rules.engine import rule, RuleContext
 
-def check_general_info(schema: TeraSchema) -> List[LintIssue]:
+WRITE_METHODS = {'POST', 'PUT', 'DELETE', 'PATCH'}
+
+@rule("api")
+def check_general_info(api: ApiConfig, ctx: RuleContext) -> List[LintIssue]:
     issues = []
-    if not schema.api.description:
+    if not api.description:
         issues.append(LintIssue(
             code="missing_api_description",
             message="API definition is missing a general description.",
             severity=LintSeverity.WARNING,
-            location="api"
+            location=ctx.location
         ))
     return issues
 
-def check_endpoints(schema: TeraSchema) -> List[LintIssue]:
-    issues = []
-    write_methods = ['POST', 'PUT', 'DELETE', 'PATCH']
-    
-    for ep in schema.endpoints:
-        ep_loc = f"{ep.method} {ep.path}"
-        
-        # RULE - description or summary
-        if not ep.description and not ep.summary:
-            issues.append(LintIssue(
-                code="missing_description",
-                message="Endpoint lacks summary or description.",
-                severity=LintSeverity.WARNING,
-                location=ep_loc
-            ))
+@rule("endpoint")
+def check_endpoint_description(ep: Endpoint, ctx: RuleContext) -> List[LintIssue]:
+    # RULE - description or summary
+    if not ep.description and not ep.summary:
+        return [LintIssue(
+            code="missing_description",
+            message="Endpoint lacks summary or description.",
+            severity=LintSeverity.WARNING,
+            location=ctx.location
+        )]
+    return []
 
-        # RULE - auth in unsafe methods as delete or put
-        if ep.method in write_methods and not ep.auth_required:
-            issues.append(LintIssue(
-                code="unsafe_operation",
-                message=f"Public {ep.method} endpoint detected.",
-                severity=LintSeverity.WARNING,
-                location=ep_loc
-            ))
-            
-        # RULE -  responses
-        if not ep.responses.success:
-            issues.append(LintIssue(
-                code="missing_response",
-                message="No success response defined.",
-                severity=LintSeverity.WARNING,
-                location=ep_loc
-            ))
+@rule("endpoint")
+def check_unsafe_operation(ep: Endpoint, ctx: RuleContext) -> List[LintIssue]:
+    # RULE - auth in unsafe methods as delete or put
+    if ep.method in WRITE_METHODS and not ep.auth_required:
+        return [LintIssue(
+            code="unsafe_operation",
+            message=f"Public {ep.method} endpoint detected.",
+            severity=LintSeverity.WARNING,
+            location=ctx.location
+        )]
+    return []
 
-    return issues
+@rule("endpoint")
+def check_success_response(ep: Endpoint, ctx: RuleContext) -> List[LintIssue]:
+    # RULE -  responses
+    if not ep.responses.success:
+        return [LintIssue(
+            code="missing_response",
+            message="No success response defined.",
+            severity=LintSeverity.WARNING,
+            location=ctx.location
+        )]
+    return []
+
+@rule("endpoint")
+def check_duplicate_route(ep: Endpoint, ctx: RuleContext) -> List[LintIssue]:
+    # RULE - the same method + path twice: only one of them ends up in the OpenAPI document
+    index = ctx.schema.index()
+    first = index.duplicates.get(ctx.path[1])
+    if first is None:
+        return []
+    return [LintIssue(
+        code="duplicate_route",
+        message=f"{ep.method} {ep.path} is already defined by endpoint #{first + 1}; only one of them is exported.",
+        severity=LintSeverity.ERROR,
+        location=ctx.location
+    )]
 
-ALL_RULES = [check_general_info, check_endpoints]
\ No newline at end of file
+@rule("endpoint")
+def check_operation_id_collision(ep: Endpoint, ctx: RuleContext) -> List[LintIssue]:
+    # RULE - two routes generating the same operationId (e.g. GET /users/list and GET /users-list)
+    index = ctx.schema.index()
+    owner = index.collisions.get(ctx.path[1])
+    if owner is None:
+        return []
+    other = index.endpoints[owner]
+    return [LintIssue(
+        code="operation_id_collision",
+        message=(
+            f"operationId '{index.operation_ids[owner]}' is also generated for {other.method} {other.path}; "
+            f"both are exported with it, rename one of the routes."
+        ),
+        severity=LintSeverity.WARNING,
+        location=ctx.location
+    )]
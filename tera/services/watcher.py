@@ -0,0 +1,98 @@
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+try:
+    from inotify_simple import INotify, flags
+    HAS_INOTIFY = True
+except ImportError:
+    HAS_INOTIFY = False
+    INotify = flags = None
+
+# Editors often save in several steps (truncate + write, or write temp + rename).
+DEBOUNCE_SECONDS = 0.05
+
+class FileWatcher:
+    """
+    Blocks until one of the watched files changes.
+    Uses inotify when 'inotify_simple' is installed (Linux), polling otherwise.
+    Parent directories are watched, so files replaced by rename are still caught.
+    A watched directory changes when a file is created in it or removed from it.
+    """
+    def __init__(self, paths: Iterable[Path], interval: float = 0.3, use_inotify: bool = True):
+        self.paths: List[Path] = []
+        self.interval = interval
+        self._snapshot: Dict[Path, Optional[Tuple[int, int]]] = {}
+        self._inotify = None
+        self._directories: set = set()
+
+        if use_inotify and HAS_INOTIFY:
+            self._inotify = INotify()
+        self.watch(paths)
+
+    def watch(self, paths: Iterable[Path]) -> None:
+        """
+        Replaces the watched paths (e.g. after a rebuild found new fragments). Paths watched
+        before keep their snapshot, so a change made meanwhile is still reported by 'wait'.
+        """
+        self.paths = list(dict.fromkeys(Path(p).resolve() for p in paths))
+        self._snapshot = {
+            path: self._snapshot[path] if path in self._snapshot else self._stat(path) for path in self.paths
+        }
+
+        if self._inotify:
+            mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.DELETE | flags.MODIFY
+            directories = {p.parent for p in self.paths} | {p for p in self.paths if p.is_dir()}
+            for directory in directories - self._directories:
+                if directory.is_dir():
+                    self._inotify.add_watch(str(directory), mask)
+                    self._directories.add(directory)
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._inotify else "polling"
+
+    def wait(self, timeout: Optional[float] = None) -> List[Path]:
+        """
+        Returns the files that changed since the last call (empty list on timeout).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if self._inotify:
+                wait_ms = None if remaining is None else int(remaining * 1000)
+                if self._inotify.read(timeout=wait_ms):
+                    time.sleep(DEBOUNCE_SECONDS)
+                    self._inotify.read(timeout=0)
+            else:
+                time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+            changed = self._changes()
+            if changed:
+                time.sleep(DEBOUNCE_SECONDS)
+                self._snapshot = self._scan()
+                return changed
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+
+    def close(self) -> None:
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
+
+    def _changes(self) -> List[Path]:
+        current = self._scan()
+        return [p for p in self.paths if current.get(p) != self._snapshot.get(p)]
+
+    def _scan(self) -> Dict[Path, Optional[Tuple[int, int]]]:
+        return {path: self._stat(path) for path in self.paths}
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
@@ -1,6 +1,23 @@
-from .json_writer import JsonFileWriter
-from .yaml_writer import YamlFileWriter
-from .openapi_writer import OpenApiJsonWriter, OpenApiYamlWriter
-from .markdown_writer import MarkdownWriter
-from .html_writer import HtmlWriter
-from .postman_writer import PostmanWriter
\ No newline at end of file
+from importlib import import_module
+
+# Writers are exported lazily (PEP 562): importing one of them must not drag in
+# the dependencies of the others (e.g. Jinja2 for Markdown/HTML).
+_EXPORTS = {
+    "JsonFileWriter": ".json_writer",
+    "YamlFileWriter": ".yaml_writer",
+    "OpenApiJsonWriter": ".openapi_writer",
+    "OpenApiYamlWriter": ".openapi_writer",
+    "MarkdownWriter": ".markdown_writer",
+    "SplitMarkdownWriter": ".markdown_writer",
+    "HtmlWriter": ".html_writer",
+    "ChunkedHtmlWriter": ".html_writer",
+    "PostmanWriter": ".postman_writer",
+    "ShardedPostmanWriter": ".postman_writer",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
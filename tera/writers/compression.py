@@ -0,0 +1,63 @@
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+    brotli = None
+
+# Assets are compressed once and served many times: use the strongest settings.
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output byte-identical between builds of the same content.
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+def _brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {"gz": _gzip, "br": _brotli}
+
+def check_formats(formats: Sequence[str]) -> Tuple[str, ...]:
+    """Validates compression format names ('gz', 'br')."""
+    unknown = [name for name in formats if name not in COMPRESSORS]
+    if unknown:
+        raise ValueError(f"Unknown compression format(s): {', '.join(unknown)} (use gz, br)")
+    if "br" in formats and not HAS_BROTLI:
+        raise ImportError("Brotli compression needs the 'brotli' package (pip install 'tera-cli[brotli]').")
+    return tuple(dict.fromkeys(formats))
+
+def write_assets(assets: Iterable[Tuple[Path, bytes]], formats: Sequence[str] = ()) -> List[Path]:
+    """
+    Writes each (path, content) asset, plus a precompressed copy per format
+    next to it ('app.json.gz', 'app.json.br') that static hosts can serve as-is.
+    Assets are written by a thread pool: zlib and brotli release the GIL while compressing.
+    Returns every file written.
+    """
+    formats = check_formats(formats)
+    assets = list(assets)
+    if not assets:
+        return []
+
+    def write_one(asset: Tuple[Path, bytes]) -> List[Path]:
+        path, content = asset
+        written = [path]
+        path.write_bytes(content)
+        for name in formats:
+            compressed = path.with_name(f"{path.name}.{name}")
+            compressed.write_bytes(COMPRESSORS[name](content))
+            written.append(compressed)
+        return written
+
+    workers = min(len(assets), os.cpu_count() or 1) if formats else 1
+    if workers <= 1:
+        results = [write_one(asset) for asset in assets]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(write_one, assets))
+    return [path for written in results for path in written]
@@ -1,38 +1,137 @@
 import json
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from tera.domain import TeraSchema
 from tera.contracts import TeraWriter
 from tera.adapters import TeraOpenApiAdapter
+from tera.core import timings
+from tera.writers.compression import check_formats, write_assets
+from tera.writers.tags import slugify, tag_label
+from tera.writers.templates import get_environment
+
+CHUNK_SUFFIXES = (".json", ".json.gz", ".json.br")
 
 class HtmlWriter(TeraWriter):
     """
     Renders documentation as a standalone HTML file using Redoc.
-    Injects the OpenAPI JSON directly into the HTML template.
+    Injects the OpenAPI JSON directly into the HTML template
+    (tera/templates/redoc.html.j2, unless one of 'template_dirs' overrides it).
     """
-    def __init__(self, output_path: Path):
+    supports_templates = True
+
+    def __init__(self, output_path: Path, template_dirs: Sequence[Path] = ()):
         self.output_path = output_path
-        self.templates_dir = Path(__file__).parent.parent / "templates"
+        self.template_dirs = template_dirs
 
     def write(self, schema: TeraSchema) -> None:
-        adapter = TeraOpenApiAdapter(schema)
+        adapter = TeraOpenApiAdapter.for_schema(schema)
         openapi_dict = adapter.convert()
+
+        with timings.stage("render.html", items=len(schema.endpoints)):
+            html_content = self._render(schema, openapi_dict)
+
+        with timings.stage("write.html"), open(self.output_path, "w", encoding="utf-8") as f:
+            f.write(html_content)
+
+    def _render(self, schema: TeraSchema, openapi_dict: dict) -> str:
         spec_json_str = json.dumps(openapi_dict, ensure_ascii=False)
 
-        env = Environment(
-            loader=FileSystemLoader(self.templates_dir),
-            autoescape=True
-        )
+        env = get_environment(self.template_dirs, autoescape=True)
 
         try:
             template = env.get_template("redoc.html.j2")
         except Exception as e:
             raise FileNotFoundError(f"HTML Template not found: {e}")
 
-        html_content = template.render(
+        return template.render(
             title=schema.api.name,
             spec_json=spec_json_str
         )
 
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
\ No newline at end of file
+class ChunkedHtmlWriter(TeraWriter):
+    """
+    Redoc page for very large APIs. The page only embeds the OpenAPI document without
+    its paths, plus a tag index; the operations of each tag are written to their own
+    JSON chunk under '<name>_chunks/' and fetched the first time the tag is opened.
+    Every asset also gets precompressed copies ('.gz' by default, '.br' on request).
+    Chunks are fetched over HTTP: serve the output directory, browsers block file:// fetches.
+    """
+    supports_templates = True
+    supports_compression = True
+
+    def __init__(
+        self,
+        output_path: Path,
+        template_dirs: Sequence[Path] = (),
+        compression: Sequence[str] = ("gz",)
+    ):
+        self.output_path = output_path
+        self.template_dirs = template_dirs
+        self.compression = check_formats(compression)
+        self.chunks_dir = output_path.with_name(f"{output_path.stem}_chunks")
+        self.side_files: List[Path] = []
+
+    def write(self, schema: TeraSchema) -> None:
+        document = TeraOpenApiAdapter.for_schema(schema).convert()
+
+        with timings.stage("render.html-chunked", items=len(schema.endpoints)):
+            header = {key: value for key, value in document.items() if key != "paths"}
+            assets: List[Tuple[Path, bytes]] = []
+            index: List[Dict[str, Any]] = []
+
+            for position, (tag, paths, operations) in enumerate(split_by_tag(document["paths"])):
+                label = tag_label(tag)
+                name = f"{position:03d}-{slugify(label)}.json"
+                content = json.dumps({"paths": paths}, ensure_ascii=False, separators=(",", ":"))
+                assets.append((self.chunks_dir / name, content.encode("utf-8")))
+                index.append({
+                    "tag": tag, "label": label, "file": f"{self.chunks_dir.name}/{name}", "operations": operations
+                })
+
+            html_content = self._render(schema, header, index)
+
+        with timings.stage("write.html-chunked", items=len(assets) + 1):
+            self.chunks_dir.mkdir(parents=True, exist_ok=True)
+            written = write_assets([(self.output_path, html_content.encode("utf-8")), *assets], self.compression)
+            self._remove_stale_chunks(set(written))
+            self.side_files = [path for path in written if path != self.output_path]
+
+    def _render(self, schema: TeraSchema, header: Dict[str, Any], index: List[Dict[str, Any]]) -> str:
+        env = get_environment(self.template_dirs, autoescape=True)
+
+        try:
+            template = env.get_template("redoc_chunked.html.j2")
+        except Exception as e:
+            raise FileNotFoundError(f"HTML Template not found: {e}")
+
+        return template.render(
+            title=schema.api.name,
+            chunks=index,
+            header_json=_script_json(header),
+            chunks_json=_script_json(index)
+        )
+
+    def _remove_stale_chunks(self, written: set) -> None:
+        """Chunks of tags that no longer exist (from a previous export) are deleted."""
+        for path in self.chunks_dir.iterdir():
+            if path.name.endswith(CHUNK_SUFFIXES) and path not in written:
+                path.unlink()
+
+def split_by_tag(paths: Dict[str, Any]) -> List[Tuple[Optional[str], Dict[str, Any], int]]:
+    """
+    Groups the operations of an OpenAPI 'paths' object by their first tag,
+    keeping document order: [(tag, paths of the tag, number of operations)].
+    Untagged operations are grouped under None.
+    """
+    groups: Dict[Optional[str], Dict[str, Any]] = {}
+    counts: Dict[Optional[str], int] = {}
+    for path, path_item in paths.items():
+        for method, operation in path_item.items():
+            tag = (operation.get("tags") or [None])[0]
+            groups.setdefault(tag, {}).setdefault(path, {})[method] = operation
+            counts[tag] = counts.get(tag, 0) + 1
+    return [(tag, group, counts[tag]) for tag, group in groups.items()]
+
+def _script_json(value: Any) -> str:
+    """JSON safe to embed in a <script> block (a '</script>' inside a string cannot close it)."""
+    return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
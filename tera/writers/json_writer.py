@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 from tera.domain import TeraSchema
 from tera.adapters import TeraOpenApiAdapter 
+from tera.core import timings
 
 class JsonFileWriter:
     """
@@ -12,8 +13,8 @@ class JsonFileWriter:
         self.output_path = output_path
 
     def write(self, schema: TeraSchema) -> None:
-        adapter = TeraOpenApiAdapter(schema)
+        adapter = TeraOpenApiAdapter.for_schema(schema)
         openapi_dict = adapter.convert()
 
-        with open(self.output_path, 'w', encoding='utf-8') as f:
+        with timings.stage("write.tera-json"), open(self.output_path, 'w', encoding='utf-8') as f:
             json.dump(openapi_dict, f, indent=2, ensure_ascii=False)
\ No newline at end of file
@@ -1,31 +1,120 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-from tera.domain import TeraSchema
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple
+from jinja2 import Template
+from tera.domain import TeraSchema, ApiConfig, Endpoint
 from tera.contracts import TeraWriter
+from tera.core import timings
+from tera.writers.tags import remove_stale_files, tag_label, unique_file_names
+from tera.writers.templates import get_environment
+
+TEMPLATE_NAME = "markdown.md.j2"
+INDEX_TEMPLATE_NAME = "markdown_index.md.j2"
+# Names of the tag files of the last export, kept next to them to clean up removed tags.
+FILES_MANIFEST = ".tera-files.json"
+# Below this many endpoints, starting worker processes costs more than rendering.
+PARALLEL_MIN_ENDPOINTS = 2000
 
 class MarkdownWriter(TeraWriter):
     """
     Renders the documentation in Markdown using an external Jinja2 template.
-    Reads the file from: tera/templates/markdown.md.j2
+    Reads the file from: tera/templates/markdown.md.j2, unless one of 'template_dirs' overrides it.
+    The template is rendered chunk by chunk straight into the file, over the schema's
+    own endpoint models, so memory does not grow with the size of the document.
+    """
+    supports_templates = True
+
+    def __init__(self, output_path: Path, template_dirs: Sequence[Path] = ()):
+        self.output_path = output_path
+        self.template_dirs = template_dirs
+
+    def write(self, schema: TeraSchema) -> None:
+        template = _load_template(self.template_dirs, TEMPLATE_NAME)
+        with timings.stage("write.markdown", items=len(schema.endpoints)):
+            _render_to_file(
+                template, self.output_path,
+                api=schema.api, endpoints=resolved_endpoints(schema, schema.endpoints)
+            )
+
+class SplitMarkdownWriter(TeraWriter):
+    """
+    Markdown split per tag: 'docs.md' becomes an index linking to one file per tag
+    under 'docs_tags/', each rendered with the same template as MarkdownWriter.
+    Large schemas are rendered by a process pool, one tag per task.
+    Files of tags removed since the previous export are deleted; any other file in the
+    directory is left alone.
     """
-    def __init__(self, output_path: Path):
+    supports_templates = True
+
+    def __init__(self, output_path: Path, template_dirs: Sequence[Path] = (), jobs: int = 0):
         self.output_path = output_path
-        self.templates_dir = Path(__file__).parent.parent / "templates"
+        self.template_dirs = template_dirs
+        self.jobs = jobs
+        self.tags_dir = output_path.with_name(f"{output_path.stem}_tags")
+        self.side_files: List[Path] = []
 
     def write(self, schema: TeraSchema) -> None:
-        env = Environment(
-            loader=FileSystemLoader(self.templates_dir),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        groups = schema.index().by_tag()
+        files = unique_file_names((tag for tag, _ in groups), ".md")
+
+        with timings.stage("write.markdown-split", items=len(schema.endpoints)):
+            self.tags_dir.mkdir(parents=True, exist_ok=True)
+            tasks = [
+                (tuple(self.template_dirs), self.tags_dir / name, schema.api, tag_label(tag),
+                 list(resolved_endpoints(schema, endpoints)))
+                for (tag, endpoints), name in zip(groups, files)
+            ]
+
+            jobs = min(self.jobs if self.jobs > 0 else (os.cpu_count() or 1), len(tasks))
+            if jobs <= 1 or len(schema.endpoints) < PARALLEL_MIN_ENDPOINTS:
+                for task in tasks:
+                    _render_tag(task)
+            else:
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    list(pool.map(_render_tag, tasks))
+
+            index = [
+                {"tag": tag_label(tag), "file": f"{self.tags_dir.name}/{name}", "endpoints": len(endpoints)}
+                for (tag, endpoints), name in zip(groups, files)
+            ]
+            _render_to_file(
+                _load_template(self.template_dirs, INDEX_TEMPLATE_NAME), self.output_path,
+                api=schema.api, tags=index
+            )
+            self._remove_stale_files(files)
+            self.side_files = [self.tags_dir / name for name in files]
 
+    def _remove_stale_files(self, written: List[str]) -> None:
+        manifest = self.tags_dir / FILES_MANIFEST
         try:
-            template = env.get_template("markdown.md.j2")
-        except Exception as e:
-            raise FileNotFoundError(f"Template not found at {self.templates_dir}: {e}")
+            previous = json.loads(manifest.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            previous = []
+        remove_stale_files(self.tags_dir, previous if isinstance(previous, list) else [], written)
+        manifest.write_text(json.dumps(written), encoding="utf-8")
+
+def resolved_endpoints(schema: TeraSchema, endpoints: Iterable[Endpoint]) -> Iterator[Endpoint]:
+    """
+    Endpoints as the templates see them: the ones using a body model get its fields
+    as 'body' (on a shallow copy), every other endpoint is yielded as is.
+    """
+    for ep in endpoints:
+        yield ep.model_copy(update={"body": schema.body_fields(ep)}) if ep.body_model else ep
+
+def _load_template(template_dirs: Sequence[Path], name: str) -> Template:
+    env = get_environment(template_dirs, trim_blocks=True, lstrip_blocks=True)
+    try:
+        return env.get_template(name)
+    except Exception as e:
+        raise FileNotFoundError(f"Template not found in {env.loader.searchpath}: {e}")
 
-        context = schema.dict()
-        markdown_content = template.render(**context)
+def _render_to_file(template: Template, path: Path, **context: Any) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(template.generate(**context))
 
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
\ No newline at end of file
+def _render_tag(task: Tuple[Tuple[Path, ...], Path, ApiConfig, str, List[Endpoint]]) -> None:
+    """Process pool entry point: renders the file of one tag."""
+    template_dirs, path, api, tag, endpoints = task
+    _render_to_file(_load_template(template_dirs, TEMPLATE_NAME), path, api=api, tag=tag, endpoints=endpoints)
@@ -1,43 +1,114 @@
 import json
-import yaml
+import re
 from pathlib import Path
+from typing import Any, Dict, Iterable, TextIO, Tuple
 from tera.domain import TeraSchema
 from tera.contracts import TeraWriter
 from tera.adapters import TeraOpenApiAdapter
+from tera.core import timings, yaml_io
+
+YAML_OPTIONS = dict(sort_keys=False, allow_unicode=True, indent=2, default_flow_style=False)
+# PyYAML's default line width, and the indentation of path items under 'paths:'.
+YAML_WIDTH = 80
+NESTED_INDENT = 2
+YAML_LINE_BREAKS = "\n\x85\u2028\u2029"
+YAML_LINE_SPLIT = re.compile(f"(?<=[{YAML_LINE_BREAKS}])")
+
+class OpenApiYamlDumper(yaml_io.SafeDumper):
+    """
+    Dumper for OpenAPI documents. Never emits anchors/aliases, so a document
+    dumped at once and one streamed path item by path item are byte-identical.
+    """
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
 
 class OpenApiJsonWriter(TeraWriter):
     """
     Concrete implementation of TeraWriter.
     Recieves the Schema, converts to JSON on OpenAPI format and saves.
+    With 'streaming', path items are encoded one at a time straight to the file.
     """
-    def __init__(self, output_path: Path):
+    supports_streaming = True
+
+    def __init__(self, output_path: Path, streaming: bool = False):
         self.output_path = output_path
+        self.streaming = streaming
 
     def write(self, schema: TeraSchema) -> None:
-        adapter = TeraOpenApiAdapter(schema)
-        openapi_dict = adapter.convert()
+        adapter = TeraOpenApiAdapter.for_schema(schema)
+        document = None if self.streaming else adapter.convert()
+
+        with timings.stage("write.openapi-json"), open(self.output_path, 'w', encoding='utf-8') as f:
+            if self.streaming:
+                self._stream(adapter.build_header(), adapter.iter_paths(), f)
+            else:
+                json.dump(document, f, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def _stream(header: Dict[str, Any], paths: Iterable[Tuple[str, Any]], f: TextIO) -> None:
+        """
+        Writes exactly what json.dump(indent=2) would write for header + {"paths": ...}.
+        Nested values are re-indented line by line: encoded JSON strings never contain raw newlines.
+        """
+        encoded_header = json.dumps(header, indent=2, ensure_ascii=False)
+        f.write(encoded_header[:-2] + ',\n  "paths": ')
 
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            json.dump(openapi_dict, f, indent=2, ensure_ascii=False)
+        first = True
+        for path, path_item in paths:
+            f.write('{\n    ' if first else ',\n    ')
+            f.write(json.dumps(path, ensure_ascii=False))
+            f.write(': ')
+            f.write(json.dumps(path_item, indent=2, ensure_ascii=False).replace('\n', '\n    '))
+            first = False
+
+        f.write('{}\n}' if first else '\n  }\n}')
 
 
 class OpenApiYamlWriter(TeraWriter):
     """
     Concrete implementation of TeraWriter.
     Recieves the Schema, converts to YAML on OpenAPI format and saves.
+    With 'streaming', path items are dumped one at a time straight to the file.
     """
-    def __init__(self, output_path: Path):
+    supports_streaming = True
+
+    def __init__(self, output_path: Path, streaming: bool = False):
         self.output_path = output_path
+        self.streaming = streaming
 
     def write(self, schema: TeraSchema) -> None:
-        adapter = TeraOpenApiAdapter(schema)
-        openapi_dict = adapter.convert()
-
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(
-                openapi_dict, 
-                f, 
-                sort_keys=False, 
-                allow_unicode=True,
-                indent=2
-            )
\ No newline at end of file
+        adapter = TeraOpenApiAdapter.for_schema(schema)
+        document = None if self.streaming else adapter.convert()
+
+        with timings.stage("write.openapi-yaml"), open(self.output_path, 'w', encoding='utf-8') as f:
+            if self.streaming:
+                self._stream(adapter.build_header(), adapter.iter_paths(), f)
+            else:
+                yaml_io.dump(document, f, dumper=OpenApiYamlDumper, **YAML_OPTIONS)
+
+    @staticmethod
+    def _stream(header: Dict[str, Any], paths: Iterable[Tuple[str, Any]], f: TextIO) -> None:
+        """
+        Writes exactly what yaml.dump would write for header + {"paths": ...}.
+        Each path item is dumped on its own as a root mapping, 2 columns narrower,
+        then shifted right by 2 columns: the emitter's layout decisions (line wrapping)
+        are relative to the column, so shifting gives the nested rendering.
+        Works the same with the libyaml and the pure-Python dumpers.
+        """
+        yaml_io.dump(header, f, dumper=OpenApiYamlDumper, **YAML_OPTIONS)
+
+        first = True
+        for path, path_item in paths:
+            if first:
+                f.write("paths:\n")
+                first = False
+            chunk = yaml_io.dump(
+                {path: path_item}, dumper=OpenApiYamlDumper, width=YAML_WIDTH - NESTED_INDENT, **YAML_OPTIONS
+            )
+            f.write("".join(
+                " " * NESTED_INDENT + line if line[:1] not in YAML_LINE_BREAKS else line
+                for line in YAML_LINE_SPLIT.split(chunk) if line
+            ))
+
+        if first:
+            f.write("paths: {}\n")
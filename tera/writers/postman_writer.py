@@ -1,70 +1,196 @@
 import json
-import uuid
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from tera.domain import TeraSchema
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from tera.domain import TeraSchema, Endpoint, BodyField
 from tera.contracts import TeraWriter
+from tera.core import timings
+from tera.writers.tags import remove_stale_files, tag_label, unique_file_names
+
+COLLECTION_SCHEMA = "https://schema.getpostman.com/json/collection/v2.1.0/collection.json"
+# Below this many endpoints, starting worker processes costs more than encoding.
+PARALLEL_MIN_ENDPOINTS = 2000
+INDENT = "  "
+
+# (endpoint, resolved body fields): everything needed to build one request item.
+RequestSource = Tuple[Endpoint, List[BodyField]]
 
 class PostmanWriter(TeraWriter):
     """
     Concrete implementation of TeraWriter.
     Recieves the Schema, converts to Postman Collection (v2.1).
+    Requests are grouped in one folder per tag (untagged ones stay at the root)
+    and encoded one at a time straight to the file.
     """
 
     def __init__(self, output_path: Path):
         self.output_path = output_path
 
     def write(self, schema: TeraSchema) -> None:
-        collection = {
-            "info": {
-                "name": schema.api.name,
-                "description": schema.api.description or "Generated by Tera CLI",
-                "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json"
-            },
-            "item": [],
-            "variable": [
-                {
-                    "key": "base_url",
-                    "value": "http://localhost:5000",
-                    "type": "string"
-                }
+        with timings.stage("write.postman", items=len(schema.endpoints)), \
+                open(self.output_path, "w", encoding="utf-8") as f:
+            _stream_collection(f, _info(schema.api.name, schema.api.description), _tree(schema))
+
+class ShardedPostmanWriter(TeraWriter):
+    """
+    One Postman collection per tag under '<name>_shards/' ('api.json' -> 'api_shards/users.json', ...),
+    small enough for Postman to import one at a time. The output file itself is a manifest
+    listing the collections. Large schemas are encoded by a process pool, one tag per task.
+    Collections listed by the previous manifest but not written again are deleted; any
+    other file in the directory is left alone.
+    """
+
+    def __init__(self, output_path: Path, jobs: int = 0):
+        self.output_path = output_path
+        self.jobs = jobs
+        self.shards_dir = output_path.with_name(f"{output_path.stem}_shards")
+        self.side_files: List[Path] = []
+
+    def write(self, schema: TeraSchema) -> None:
+        groups = schema.index().by_tag()
+        files = unique_file_names((tag for tag, _ in groups), ".json")
+
+        with timings.stage("write.postman-sharded", items=len(schema.endpoints)):
+            previous = self._previous_files()
+            self.shards_dir.mkdir(parents=True, exist_ok=True)
+            tasks = [
+                (
+                    self.shards_dir / name,
+                    _info(f"{schema.api.name} - {tag_label(tag)}", schema.api.description),
+                    [(ep, schema.body_fields(ep)) for ep in endpoints]
+                )
+                for (tag, endpoints), name in zip(groups, files)
             ]
+
+            jobs = min(self.jobs if self.jobs > 0 else (os.cpu_count() or 1), len(tasks))
+            if jobs <= 1 or len(schema.endpoints) < PARALLEL_MIN_ENDPOINTS:
+                for task in tasks:
+                    _write_shard(task)
+            else:
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    list(pool.map(_write_shard, tasks))
+
+            manifest = {
+                "name": schema.api.name,
+                "collections": [
+                    {"tag": tag, "file": f"{self.shards_dir.name}/{name}", "requests": len(endpoints)}
+                    for (tag, endpoints), name in zip(groups, files)
+                ]
+            }
+            with open(self.output_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2, ensure_ascii=False)
+            remove_stale_files(self.shards_dir, previous, files)
+            self.side_files = [self.shards_dir / name for name in files]
+
+    def _previous_files(self) -> List[str]:
+        """Names of the collections the manifest of the previous export lists in shards_dir."""
+        try:
+            manifest = json.loads(self.output_path.read_text(encoding="utf-8"))
+            entries = [c["file"] for c in manifest["collections"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+        prefix = f"{self.shards_dir.name}/"
+        return [entry[len(prefix):] for entry in entries if isinstance(entry, str) and entry.startswith(prefix)]
+
+def _info(name: str, description: Optional[str]) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "description": description or "Generated by Tera CLI",
+        "schema": COLLECTION_SCHEMA
+    }
+
+def _variables() -> List[Dict[str, Any]]:
+    return [
+        {
+            "key": "base_url",
+            "value": "http://localhost:5000",
+            "type": "string"
         }
+    ]
 
-        for ep in schema.endpoints:
-            clean_path = ep.path.replace("{", ":").replace("}", "")
-            path_segments = [p for p in clean_path.split("/") if p]
-
-            body_config = None
-            if ep.body:
-                example_data = {field.name: field.type for field in ep.body}
-                body_config = {
-                    "mode": "raw",
-                    "raw": json.dumps(example_data, indent=2),
-                    "options": {
-                        "raw": {
-                            "language": "json"
-                        }
-                    }
-                }
+def _tree(schema: TeraSchema) -> Iterator[Any]:
+    """
+    Top level entries of the collection: a folder per tag, whose items are built lazily,
+    and the untagged requests themselves.
+    """
+    for tag, endpoints in schema.index().by_tag():
+        if tag is None:
+            for ep in endpoints:
+                yield _request_item(ep, schema.body_fields(ep))
+        else:
+            yield _Folder(tag, ((ep, schema.body_fields(ep)) for ep in endpoints))
+
+class _Folder:
+    """A folder whose requests are only built while it is being encoded."""
+    def __init__(self, name: str, requests: Iterable[RequestSource]):
+        self.name = name
+        self.requests = requests
 
-            item = {
-                "name": f"{ep.method} {ep.path}",
-                "request": {
-                    "method": ep.method,
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}" + clean_path,
-                        "host": ["{{base_url}}"],
-                        "path": path_segments,
-                        "variable": []
-                    },
-                    "description": ep.description or ep.summary
+def _request_item(ep: Endpoint, body_fields: List[BodyField]) -> Dict[str, Any]:
+    clean_path = ep.path.replace("{", ":").replace("}", "")
+    path_segments = [p for p in clean_path.split("/") if p]
+
+    body_config = None
+    if body_fields:
+        example_data = {field.name: field.type for field in body_fields}
+        body_config = {
+            "mode": "raw",
+            "raw": json.dumps(example_data, indent=2),
+            "options": {
+                "raw": {
+                    "language": "json"
                 }
             }
+        }
+
+    item = {
+        "name": f"{ep.method} {ep.path}",
+        "request": {
+            "method": ep.method,
+            "header": [],
+            "url": {
+                "raw": "{{base_url}}" + clean_path,
+                "host": ["{{base_url}}"],
+                "path": path_segments,
+                "variable": []
+            },
+            "description": ep.description or ep.summary
+        }
+    }
+
+    if body_config:
+        item["request"]["body"] = body_config
+    return item
+
+def _encode(value: Any, level: int) -> str:
+    """json.dumps(indent=2) of a value nested 'level' levels deep (encoded strings never hold raw newlines)."""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + INDENT * level)
+
+def _stream_array(f: TextIO, entries: Iterable[Any], level: int) -> None:
+    """Writes a JSON array entry by entry, exactly as json.dump(indent=2) lays it out."""
+    first = True
+    for entry in entries:
+        f.write("[\n" if first else ",\n")
+        f.write(INDENT * (level + 1))
+        if isinstance(entry, _Folder):
+            f.write("{\n" + INDENT * (level + 2) + '"name": ' + _encode(entry.name, level + 2) + ",\n")
+            f.write(INDENT * (level + 2) + '"item": ')
+            _stream_array(f, (_request_item(*source) for source in entry.requests), level + 2)
+            f.write("\n" + INDENT * (level + 1) + "}")
+        else:
+            f.write(_encode(entry, level + 1))
+        first = False
+    f.write("[]" if first else "\n" + INDENT * level + "]")
 
-            if body_config:
-                item["request"]["body"] = body_config
-            collection["item"].append(item)
+def _stream_collection(f: TextIO, info: Dict[str, Any], entries: Iterable[Any]) -> None:
+    """Writes what json.dump(indent=2) would write for the whole collection, one item at a time."""
+    f.write('{\n  "info": ' + _encode(info, 1) + ',\n  "item": ')
+    _stream_array(f, entries, 1)
+    f.write(',\n  "variable": ' + _encode(_variables(), 1) + "\n}")
 
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(collection, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+def _write_shard(task: Tuple[Path, Dict[str, Any], List[RequestSource]]) -> None:
+    """Process pool entry point: writes the collection of one tag."""
+    path, info, requests = task
+    with open(path, "w", encoding="utf-8") as f:
+        _stream_collection(f, info, (_request_item(*source) for source in requests))
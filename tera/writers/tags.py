@@ -0,0 +1,34 @@
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+# Shown for the group of endpoints without a tag when output is split per tag.
+# The group itself is keyed by None, so it never merges with a tag of the same name.
+UNTAGGED_LABEL = "default"
+
+def tag_label(tag: Optional[str]) -> str:
+    return UNTAGGED_LABEL if tag is None else tag
+
+def slugify(text: str) -> str:
+    """File name friendly version of a tag ('User Admin' -> 'user-admin')."""
+    return re.sub(r"[^a-z0-9_-]+", "-", text.lower()).strip("-") or "tag"
+
+def unique_file_names(tags: Iterable[Optional[str]], suffix: str) -> List[str]:
+    """One file name per tag; tags with the same slug get '-2', '-3'... ('users.md', 'users-2.md')."""
+    names: List[str] = []
+    for tag in tags:
+        base = slugify(tag_label(tag))
+        name, counter = f"{base}{suffix}", 2
+        while name in names:
+            name, counter = f"{base}-{counter}{suffix}", counter + 1
+        names.append(name)
+    return names
+
+def remove_stale_files(directory: Path, previous: Iterable[str], written: Iterable[str]) -> None:
+    """
+    Deletes the files a previous export listed (its index/manifest) that this one did not write.
+    Only plain file names inside 'directory' are accepted: nothing else there is ever touched.
+    """
+    for name in set(previous) - set(written):
+        if isinstance(name, str) and name and Path(name).name == name and not name.startswith("."):
+            (directory / name).unlink(missing_ok=True)
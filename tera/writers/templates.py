@@ -0,0 +1,55 @@
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from jinja2.bccache import Bucket
+from tera.core.cache import get_user_cache_dir
+
+BUILTIN_TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+# Compiled templates live in the per-user cache ('~/.cache/tera/jinja'), never in the
+# project: Jinja unpickles and unmarshals these files, so a repository must not be able to ship them.
+BYTECODE_DIR_NAME = "jinja"
+
+_environments: Dict[Tuple[Any, ...], Environment] = {}
+_lock = threading.Lock()
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Jinja2's on-disk bytecode cache, keyed by template name + file path and checked
+    against the source checksum (and the Jinja/Python versions) on load.
+    Failing to write it (read-only disk, cache cleared meanwhile) never breaks a render.
+    """
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+def get_environment(template_dirs: Sequence[Path] = (), **options: Any) -> Environment:
+    """
+    Process-wide Jinja2 environment searching 'template_dirs' (user overrides)
+    before the built-in templates, created once per search path and options.
+    Templates are compiled once per process and their bytecode is reused
+    by later runs until the template file changes.
+    """
+    search_path = tuple(str(Path(d).resolve()) for d in template_dirs) + (str(BUILTIN_TEMPLATES_DIR),)
+    bytecode_dir = get_user_cache_dir().resolve() / BYTECODE_DIR_NAME
+    key = (search_path, str(bytecode_dir), tuple(sorted(options.items())))
+
+    with _lock:
+        env = _environments.get(key)
+        if env is None:
+            env = Environment(
+                loader=FileSystemLoader(list(search_path)),
+                bytecode_cache=_bytecode_cache(bytecode_dir),
+                **options
+            )
+            _environments[key] = env
+    return env
+
+def _bytecode_cache(directory: Path) -> Optional[TemplateBytecodeCache]:
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return TemplateBytecodeCache(str(directory))
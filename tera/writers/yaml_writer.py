@@ -1,7 +1,7 @@
-import yaml
 from pathlib import Path
 from tera.domain import TeraSchema
 from tera.contracts import TeraWriter
+from tera.core import timings, yaml_io
 
 class YamlFileWriter(TeraWriter):
     """
@@ -12,10 +12,11 @@ class YamlFileWriter(TeraWriter):
         self.output_path = output_path
 
     def write(self, schema: TeraSchema) -> None:
-        data = schema.dict(exclude_none=True)
+        with timings.stage("render.tera-yaml", items=len(schema.endpoints)):
+            data = schema.dict(exclude_none=True)
 
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(
+        with timings.stage("write.tera-yaml"), open(self.output_path, 'w', encoding='utf-8') as f:
+            yaml_io.dump(
                 data, 
                 f, 
                 sort_keys=False, 
@@ -0,0 +1,71 @@
+import os
+import textwrap
+from typer.testing import CliRunner
+from tera.main import app
+from tera.core import factory
+
+runner = CliRunner()
+
+DOCS = textwrap.dedent("""
+api:
+  name: Cache Test
+  version: "1.0"
+endpoints:
+  - path: /ping
+    method: GET
+    summary: Ping
+    responses:
+      success:
+        example: { "pong": true }
+""")
+
+def _fail_if_called(*args, **kwargs):
+    raise AssertionError("cache hit should not load the input")
+
+def test_build_skips_unchanged_input(monkeypatch):
+    with runner.isolated_filesystem():
+        with open("docs.yaml", "w", encoding="utf-8") as f:
+            f.write(DOCS)
+
+        first = runner.invoke(app, ["build", "docs.yaml"])
+        assert first.exit_code == 0, first.output
+        assert "Operation successful" in first.output
+
+        monkeypatch.setattr(factory, "get_driver", _fail_if_called)
+        second = runner.invoke(app, ["build", "docs.yaml"])
+        assert second.exit_code == 0, second.output
+        assert "Up to date" in second.output
+
+def test_build_reruns_when_input_changes_or_no_cache():
+    with runner.isolated_filesystem():
+        with open("docs.yaml", "w", encoding="utf-8") as f:
+            f.write(DOCS)
+        runner.invoke(app, ["build", "docs.yaml"])
+
+        forced = runner.invoke(app, ["build", "docs.yaml", "--no-cache"])
+        assert "Operation successful" in forced.output
+
+        with open("docs.yaml", "w", encoding="utf-8") as f:
+            f.write(DOCS.replace("Ping", "Pong"))
+        changed = runner.invoke(app, ["build", "docs.yaml"])
+        assert "Operation successful" in changed.output
+
+def test_export_reruns_when_a_side_file_is_missing():
+    """Arquivos por tag/shard/chunk fazem parte da saída: apagar um deles invalida o cache."""
+    with runner.isolated_filesystem():
+        with open("docs.yaml", "w", encoding="utf-8") as f:
+            f.write(DOCS.replace("    summary: Ping", "    summary: Ping\n    tag: users"))
+
+        for kind, side_file in (
+            ("markdown-split", "docs_tags/users.md"),
+            ("postman-sharded", "docs_shards/users.json"),
+            ("html-chunked", "docs_chunks/000-users.json.gz"),
+        ):
+            runner.invoke(app, ["export", "docs.yaml", "-f", kind])
+            cached = runner.invoke(app, ["export", "docs.yaml", "-f", kind])
+            assert "Up to date" in cached.output, kind
+
+            os.remove(side_file)
+            rebuilt = runner.invoke(app, ["export", "docs.yaml", "-f", kind])
+            assert "Operation successful" in rebuilt.output, kind
+            assert os.path.exists(side_file), kind
@@ -47,4 +47,29 @@ def test_build_file_not_found():
     
     assert result.exit_code != 0
 
-    assert "does not exist" in result.output
\ No newline at end of file
+    assert "does not exist" in result.output
+
+
+def test_build_formats_keep_dotted_output_names(tmp_path):
+    """Com --format, só a extensão da saída é trocada: 'api.v2.json' gera 'api.v2.html'."""
+    input_file = tmp_path / "api.v2.yaml"
+    input_file.write_text(textwrap.dedent("""
+    api:
+      name: Dotted
+      version: "2.0"
+    endpoints:
+      - path: /ping
+        method: GET
+        summary: Ping
+        responses:
+          success:
+            example: { "pong": true }
+    """), encoding="utf-8")
+
+    result = runner.invoke(app, [
+        "build", str(input_file), "-o", str(tmp_path / "api.v2.json"), "--format", "openapi-json,html"
+    ])
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "api.v2.openapi.json").exists()
+    assert (tmp_path / "api.v2.html").exists()
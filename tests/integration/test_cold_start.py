@@ -0,0 +1,50 @@
+import json
+import subprocess
+import sys
+import textwrap
+
+# Modules that only some drivers/writers need. 'tera lint' must never load them.
+HEAVY_MODULES = ("jinja2", "flask", "werkzeug", "tera.writers", "tera.drivers")
+
+PROBE = textwrap.dedent("""
+    import json, sys
+    from tera.main import app
+    try:
+        app(sys.argv[1:], standalone_mode=False)
+    except SystemExit:
+        pass
+    print(json.dumps(sorted(sys.modules)))
+""")
+
+def _loaded_modules(*args) -> list:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, *args],
+        capture_output=True, text=True, check=True
+    )
+    last_line = result.stdout.strip().splitlines()[-1]
+    return json.loads(last_line)
+
+def _heavy(modules: list) -> list:
+    return [m for m in modules if any(m == h or m.startswith(h + ".") for h in HEAVY_MODULES)]
+
+def test_lint_cold_start_does_not_import_heavy_modules(tmp_path):
+    """'tera lint' roda em pre-commit: não pode importar Jinja2/Flask nem os writers."""
+    docs = tmp_path / "docs.yaml"
+    docs.write_text(textwrap.dedent("""
+    api:
+      name: Cold Start
+      version: "1.0"
+      description: Probe
+    endpoints:
+      - path: /ping
+        method: GET
+        summary: Ping
+        responses:
+          success:
+            example: { "pong": true }
+    """), encoding="utf-8")
+
+    assert _heavy(_loaded_modules("lint", str(docs))) == []
+
+def test_help_cold_start_does_not_import_heavy_modules():
+    assert _heavy(_loaded_modules("--help")) == []
@@ -0,0 +1,107 @@
+import textwrap
+from pathlib import Path
+from typer.testing import CliRunner
+from tera.main import app
+from tera.adapters import compiled_cache, CompiledSchemaCache
+from tera.core import yaml_io
+from tera.domain import TeraSchema
+
+runner = CliRunner()
+
+DOCS = textwrap.dedent("""
+api:
+  name: Compiled
+  version: "1.0"
+endpoints:
+  - path: /ping
+    method: GET
+    summary: Ping
+    responses:
+      success:
+        example: { "pong": true }
+""")
+
+def _fail_if_called(*args, **kwargs):
+    raise AssertionError("compiled schema should skip YAML parsing")
+
+def test_lint_then_build_reuses_compiled_schema(monkeypatch):
+    """Depois do lint, build e export reidratam o schema sem reler o YAML."""
+    with runner.isolated_filesystem():
+        Path("docs.yaml").write_text(DOCS, encoding="utf-8")
+
+        first = runner.invoke(app, ["lint", "docs.yaml"])
+        assert first.exit_code == 0, first.output
+
+        monkeypatch.setattr(yaml_io, "safe_load", _fail_if_called)
+        monkeypatch.setattr(yaml_io, "SafeLoader", _fail_if_called)
+
+        again = runner.invoke(app, ["lint", "docs.yaml"])
+        assert again.exit_code == 0, again.output
+        assert again.output == first.output
+
+        built = runner.invoke(app, ["build", "docs.yaml", "-o", "out.json"])
+        assert built.exit_code == 0, built.output
+        assert '"Compiled"' in Path("out.json").read_text(encoding="utf-8")
+
+def test_entry_is_invalidated_by_content_and_model_changes(monkeypatch):
+    with runner.isolated_filesystem():
+        docs = Path("docs.yaml")
+        docs.write_text(DOCS, encoding="utf-8")
+        runner.invoke(app, ["lint", "docs.yaml"])
+
+        cache = CompiledSchemaCache()
+        assert cache.load(docs, require_index=True) is not None
+
+        monkeypatch.setattr(compiled_cache, "model_fingerprint", lambda: "another-model")
+        assert cache.load(docs) is None
+        monkeypatch.undo()
+
+        docs.write_text(DOCS.replace("Ping", "Pong"), encoding="utf-8")
+        assert cache.load(docs) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+class _Exploit:
+    def __reduce__(self):
+        return (Path("pwned").write_text, ("x",))
+
+def test_crafted_entries_are_never_executed():
+    """O cache fica na árvore do projeto: uma entrada forjada (pickle) só pode ser um miss."""
+    import pickle
+    import zlib
+
+    with runner.isolated_filesystem():
+        docs = Path("docs.yaml")
+        docs.write_text(DOCS, encoding="utf-8")
+        runner.invoke(app, ["lint", "docs.yaml"])
+
+        cache = CompiledSchemaCache()
+        entry = cache._entry_path(docs, cache.compute_key(docs))
+        assert entry.read_bytes().startswith(b'{"version"')
+
+        entry.write_bytes(zlib.compress(pickle.dumps(_Exploit())))
+        assert cache.load(docs) is None
+        entry.write_bytes(b'{"version": 2, "key": "forged"}\n' + zlib.compress(pickle.dumps(_Exploit())))
+        assert cache.load(docs) is None
+        # The key is predictable, but a matching header only leads to JSON parsing and validation.
+        header = f'{{"version": 2, "key": "{cache.compute_key(docs)}", "indexed": true}}\n'.encode()
+        entry.write_bytes(header + zlib.compress(pickle.dumps(_Exploit())))
+        assert cache.load(docs) is None
+        assert not Path("pwned").exists()
+
+        result = runner.invoke(app, ["lint", "docs.yaml"])
+        assert result.exit_code == 0, result.output
+        assert not Path("pwned").exists()
+
+def test_schemas_json_cannot_round_trip_are_not_cached(tmp_path):
+    """Chaves não-string em exemplos ({1: a}) virariam strings no cache: o schema não é guardado."""
+    source = tmp_path / "docs.yaml"
+    source.write_text(DOCS.replace('{ "pong": true }', "{ 1: a }"), encoding="utf-8")
+    schema = TeraSchema(**yaml_io.safe_load(source.read_text(encoding="utf-8")))
+    cache = CompiledSchemaCache(tmp_path / "cache")
+
+    cache.store(source, schema)
+    assert cache.load(source) is None
+
+    source.write_text(DOCS, encoding="utf-8")
+    cache.store(source, TeraSchema(**yaml_io.safe_load(DOCS)))
+    assert cache.load(source) is not None
@@ -0,0 +1,103 @@
+import json
+import textwrap
+from pathlib import Path
+from typer.testing import CliRunner
+from tera.main import app
+
+runner = CliRunner()
+
+VALID = textwrap.dedent("""
+api:
+  name: Lint Test
+  version: "1.0"
+  description: Valid
+endpoints:
+  - path: /ping
+    method: GET
+    summary: Ping
+    responses:
+      success:
+        example: { "pong": true }
+""")
+
+def _write(path: str, content: str):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(content, encoding="utf-8")
+
+def test_lint_directory_in_parallel_with_combined_json_report():
+    """Diretório + .teraignore + -j 2: um relatório único e exit code de erro."""
+    with runner.isolated_filesystem():
+        _write("services/users/docs.yaml", VALID)
+        _write("services/orders/docs.yaml", "api: [\n")
+        _write("services/legacy/docs.yaml", "api: [\n")
+        _write(".teraignore", "legacy/\n")
+
+        result = runner.invoke(app, ["lint", "services", "-j", "2", "--json"])
+        report = json.loads(result.output)
+
+        assert result.exit_code == 1
+        assert [f["path"] for f in report["files"]] == [
+            str(Path("services/orders/docs.yaml")),
+            str(Path("services/users/docs.yaml")),
+        ]
+        assert report["summary"] == {"files": 2, "errors": 1, "warnings": 0}
+
+def test_teraignore_patterns_are_relative_to_the_project_root():
+    """Padrões ancorados na raiz do projeto valem também ao lintar um subdiretório."""
+    with runner.isolated_filesystem():
+        _write("services/users/docs.yaml", VALID)
+        _write("services/legacy/docs.yaml", "api: [\n")
+        _write("services/old/docs.yaml", "api: [\n")
+        _write(".teraignore", "services/legacy/\n/services/old/\n")
+
+        for target in ("services", "services/*"):
+            result = runner.invoke(app, ["lint", target, "--json"])
+            report = json.loads(result.output)
+            assert [f["path"] for f in report["files"]] == [str(Path("services/users/docs.yaml"))], target
+
+def test_lint_glob_pattern_passes():
+    with runner.isolated_filesystem():
+        _write("a/docs.yaml", VALID)
+        _write("b/docs.yaml", VALID)
+
+        result = runner.invoke(app, ["lint", "*/docs.yaml"])
+
+        assert result.exit_code == 0, result.output
+        assert "2 files, 0 error(s), 0 warning(s)" in result.output
+
+def test_multi_file_sources_are_linted_as_one_schema():
+    """Um diretório com api.yaml é lintado pelo schema mesclado; um fragmento sozinho é validado como fragmento."""
+    with runner.isolated_filesystem():
+        _write("api/api.yaml", 'api:\n  name: Split\n  version: "1.0"\n  description: Split API\n')
+        _write("api/endpoints/users.yaml", textwrap.dedent("""
+        endpoints:
+          - path: /users
+            method: GET
+            summary: Users
+            responses:
+              success:
+                example: { "id": 1 }
+        """))
+        _write("api/endpoints/orders.yaml", "- path: /orders\n  method: GET\n  summary: Orders\n  responses: {success: {}}\n")
+
+        for target in ("api", "api/api.yaml"):
+            result = runner.invoke(app, ["lint", target, "--json"])
+            report = json.loads(result.output)
+            assert [f["path"] for f in report["files"]] == [str(Path("api/api.yaml"))], target
+            assert report["summary"]["errors"] == 0, result.output
+
+        result = runner.invoke(app, ["lint", "api/endpoints/users.yaml"])
+        assert result.exit_code == 0, result.output
+
+        _write("api/endpoints/users.yaml", "endpoints:\n  - path: /users\n    method: GET\n    extra: 1\n")
+        result = runner.invoke(app, ["lint", "api/endpoints/users.yaml", "--json"])
+        issues = json.loads(result.output)["files"][0]["issues"]
+        assert result.exit_code == 1
+        assert {(i["code"], i["location"], i["line"]) for i in issues} >= {
+            ("schema_error", "endpoints -> 0 -> summary", 2), ("schema_error", "endpoints -> 0 -> extra", 4)
+        }
+
+        result = runner.invoke(app, ["lint", "api", "--json"])
+        report = json.loads(result.output)
+        assert result.exit_code == 1
+        assert "users.yaml" in report["files"][0]["issues"][0]["message"]
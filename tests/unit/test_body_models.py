@@ -0,0 +1,58 @@
+import sys
+import textwrap
+import pytest
+from pydantic import ValidationError
+from tera.adapters.openapi import TeraOpenApiAdapter
+from tera.domain import TeraSchema
+from tera.drivers.flask_driver import FlaskAppDriver
+
+APP = textwrap.dedent('''
+    from flask import Flask
+    from pydantic import BaseModel
+
+    app = Flask("models")
+
+    class Item(BaseModel):
+        """An item of the catalog."""
+        name: str
+        price: float = 0.0
+
+    @app.post("/items")
+    def create_item(item: Item):
+        """Creates an item."""
+        return ""
+
+    @app.put("/items/<int:item_id>")
+    def update_item(item_id: int, item: Item):
+        """Replaces an item."""
+        return ""
+''')
+
+def test_shared_model_becomes_one_component(tmp_path, monkeypatch):
+    """Um model usado por várias rotas vira um único components/schemas referenciado por $ref."""
+    (tmp_path / "models_app.py").write_text(APP, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "models_app", raising=False)
+
+    schema = FlaskAppDriver("models_app:app").load()
+
+    assert list(schema.models) == ["Item"]
+    assert schema.models["Item"].description == "An item of the catalog."
+    assert [ep.body_model for ep in schema.endpoints] == ["Item", "Item"]
+    assert [f.name for f in schema.body_fields(schema.endpoints[0])] == ["name", "price"]
+
+    openapi = TeraOpenApiAdapter(schema).convert()
+    assert set(openapi["components"]["schemas"]["Item"]["properties"]) == {"name", "price"}
+    body = openapi["paths"]["/items"]["post"]["requestBody"]["content"]["application/json"]
+    assert body["schema"] == {"$ref": "#/components/schemas/Item"}
+    assert body["example"] == {"name": "string", "price": 0.0}
+
+def test_unknown_body_model_is_rejected():
+    with pytest.raises(ValidationError, match="unknown body model 'Missing'"):
+        TeraSchema(
+            api={"name": "API", "version": "1"},
+            endpoints=[{
+                "path": "/items", "method": "POST", "summary": "Create",
+                "body_model": "Missing", "responses": {"success": {}},
+            }],
+        )
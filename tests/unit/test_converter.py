@@ -45,4 +45,38 @@ def test_inference_array(minimal_schema_model):
     schema = converter._infer_schema_recursive(list_data)
     
     assert schema["type"] == "array"
-    assert schema["items"]["type"] == "string"
\ No newline at end of file
+    assert schema["items"]["type"] == "string"
+
+def test_inference_is_memoized_by_shape_without_sharing(minimal_schema_model):
+    """Exemplos com o mesmo formato reaproveitam a inferência, mas cada schema é uma cópia própria."""
+    converter = TeraOpenApiAdapter(minimal_schema_model)
+
+    first = converter._infer_schema_recursive({"page": 1, "items": [{"id": "a"}]})
+    second = converter._infer_schema_recursive({"page": 7, "items": [{"id": "b"}]})
+
+    assert first == second
+    assert converter.inferrer.hits > 0
+
+    first["properties"]["items"]["items"]["properties"]["id"]["minLength"] = 3
+    assert "minLength" not in second["properties"]["items"]["items"]["properties"]["id"]
+    assert converter._infer_schema_recursive("x") == {"type": "string"}
+
+def test_inference_distinguishes_shapes(minimal_schema_model):
+    converter = TeraOpenApiAdapter(minimal_schema_model)
+
+    uuid = converter._infer_schema_recursive({"id": "123e4567-e89b-12d3-a456-426614174000"})
+    text = converter._infer_schema_recursive({"id": "plain"})
+
+    assert uuid["properties"]["id"]["format"] == "uuid"
+    assert "format" not in text["properties"]["id"]
+
+def test_inference_cache_round_trip(minimal_schema_model, tmp_path):
+    from tera.adapters import SchemaInferrer
+
+    inferrer = SchemaInferrer()
+    expected = inferrer.infer({"user": {"name": "x", "tags": ["a"]}})
+    inferrer.save(tmp_path / "inference.json")
+
+    restored = SchemaInferrer.load(tmp_path / "inference.json")
+    assert restored.infer({"user": {"name": "y", "tags": ["b"]}}) == expected
+    assert restored.misses == 0
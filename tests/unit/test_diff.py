@@ -0,0 +1,147 @@
+import json
+import shutil
+import subprocess
+import pytest
+import yaml
+from tera.adapters import TeraOpenApiAdapter
+from tera.domain import TeraSchema
+from tera.services import DiffService
+
+def _endpoint(path, method="GET", **extra):
+    return {"path": path, "method": method, "summary": path, "responses": {"success": {"example": {"ok": True}}}, **extra}
+
+def _spec(endpoints):
+    return {"api": {"name": "Diff API", "version": "1"}, "endpoints": endpoints}
+
+def _write(path, data):
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return str(path)
+
+def _changes(report):
+    return {(c.endpoint, c.section, c.name, c.kind.value, c.breaking) for c in report.changes}
+
+def test_changes_are_classified(tmp_path):
+    """Remoções, campos obrigatórios novos e troca de tipo quebram clientes; adições opcionais não."""
+    old = _write(tmp_path / "old.yaml", _spec([
+        _endpoint("/users/{id}", params={"path": [{"name": "id", "required": True}], "query": [{"name": "q"}]},
+                  body=[{"name": "name"}, {"name": "age", "example": 30}]),
+        _endpoint("/legacy"),
+        _endpoint("/same"),
+    ]))
+    new = _write(tmp_path / "new.yaml", _spec([
+        _endpoint("/users/{user_id}", params={"path": [{"name": "user_id", "required": True}]},
+                  body=[{"name": "name", "required": True}, {"name": "age", "example": "30"}, {"name": "nick"}],
+                  auth_required=True),
+        _endpoint("/same"),
+        _endpoint("/reports", method="POST"),
+    ]))
+
+    report = DiffService().diff(old, new)
+    users = "GET /users/{user_id}"
+    assert _changes(report) == {
+        ("GET /legacy", "endpoint", None, "removed", True),
+        ("POST /reports", "endpoint", None, "added", False),
+        (users, "auth", None, "changed", True),
+        (users, "param", "query:q", "removed", True),
+        (users, "body", "name.required", "changed", True),
+        (users, "body", "age.type", "changed", True),
+        (users, "body", "nick", "added", False),
+        (users, "meta", "summary", "changed", False),
+    }
+    assert report.unchanged == 1
+    assert report.summary()["summary"] == {
+        "added": 1, "removed": 1, "changed": 1, "unchanged": 1, "breaking": 5
+    }
+
+def test_renamed_path_parameters_are_not_changes(tmp_path):
+    """Renomear '{id}' para '{user_id}' não muda o endpoint nem o parâmetro (casados pela posição)."""
+    def users(*names):
+        path = "/users/" + "/".join(f"{{{name}}}" for name in names)
+        params = {"path": [{"name": name, "required": True, "example": 1} for name in names]}
+        return _endpoint(path, summary="Users", params=params)
+
+    old = _write(tmp_path / "old.yaml", _spec([users("id", "post")]))
+    new = _write(tmp_path / "new.yaml", _spec([users("user_id", "post_id")]))
+    assert _changes(DiffService().diff(old, new)) == set()
+
+    export = tmp_path / "new.json"
+    export.write_text(json.dumps(TeraOpenApiAdapter(TeraSchema(**_spec([users("user_id", "post_id")]))).convert()))
+    assert _changes(DiffService().diff(old, str(export))) == set()
+
+    swapped = _write(tmp_path / "swapped.yaml", _spec([users("user_id", "post_id") | {
+        "params": {"path": [{"name": "user_id", "required": True, "example": 1},
+                            {"name": "post_id", "required": True, "example": "a"}]}
+    }]))
+    assert _changes(DiffService().diff(old, swapped)) == {
+        ("GET /users/{user_id}/{post_id}", "param", "path:#2.type", "changed", True)
+    }
+
+def test_response_changes(tmp_path):
+    responses = {"success": {"status": 200, "example": {"ok": True}}, "errors": [{"status": 404, "message": "Missing"}]}
+    old = _write(tmp_path / "old.yaml", _spec([_endpoint("/a", responses=responses)]))
+    new = _write(tmp_path / "new.yaml", _spec([_endpoint("/a", responses={
+        "success": {"status": 201, "example": {"ok": True}}, "errors": [{"status": 404, "message": "Not found"}]
+    })]))
+
+    assert _changes(DiffService().diff(old, new)) == {
+        ("GET /a", "response", "200", "removed", True),
+        ("GET /a", "response", "201", "added", False),
+        ("GET /a", "response", "404.description", "changed", False),
+    }
+
+def test_openapi_documents_are_compared(tmp_path):
+    old_schema = TeraSchema(**_spec([_endpoint("/a", body=[{"name": "x", "example": 1}])]))
+    new_schema = TeraSchema(**_spec([_endpoint("/a", body=[{"name": "x", "example": "1", "required": True}])]))
+    old = tmp_path / "old.json"
+    old.write_text(json.dumps(TeraOpenApiAdapter(old_schema).convert()), encoding="utf-8")
+    new = tmp_path / "new.json"
+    new.write_text(json.dumps(TeraOpenApiAdapter(new_schema).convert()), encoding="utf-8")
+
+    assert _changes(DiffService().diff(str(old), str(new))) == {
+        ("GET /a", "body", "x.type", "changed", True),
+        ("GET /a", "body", "x.required", "changed", True),
+    }
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_git_revision_is_read_without_checkout(tmp_path, monkeypatch):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "api" / "endpoints").mkdir(parents=True)
+    _write(tmp_path / "docs.yaml", _spec([_endpoint("/a"), _endpoint("/b")]))
+    _write(tmp_path / "api" / "api.yaml", {"api": {"name": "Diff API", "version": "1"}})
+    _write(tmp_path / "api" / "endpoints" / "a.yaml", [_endpoint("/a")])
+    git("add", ".")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "v1")
+
+    _write(tmp_path / "docs.yaml", _spec([_endpoint("/a")]))
+    _write(tmp_path / "api" / "endpoints" / "a.yaml", [_endpoint("/a", auth_required=True)])
+    monkeypatch.chdir(tmp_path)
+
+    report = DiffService().diff("HEAD:docs.yaml", "docs.yaml")
+    assert _changes(report) == {("GET /b", "endpoint", None, "removed", True)}
+
+    report = DiffService().diff("HEAD:api/", "api")
+    assert _changes(report) == {("GET /a", "auth", None, "changed", True)}
+    # The working tree is untouched.
+    assert "auth_required: true" in (tmp_path / "api" / "endpoints" / "a.yaml").read_text(encoding="utf-8")
+
+def test_tera_source_matches_its_own_export(tmp_path):
+    """Comparar um fonte Tera com o OpenAPI que ele gera não aponta mudanças (tipos inferidos dos exemplos)."""
+    source = _write(tmp_path / "docs.yaml", {
+        **_spec([
+            _endpoint("/users/{id}", params={"path": [{"name": "id", "required": True, "example": 1}],
+                                             "query": [{"name": "tags", "example": ["a"]}]},
+                      body=[{"name": "age", "example": 30}, {"name": "name", "required": True}],
+                      responses={"success": {"example": {"id": 1}}, "errors": [{"status": 404, "message": "Missing"}]}),
+            _endpoint("/orders", method="POST", tag="orders", auth_required=True, body_model="Order"),
+        ]),
+        "models": {"Order": {"fields": [{"name": "total", "example": 9.5}, {"name": "paid", "example": True}]}},
+    })
+    export = tmp_path / "out.json"
+    export.write_text(json.dumps(TeraOpenApiAdapter(TeraSchema(**yaml.safe_load(open(source)))).convert()), encoding="utf-8")
+
+    report = DiffService().diff(source, str(export))
+    assert report.changes == []
+    assert report.unchanged == 2
@@ -0,0 +1,56 @@
+import ast
+import sys
+import textwrap
+from tera.drivers.flask_driver import FlaskAppDriver
+from tera.drivers.inspection import ast_parser
+
+APP = textwrap.dedent('''
+    from functools import wraps
+    from flask import Flask
+
+    app = Flask("scan")
+
+    def jwt_required(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            return f(*args, **kwargs)
+        return wrapper
+
+    @app.route("/users/<int:user_id>", methods=["GET", "PUT", "DELETE"])
+    @app.route("/members/<int:user_id>", methods=["GET", "PUT"])
+    @jwt_required
+    def user(user_id: int):
+        """Reads a user.
+
+        Longer description.
+        """
+        return ""
+
+    @app.get("/health")
+    def health():
+        """Health check."""
+        return ""
+''')
+
+def test_module_is_parsed_once_for_all_views(tmp_path, monkeypatch):
+    """Cada módulo é analisado uma única vez, e cada view inspecionada uma vez."""
+    (tmp_path / "scan_app.py").write_text(APP, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "scan_app", raising=False)
+    ast_parser.index_module.cache_clear()
+
+    parsed = []
+    real_parse = ast.parse
+    monkeypatch.setattr(ast, "parse", lambda source, *a, **kw: parsed.append(kw.get("filename")) or real_parse(source, *a, **kw))
+
+    driver = FlaskAppDriver("scan_app:app")
+    schema = driver.load()
+
+    assert len(schema.endpoints) == 6
+    assert parsed.count(str(tmp_path / "scan_app.py")) == 1
+    assert len(driver._views) == 2
+
+    by_route = {(ep.method, ep.path): ep for ep in schema.endpoints}
+    assert by_route[("PUT", "/members/{user_id}")].auth_required
+    assert by_route[("DELETE", "/users/{user_id}")].summary == "Reads a user."
+    assert not by_route[("GET", "/health")].auth_required
@@ -0,0 +1,124 @@
+import sys
+import textwrap
+import pytest
+from tera.drivers.flask_driver import FlaskAppDriver
+from tera.drivers.flask_static_driver import FlaskStaticDriver
+from tera.exceptions import TeraError
+
+PROJECT = {
+    "shop/__init__.py": """
+        from flask import Flask
+        from .api import orders_bp
+
+        def create_app():
+            app = Flask(__name__)
+            app.register_blueprint(orders_bp, url_prefix="/v1/orders")
+            from shop import admin
+            admin.init_app(app)
+
+            @app.get("/health")
+            def health():
+                \"\"\"Health check.\"\"\"
+                return ""
+
+            return app
+    """,
+    "shop/schemas.py": """
+        from typing import List, Optional
+        from pydantic import BaseModel, Field
+
+        class Base(BaseModel):
+            id: int = 0
+
+        class Order(Base):
+            customer: str = Field(..., description="Who pays")
+            items: List[str]
+            note: Optional[str] = None
+            total: float = Field(default=0.0)
+    """,
+    "shop/api/__init__.py": """
+        from .orders import bp as orders_bp
+    """,
+    "shop/api/orders.py": """
+        from flask import Blueprint
+        from ..schemas import Order
+        from ..auth import token_required
+
+        bp = Blueprint("orders", __name__, url_prefix="/ignored")
+
+        @bp.route("/", methods=["GET", "POST"])
+        @token_required
+        def collection(order: Order, page: int = 1):
+            \"\"\"Lists or creates orders.
+
+            Paginated.
+            \"\"\"
+            return ""
+
+        def detail(order_id: int, expand: bool = False):
+            \"\"\"One order.\"\"\"
+            return ""
+
+        bp.add_url_rule("/<int:order_id>", "detail", detail, methods=["GET", "DELETE"])
+    """,
+    "shop/auth.py": """
+        from functools import wraps
+
+        def token_required(f):
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                return f(*args, **kwargs)
+            return wrapper
+    """,
+    "shop/admin.py": """
+        from flask import Blueprint
+
+        admin = Blueprint("admin", __name__, url_prefix="/admin")
+        reports = Blueprint("reports", __name__, url_prefix="/reports")
+
+        @reports.put("/<name>")
+        def rebuild(name, **options):
+            return ""
+
+        admin.register_blueprint(reports)
+
+        def init_app(app):
+            app.register_blueprint(admin)
+    """,
+    "shop/broken.py": "def oops(:\n",
+    "wsgi.py": "from shop import create_app\napp = create_app()\n",
+}
+
+def _write_project(root):
+    for name, source in PROJECT.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source), encoding="utf-8")
+
+def _normalized(schema):
+    return sorted(
+        (ep.path, ep.method, ep.model_dump_json()) for ep in schema.endpoints
+    )
+
+def test_static_scan_matches_runtime_scan(tmp_path, monkeypatch):
+    """A análise estática deve gerar o mesmo schema que a introspecção, sem importar nada."""
+    _write_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in [m for m in sys.modules if m == "shop" or m.startswith("shop.")]:
+        monkeypatch.delitem(sys.modules, name)
+
+    static = FlaskStaticDriver("shop:create_app", root=tmp_path, jobs=2)
+    static_schema = static.load()
+    assert "shop" not in sys.modules
+    assert any("broken.py" in warning for warning in static.warnings)
+
+    runtime_schema = FlaskAppDriver("wsgi:app").load()
+    assert _normalized(static_schema) == _normalized(runtime_schema)
+    assert _normalized(FlaskStaticDriver("wsgi:app", root=tmp_path, jobs=1).load()) == _normalized(runtime_schema)
+    assert static_schema.api.name == "shop"
+
+def test_static_scan_requires_a_known_app(tmp_path):
+    _write_project(tmp_path)
+    with pytest.raises(TeraError):
+        FlaskStaticDriver("shop:missing", root=tmp_path, jobs=1).load()
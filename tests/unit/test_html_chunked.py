@@ -0,0 +1,59 @@
+import gzip
+import json
+import re
+import pytest
+from tera.adapters import TeraOpenApiAdapter
+from tera.domain import TeraSchema
+from tera.writers import ChunkedHtmlWriter
+from tera.writers import compression
+
+def _schema(tags):
+    endpoints = [
+        {
+            "path": f"/items/{i}", "method": method, "summary": f"Item {i} </script><b>",
+            "tag": tag, "responses": {"success": {"example": {"id": i}}},
+        }
+        for i, tag in enumerate(tags)
+        for method in ("GET", "DELETE")
+    ]
+    return TeraSchema(api={"name": "Chunked API", "version": "1"}, endpoints=endpoints)
+
+def _embedded(html, name):
+    return json.loads(re.search(rf"const {name} = (.*);\n", html).group(1))
+
+def test_operations_are_split_per_tag_with_gzip_copies(tmp_path):
+    """Cada tag vira um chunk JSON (com cópia .gz); juntos, os chunks formam os paths completos."""
+    schema = _schema(["users", "orders", None, "users"])
+    output = tmp_path / "site" / "index.html"
+    output.parent.mkdir()
+    ChunkedHtmlWriter(output).write(schema)
+
+    html = output.read_text(encoding="utf-8")
+    header, chunks = _embedded(html, "header"), _embedded(html, "chunks")
+    assert "</script><b>" not in html
+    assert "paths" not in header
+    assert [(c["tag"], c["label"], c["operations"]) for c in chunks] == [
+        ("users", "users", 4), ("orders", "orders", 2), (None, "default", 2)
+    ]
+
+    merged = {}
+    for chunk in chunks:
+        path = output.parent / chunk["file"]
+        content = path.read_bytes()
+        assert gzip.decompress(path.with_name(path.name + ".gz").read_bytes()) == content
+        for url, item in json.loads(content)["paths"].items():
+            merged.setdefault(url, {}).update(item)
+    assert merged == TeraOpenApiAdapter(schema).convert()["paths"]
+    assert gzip.decompress(output.with_name("index.html.gz").read_bytes()).decode("utf-8") == html
+
+def test_chunks_of_removed_tags_are_deleted(tmp_path):
+    output = tmp_path / "docs.html"
+    ChunkedHtmlWriter(output).write(_schema(["users", "orders"]))
+    ChunkedHtmlWriter(output, compression=()).write(_schema(["users"]))
+
+    assert sorted(p.name for p in (tmp_path / "docs_chunks").iterdir()) == ["000-users.json"]
+
+@pytest.mark.skipif(compression.HAS_BROTLI, reason="brotli is installed")
+def test_brotli_requires_the_optional_package(tmp_path):
+    with pytest.raises(ImportError, match="brotli"):
+        ChunkedHtmlWriter(tmp_path / "docs.html", compression=("gz", "br"))
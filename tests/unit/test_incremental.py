@@ -0,0 +1,81 @@
+import os
+import shutil
+from pathlib import Path
+from tera.cli import commands
+from tera.core import loader
+from tera.services import IncrementalBuilder, FileWatcher
+from tera.writers import OpenApiJsonWriter
+from tera.drivers import YamlFileDriver
+
+TEMPLATE = Path(__file__).parents[2] / "tera" / "templates" / "init_complete.yaml"
+
+def test_rebuild_regenerates_only_changed_endpoints(tmp_path):
+    docs = tmp_path / "docs.yaml"
+    shutil.copyfile(TEMPLATE, docs)
+    output = tmp_path / "docs.json"
+    builder = IncrementalBuilder(str(docs), [(output, "openapi")])
+
+    first = builder.build()
+    assert (first.rebuilt, first.reused) == (2, 0)
+
+    docs.write_text(docs.read_text(encoding="utf-8").replace("System Status", "Health"), encoding="utf-8")
+    second = builder.build()
+    assert (second.rebuilt, second.reused, second.removed) == (1, 1, 0)
+
+    # O resultado incremental é idêntico a um build completo do zero.
+    full = tmp_path / "full.json"
+    OpenApiJsonWriter(full).write(YamlFileDriver(docs).load())
+    assert output.read_bytes() == full.read_bytes()
+
+def test_polling_watcher_reports_changed_files(tmp_path):
+    docs = tmp_path / "docs.yaml"
+    docs.write_text("a: 1\n", encoding="utf-8")
+    watcher = FileWatcher([docs, tmp_path / "missing.toml"], interval=0.01, use_inotify=False)
+
+    assert watcher.wait(timeout=0.05) == []
+
+    docs.write_text("a: 22\n", encoding="utf-8")
+    os.utime(docs, ns=(1, 1))
+    assert watcher.wait(timeout=1) == [docs.resolve()]
+
+def test_watch_picks_up_new_fragments(tmp_path, monkeypatch):
+    """Um fragmento novo que casa com os padrões de include passa a ser observado e dispara o rebuild."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "api" / "endpoints").mkdir(parents=True)
+    (tmp_path / "api" / "api.yaml").write_text('api: {name: W, version: "1"}\n', encoding="utf-8")
+    config = loader.load_config()
+    watcher = FileWatcher(commands._watched_paths("api", config), interval=0.01, use_inotify=False)
+
+    fragment = tmp_path / "api" / "endpoints" / "users.yaml"
+    fragment.write_text("[]\n", encoding="utf-8")
+    os.utime(fragment.parent, ns=(1, 1))
+
+    assert commands._wait_for_changes(watcher, "api", config) == [fragment.resolve()]
+    assert fragment.resolve() in watcher.paths
+
+def test_watch_reloads_the_config(tmp_path, monkeypatch):
+    """Mudar o .teraconfig.toml recarrega a configuração antes do próximo rebuild."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "docs.yaml").write_text("", encoding="utf-8")
+    (tmp_path / "custom").mkdir()
+    builders = []
+
+    class FakeBuilder:
+        def __init__(self, input_source, outputs, template_dirs=()):
+            builders.append(list(template_dirs))
+
+    changes = iter([[loader.CONFIG_FILENAME]])
+
+    def fake_wait(watcher, input_source, config):
+        try:
+            (tmp_path / loader.CONFIG_FILENAME).write_text('template_dirs = ["custom"]\n', encoding="utf-8")
+            return [Path(name).resolve() for name in next(changes)]
+        except StopIteration:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(commands, "IncrementalBuilder", FakeBuilder)
+    monkeypatch.setattr(commands, "_run_watch_cycle", lambda builder: None)
+    monkeypatch.setattr(commands, "_wait_for_changes", fake_wait)
+    commands._watch("docs.yaml", [(tmp_path / "docs.json", "openapi")], loader.load_config())
+
+    assert builders == [[], [Path("custom")]]
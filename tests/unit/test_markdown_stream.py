@@ -0,0 +1,72 @@
+import pytest
+from tera.domain import TeraSchema
+from tera.writers import MarkdownWriter, SplitMarkdownWriter
+from tera.writers import markdown_writer
+
+def _schema(tags):
+    responses = {"success": {"example": {"ok": True}}}
+    endpoints = [
+        {"path": f"/items/{i}", "method": "GET", "summary": f"Item {i}", "tag": tag, "responses": responses}
+        for i, tag in enumerate(tags)
+    ]
+    endpoints.append({
+        "path": "/orders", "method": "POST", "summary": "Create order", "tag": tags[0],
+        "body_model": "Order", "responses": responses,
+    })
+    return TeraSchema(
+        api={"name": "Split API", "version": "2"},
+        models={"Order": {"fields": [{"name": "sku", "required": True}]}},
+        endpoints=endpoints,
+    )
+
+def test_markdown_is_rendered_without_dumping_the_schema(tmp_path, monkeypatch):
+    """O Markdown é gerado direto dos modelos: schema.dict() nunca é chamado."""
+    schema = _schema(["users", None])
+    monkeypatch.setattr(TeraSchema, "dict", lambda self: pytest.fail("schema.dict() called"))
+    output = tmp_path / "docs.md"
+    MarkdownWriter(output).write(schema)
+
+    content = output.read_text(encoding="utf-8")
+    assert "## 📚 Endpoints" in content
+    assert "#### Request Body (`Order`)" in content
+    assert "| `sku` | `string` | ✅ | - |" in content
+    assert schema.endpoints[-1].body == []
+
+def test_split_writes_an_index_and_one_file_per_tag(tmp_path):
+    schema = _schema(["users", "Users!", None, "orders"])
+    output = tmp_path / "docs.md"
+    SplitMarkdownWriter(output).write(schema)
+
+    index = output.read_text(encoding="utf-8")
+    assert "| [users](docs_tags/users.md) | 2 |" in index
+    assert "| [Users!](docs_tags/users-2.md) | 1 |" in index
+    assert "| [default](docs_tags/default.md) | 1 |" in index
+    assert sorted((tmp_path / "docs_tags").glob("*.md")) == [
+        tmp_path / "docs_tags" / name for name in ("default.md", "orders.md", "users-2.md", "users.md")
+    ]
+
+    users = (tmp_path / "docs_tags" / "users.md").read_text(encoding="utf-8")
+    assert "## 📚 users" in users
+    assert "`/items/0`" in users and "`/orders`" in users and "`/items/1`" not in users
+    assert "| `sku` |" in users
+
+def test_split_removes_files_of_removed_tags(tmp_path):
+    """Só os arquivos listados pelo export anterior são apagados; o resto do diretório fica intacto."""
+    output = tmp_path / "docs.md"
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "CONTRIBUTING.md").write_text("hand written", encoding="utf-8")
+    SplitMarkdownWriter(output).write(_schema(["users", "orders"]))
+    (tmp_path / "docs_tags" / "notes.md").write_text("hand written", encoding="utf-8")
+    SplitMarkdownWriter(output).write(_schema(["users"]))
+
+    assert sorted(p.name for p in (tmp_path / "docs_tags").glob("*.md")) == ["notes.md", "users.md"]
+    assert (tmp_path / "docs" / "CONTRIBUTING.md").exists()
+
+def test_split_in_parallel_matches_sequential(tmp_path, monkeypatch):
+    schema = _schema(["users", "orders", None])
+    SplitMarkdownWriter(tmp_path / "seq.md").write(schema)
+    monkeypatch.setattr(markdown_writer, "PARALLEL_MIN_ENDPOINTS", 0)
+    SplitMarkdownWriter(tmp_path / "par.md", jobs=2).write(schema)
+
+    for name in ("users.md", "orders.md", "default.md"):
+        assert (tmp_path / "par_tags" / name).read_bytes() == (tmp_path / "seq_tags" / name).read_bytes()
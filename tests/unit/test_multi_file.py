@@ -0,0 +1,110 @@
+import pytest
+import yaml
+from tera.adapters import CompiledSchemaCache
+from tera.core import factory, includes
+from tera.core.cache import BuildCache
+from tera.drivers import MultiFileDriver, YamlFileDriver
+from tera.drivers import multi_file_driver
+from tera.exceptions import TeraError
+
+API = {"name": "Split API", "version": "1"}
+
+def _endpoint(path, **extra):
+    return {"path": path, "method": "GET", "summary": path, "responses": {"success": {"example": {"ok": True}}}, **extra}
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "api"
+    _write(root / "api.yaml", {"api": API, "endpoints": [_endpoint("/health")]})
+    _write(root / "endpoints" / "users.yaml", {
+        "models": {"User": {"fields": [{"name": "email", "required": True}]}},
+        "endpoints": [_endpoint("/users", body_model="User")],
+    })
+    _write(root / "endpoints" / "orders" / "orders.yaml", [_endpoint("/orders"), _endpoint("/orders/{id}")])
+    return root
+
+def test_directory_is_merged_in_include_order(source):
+    """Manifest + fragmentos viram um único TeraSchema, na ordem dos arquivos incluídos."""
+    driver = factory.get_driver(source)
+    assert isinstance(driver, MultiFileDriver)
+
+    schema = driver.load()
+    assert [ep.path for ep in schema.endpoints] == ["/health", "/orders", "/orders/{id}", "/users"]
+    assert [field.name for field in schema.body_fields(schema.endpoints[-1])] == ["email"]
+
+def test_manifest_file_with_include_patterns(tmp_path, source):
+    manifest = source / "main.yaml"
+    _write(manifest, {"api": API, "include": ["endpoints/users.yaml"]})
+    assert isinstance(factory.get_driver(manifest), MultiFileDriver)
+    assert [ep.path for ep in factory.get_driver(manifest).load().endpoints] == ["/users"]
+
+    single = tmp_path / "docs.yaml"
+    _write(single, {"api": API, "endpoints": [_endpoint("/x")]})
+    assert isinstance(factory.get_driver(single), YamlFileDriver)
+
+def test_only_edited_fragments_are_parsed_again(tmp_path, source, monkeypatch):
+    parsed = []
+    original = multi_file_driver.load_fragment
+    monkeypatch.setattr(multi_file_driver, "load_fragment", lambda path: parsed.append(path.name) or original(path))
+    compiled_cache = CompiledSchemaCache(tmp_path / "cache")
+
+    MultiFileDriver(source, compiled_cache=compiled_cache).load()
+    assert sorted(parsed) == ["orders.yaml", "users.yaml"]
+
+    parsed.clear()
+    _write(source / "endpoints" / "orders" / "orders.yaml", [_endpoint("/orders")])
+    schema = MultiFileDriver(source, compiled_cache=compiled_cache).load()
+    assert parsed == ["orders.yaml"]
+    assert [ep.path for ep in schema.endpoints] == ["/health", "/orders", "/users"]
+
+def test_fragment_errors_name_the_file(source):
+    _write(source / "endpoints" / "broken.yaml", {"endpoints": [{"path": "/broken"}]})
+    with pytest.raises(TeraError) as error:
+        MultiFileDriver(source).load()
+    assert "broken.yaml" in error.value.message
+
+def test_duplicated_body_models_are_rejected(source):
+    _write(source / "endpoints" / "more.yaml", {"models": {"User": {"fields": []}}})
+    with pytest.raises(TeraError, match="'User' is defined in both"):
+        MultiFileDriver(source).load()
+
+def test_build_key_covers_every_fragment(source):
+    files = includes.source_files(source)
+    assert files[0] == source / "api.yaml" and len(files) == 3
+
+    key = BuildCache.compute_key(files[0], {}, "html", extra_inputs=files[1:])
+    _write(source / "endpoints" / "users.yaml", {"endpoints": [_endpoint("/users")]})
+    assert BuildCache.compute_key(files[0], {}, "html", extra_inputs=files[1:]) != key
+
+class _Exploit:
+    def __reduce__(self):
+        return (print, ("unpickled",))
+
+def test_forged_fragment_entries_are_parsed_again(tmp_path, source, monkeypatch):
+    """Nomes previsíveis: uma entrada forjada (pickle) nunca é desserializada, o fragmento é relido."""
+    import pickle
+    import zlib
+
+    fragment = source / "endpoints" / "users.yaml"
+    compiled_cache = CompiledSchemaCache(tmp_path / "cache")
+    MultiFileDriver(source, compiled_cache=compiled_cache).load()
+
+    cache = MultiFileDriver(source, compiled_cache=compiled_cache).fragment_cache
+    key = cache.compute_key(fragment)
+    entry = cache._entry_path(fragment, key)
+    assert entry.exists()
+    header = f'{{"version": 2, "key": "{key}", "indexed": false}}\n'.encode()
+    entry.write_bytes(header + zlib.compress(pickle.dumps(_Exploit())))
+
+    monkeypatch.setattr(pickle, "loads", lambda *a, **k: pytest.fail("fragment entry was unpickled"))
+    parsed = []
+    original = multi_file_driver.load_fragment
+    monkeypatch.setattr(multi_file_driver, "load_fragment", lambda path: parsed.append(path.name) or original(path))
+
+    schema = MultiFileDriver(source, compiled_cache=compiled_cache).load()
+    assert parsed == ["users.yaml"]
+    assert [ep.path for ep in schema.endpoints][-1] == "/users"
@@ -0,0 +1,39 @@
+import yaml
+from pathlib import Path
+from tera.domain import TeraSchema
+from tera.writers import OpenApiJsonWriter, OpenApiYamlWriter
+
+TEMPLATE = Path(__file__).parents[2] / "tera" / "templates" / "init_complete.yaml"
+
+def _complete_schema() -> TeraSchema:
+    with open(TEMPLATE, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    # Mesmo path com dois métodos + textos longos/unicode para exercitar o emitter.
+    data["endpoints"].append({
+        "method": "GET",
+        "path": "/users/{id}",
+        "summary": "Busca usuário — " + "descrição longa " * 12,
+        "responses": {"success": {"example": {"id": 1, "tags": ["a", "b"], "meta": {}}}},
+    })
+    return TeraSchema(**data)
+
+def _write_both(writer_class, tmp_path, schema, suffix):
+    plain = tmp_path / f"plain{suffix}"
+    streamed = tmp_path / f"streamed{suffix}"
+    writer_class(plain).write(schema)
+    writer_class(streamed, streaming=True).write(schema)
+    return plain.read_bytes(), streamed.read_bytes()
+
+def test_streaming_json_is_byte_identical(tmp_path):
+    plain, streamed = _write_both(OpenApiJsonWriter, tmp_path, _complete_schema(), ".json")
+    assert streamed == plain
+
+def test_streaming_yaml_is_byte_identical(tmp_path):
+    plain, streamed = _write_both(OpenApiYamlWriter, tmp_path, _complete_schema(), ".yaml")
+    assert streamed == plain
+
+def test_streaming_without_endpoints(tmp_path):
+    schema = TeraSchema(api={"name": "Empty", "version": "1"}, endpoints=[])
+    for writer_class, suffix in ((OpenApiJsonWriter, ".json"), (OpenApiYamlWriter, ".yaml")):
+        plain, streamed = _write_both(writer_class, tmp_path, schema, suffix)
+        assert streamed == plain
@@ -0,0 +1,41 @@
+import json
+import yaml
+from tera.adapters.openapi import TeraOpenApiAdapter
+from tera.services import run_pipeline
+from tera.writers import OpenApiJsonWriter, OpenApiYamlWriter, HtmlWriter
+
+class StaticDriver:
+    def __init__(self, schema):
+        self.schema = schema
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.schema
+
+def test_multiple_writers_share_one_load_and_conversion(minimal_schema_model, tmp_path, monkeypatch):
+    """Vários writers: um load, uma conversão OpenAPI, todas as saídas escritas."""
+    calls = []
+    original = TeraOpenApiAdapter._build_document
+
+    def counting_build(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(TeraOpenApiAdapter, "_build_document", counting_build)
+
+    driver = StaticDriver(minimal_schema_model)
+    writers = [
+        OpenApiJsonWriter(tmp_path / "spec.json"),
+        OpenApiYamlWriter(tmp_path / "spec.yaml"),
+        HtmlWriter(tmp_path / "spec.html"),
+    ]
+
+    run_pipeline(driver, writers)
+
+    assert driver.loads == 1
+    assert len(calls) == 1
+    from_json = json.loads((tmp_path / "spec.json").read_text(encoding="utf-8"))
+    from_yaml = yaml.safe_load((tmp_path / "spec.yaml").read_text(encoding="utf-8"))
+    assert from_json == from_yaml
+    assert (tmp_path / "spec.html").exists()
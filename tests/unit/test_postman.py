@@ -0,0 +1,87 @@
+import json
+from tera.domain import TeraSchema
+from tera.writers import PostmanWriter, ShardedPostmanWriter
+from tera.writers import postman_writer
+
+def _schema(tags):
+    responses = {"success": {"example": {"ok": True}}}
+    endpoints = [
+        {"path": f"/items/{{id}}/{i}", "method": "GET", "summary": f"Item {i} \"ünïcode\"", "tag": tag, "responses": responses}
+        for i, tag in enumerate(tags)
+    ]
+    endpoints.append({
+        "path": "/orders", "method": "POST", "summary": "Create order", "tag": tags[0],
+        "body_model": "Order", "responses": responses,
+    })
+    return TeraSchema(
+        api={"name": "Postman API", "version": "1"},
+        models={"Order": {"fields": [{"name": "sku", "required": True}]}},
+        endpoints=endpoints,
+    )
+
+def test_requests_are_grouped_in_tag_folders(tmp_path):
+    """Requests com tag vão para uma pasta por tag; os sem tag ficam na raiz."""
+    output = tmp_path / "api.json"
+    PostmanWriter(output).write(_schema(["users", None, "orders", "users"]))
+
+    content = output.read_text(encoding="utf-8")
+    collection = json.loads(content)
+    assert content == json.dumps(collection, indent=2, ensure_ascii=False)
+
+    entries = collection["item"]
+    assert [entry["name"] for entry in entries] == ["users", "GET /items/{id}/1", "orders"]
+    assert [item["name"] for item in entries[0]["item"]] == ["GET /items/{id}/0", "GET /items/{id}/3", "POST /orders"]
+    assert entries[0]["item"][0]["request"]["url"]["raw"] == "{{base_url}}/items/:id/0"
+    assert json.loads(entries[0]["item"][2]["request"]["body"]["raw"]) == {"sku": "string"}
+    assert collection["variable"][0]["key"] == "base_url"
+
+def test_empty_collection_is_valid_json(tmp_path):
+    output = tmp_path / "api.json"
+    PostmanWriter(output).write(TeraSchema(api={"name": "Empty", "version": "1"}, endpoints=[]))
+    content = output.read_text(encoding="utf-8")
+    assert json.loads(content)["item"] == []
+    assert content == json.dumps(json.loads(content), indent=2, ensure_ascii=False)
+
+def test_sharded_writes_one_collection_per_tag(tmp_path):
+    output = tmp_path / "api.json"
+    ShardedPostmanWriter(output).write(_schema(["users", None, "orders"]))
+
+    manifest = json.loads(output.read_text(encoding="utf-8"))
+    assert [(c["tag"], c["file"], c["requests"]) for c in manifest["collections"]] == [
+        ("users", "api_shards/users.json", 2), (None, "api_shards/default.json", 1),
+        ("orders", "api_shards/orders.json", 1)
+    ]
+    users = json.loads((tmp_path / "api_shards" / "users.json").read_text(encoding="utf-8"))
+    assert users["info"]["name"] == "Postman API - users"
+    assert [item["name"] for item in users["item"]] == ["GET /items/{id}/0", "POST /orders"]
+
+def test_untagged_requests_are_not_merged_into_a_default_tag(tmp_path):
+    """Endpoints sem tag não se misturam com os de uma tag chamada 'default'."""
+    output = tmp_path / "api.json"
+    ShardedPostmanWriter(output).write(_schema(["default", None]))
+
+    manifest = json.loads(output.read_text(encoding="utf-8"))
+    assert [(c["tag"], c["file"], c["requests"]) for c in manifest["collections"]] == [
+        ("default", "api_shards/default.json", 2), (None, "api_shards/default-2.json", 1)
+    ]
+
+def test_sharded_only_removes_collections_it_wrote(tmp_path):
+    """Só as coleções listadas no manifesto anterior são apagadas (ex.: um openapi.json ao lado fica)."""
+    output = tmp_path / "api.json"
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "openapi.json").write_text("{}", encoding="utf-8")
+    ShardedPostmanWriter(output).write(_schema(["users", "orders"]))
+    (tmp_path / "api_shards" / "extra.json").write_text("{}", encoding="utf-8")
+    ShardedPostmanWriter(output).write(_schema(["users"]))
+
+    assert sorted(p.name for p in (tmp_path / "api_shards").iterdir()) == ["extra.json", "users.json"]
+    assert (tmp_path / "api" / "openapi.json").exists()
+
+def test_sharded_in_parallel_matches_sequential(tmp_path, monkeypatch):
+    schema = _schema(["users", "orders", None])
+    ShardedPostmanWriter(tmp_path / "seq.json").write(schema)
+    monkeypatch.setattr(postman_writer, "PARALLEL_MIN_ENDPOINTS", 0)
+    ShardedPostmanWriter(tmp_path / "par.json", jobs=2).write(schema)
+
+    for name in ("users.json", "orders.json", "default.json"):
+        assert (tmp_path / "par_shards" / name).read_bytes() == (tmp_path / "seq_shards" / name).read_bytes()
@@ -0,0 +1,64 @@
+from tera.domain import TeraSchema
+from tera.services import LinterService
+from tera.services.rules import Rule, RuleEngine, ALL_RULES
+
+def _schema() -> TeraSchema:
+    return TeraSchema(
+        api={"name": "Engine", "version": "1"},
+        endpoints=[{
+            "path": "/users/{id}",
+            "method": "DELETE",
+            "summary": "Remove",
+            "params": {"path": [{"name": "id"}], "query": [{"name": "force"}]},
+            "responses": {"success": {}, "errors": [{"status": 404, "message": "Not found"}]},
+        }],
+    )
+
+def test_engine_dispatches_each_node_kind_with_its_path():
+    """Um único percurso entrega cada nó às regras do seu tipo, com o caminho no documento."""
+    seen = []
+
+    def record(node, ctx):
+        seen.append(ctx.path)
+        return []
+
+    rules = [Rule(name=f"r_{kind}", node=kind, check=record) for kind in ("param", "response")]
+    RuleEngine(rules=rules).run(_schema())
+
+    assert seen == [
+        ("endpoints", 0, "params", "path", 0),
+        ("endpoints", 0, "params", "query", 0),
+        ("endpoints", 0, "responses", "success"),
+        ("endpoints", 0, "responses", "errors", 0),
+    ]
+
+def test_builtin_rules_and_timings():
+    engine = RuleEngine(profile=True)
+    codes = {issue.code for issue in engine.run(_schema())}
+
+    assert codes == {"missing_api_description", "unsafe_operation"}
+    assert set(engine.timings) == {r.name for r in ALL_RULES}
+
+def test_failing_rule_becomes_issue():
+    def broken(node, ctx):
+        raise RuntimeError("boom")
+
+    issues = RuleEngine(rules=[Rule(name="broken", node="endpoint", check=broken)]).run(_schema())
+
+    assert [(i.code, i.location) for i in issues] == [("rule_engine_error", "DELETE /users/{id}")]
+
+def test_linter_validates_only_once(tmp_path, monkeypatch):
+    docs = tmp_path / "docs.yaml"
+    docs.write_text("api: {name: A, version: '1'}\nendpoints: []\n", encoding="utf-8")
+
+    calls = []
+    original = TeraSchema.model_validate.__func__
+
+    def counting(cls, *args, **kwargs):
+        calls.append(1)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(TeraSchema, "model_validate", classmethod(counting))
+    LinterService().lint(docs)
+
+    assert len(calls) == 1
@@ -0,0 +1,125 @@
+import pytest
+import textwrap
+from tera.drivers.flask_static_driver import FlaskStaticDriver
+from tera.drivers.inspection.scan_cache import ScanCache
+
+FILES = {
+    "app.py": """
+        from flask import Flask
+        from views import users
+        app = Flask("cached")
+        app.add_url_rule("/users", "users", users, methods=["GET", "POST"])
+
+        @app.get("/ping")
+        def ping():
+            \"\"\"Ping.\"\"\"
+            return ""
+    """,
+    "views.py": """
+        from models import User
+
+        def users(user: User):
+            \"\"\"Users.\"\"\"
+            return ""
+    """,
+    "models.py": """
+        from pydantic import BaseModel
+
+        class User(BaseModel):
+            name: str
+    """,
+}
+
+def _write(root, name, source):
+    (root / name).write_text(textwrap.dedent(source), encoding="utf-8")
+
+def _scan(root, cache_dir):
+    cache = ScanCache("test", cache_dir=cache_dir)
+    schema = FlaskStaticDriver(root=root, jobs=1, scan_cache=cache).load()
+    cache.save()
+    return schema, cache
+
+def test_only_routes_with_changed_sources_are_rescanned(tmp_path):
+    """Só as rotas cujo módulo (ou o módulo do model do body) mudou são reprocessadas."""
+    project, cache_dir = tmp_path / "project", tmp_path / "cache"
+    project.mkdir()
+    for name, source in FILES.items():
+        _write(project, name, source)
+
+    first, cache = _scan(project, cache_dir)
+    assert (cache.reused, cache.rescanned, cache.modules_parsed) == (0, 3, 3)
+
+    second, cache = _scan(project, cache_dir)
+    assert (cache.reused, cache.rescanned, cache.modules_reused) == (3, 0, 3)
+    assert second == first
+
+    _write(project, "models.py", textwrap.dedent(FILES["models.py"]) + "    email: str = ''\n")
+    third, cache = _scan(project, cache_dir)
+    assert (cache.reused, cache.rescanned, cache.modules_parsed) == (1, 2, 1)
+
+    post = next(ep for ep in third.endpoints if ep.method == "POST")
+    assert [field.name for field in third.body_fields(post)] == ["name", "email"]
+
+def test_rebound_endpoint_is_rescanned(tmp_path, monkeypatch):
+    """Trocar a função de um endpoint (add_url_rule) não pode reaproveitar a rota antiga."""
+    import sys
+    from tera.drivers.flask_driver import FlaskAppDriver
+
+    project, cache_dir = tmp_path / "project", tmp_path / "cache"
+    project.mkdir()
+    monkeypatch.syspath_prepend(str(project))
+    _write(project, "rebind_views.py", """
+        def list_users():
+            \"\"\"Lists users.\"\"\"
+            return ""
+
+        def search_users(limit: int = 10):
+            \"\"\"Searches users.\"\"\"
+            return ""
+    """)
+
+    def scan(view):
+        _write(project, "rebind_app.py", f"""
+            from flask import Flask
+            import rebind_views
+            app = Flask("rebind")
+            app.add_url_rule("/users", "users", rebind_views.{view})
+        """)
+        sys.modules.pop("rebind_app", None)
+        cache = ScanCache("rebind", cache_dir=cache_dir)
+        schema = FlaskAppDriver("rebind_app:app", scan_cache=cache).load()
+        cache.save()
+        return schema.endpoints[0], cache
+
+    scan("list_users")
+    endpoint, cache = scan("search_users")
+    assert cache.reused == 0
+    assert endpoint.summary == "Searches users."
+    assert [param.name for param in endpoint.params.query] == ["limit"]
+
+def test_cache_file_is_plain_data(tmp_path, monkeypatch):
+    """O cache fica na árvore do projeto: nunca é um pickle, e uma entrada inválida só força um novo scan."""
+    import json
+    import pickle
+
+    project, cache_dir = tmp_path / "project", tmp_path / "cache"
+    project.mkdir()
+    for name, source in FILES.items():
+        _write(project, name, source)
+    first, cache = _scan(project, cache_dir)
+
+    lines = cache.path.read_text(encoding="utf-8").split("\n", 1)
+    data = json.loads(lines[1])
+    for _, _, value in data["routes"]:
+        value["endpoint"]["summary"] = {"not": "a string"}
+    cache.path.write_text(lines[0] + "\n" + json.dumps(data), encoding="utf-8")
+    monkeypatch.setattr(pickle, "load", lambda *a, **k: pytest.fail("scan cache was unpickled"))
+    monkeypatch.setattr(pickle, "loads", lambda *a, **k: pytest.fail("scan cache was unpickled"))
+
+    second, cache = _scan(project, cache_dir)
+    assert (cache.reused, cache.rescanned) == (0, 3)
+    assert second == first
+
+    cache.path.write_bytes(pickle.dumps({"routes": {}}))
+    third, cache = _scan(project, cache_dir)
+    assert cache.rescanned == 3 and third == first
@@ -0,0 +1,60 @@
+from tera.adapters import TeraOpenApiAdapter
+from tera.domain import TeraSchema
+from tera.services.rules import RuleEngine
+
+def _endpoint(path, method="GET", **extra):
+    return {"path": path, "method": method, "summary": path, "responses": {"success": {}}, **extra}
+
+def _schema() -> TeraSchema:
+    return TeraSchema(
+        api={"name": "Index", "version": "1", "description": "Index API"},
+        endpoints=[
+            _endpoint("/users", tag="Users"),
+            _endpoint("/users/{id}", tag="Users"),
+            _endpoint("/health"),
+            _endpoint("/users", tag="Admin"),
+            _endpoint("/users-list"),
+            _endpoint("/users/list"),
+        ],
+    )
+
+def test_lookups_and_stable_operation_ids():
+    """Parâmetros de path entram no operationId; colisões reais são registradas, sem renomear."""
+    schema = _schema()
+    index = schema.index()
+
+    assert index is schema.index()
+    assert index.get("get", "/users/{id}") is schema.endpoints[1]
+    assert index.get("GET", "/missing") is None
+    assert index.operation_ids == ["getUsers", "getUsersById", "getHealth", "getUsers", "getUsersList", "getUsersList"]
+    assert index.operation("getUsersById") is schema.endpoints[1]
+    assert index.paths["/users"] == [0, 3]
+    assert index.duplicates == {3: 0}
+    assert index.collisions == {5: 4}
+    assert [(tag, len(eps)) for tag, eps in index.by_tag()] == [("Users", 2), (None, 3), ("Admin", 1)]
+
+def test_index_is_rebuilt_for_copies():
+    schema = _schema()
+    copy = schema.model_copy(update={"endpoints": schema.endpoints[:1]})
+    assert copy.index() is not schema.index()
+    assert copy.index().operation_ids == ["getUsers"]
+
+def test_lint_reports_duplicates_and_collisions():
+    issues = RuleEngine().run(_schema())
+    found = {(issue.code, issue.location) for issue in issues if issue.code in ("duplicate_route", "operation_id_collision")}
+    assert found == {("operation_id_collision", "GET /users/list"), ("duplicate_route", "GET /users")}
+
+def test_operation_ids_do_not_depend_on_endpoint_order():
+    """Incluir ou reordenar endpoints não altera o operationId dos demais."""
+    schema = _schema()
+    reordered = schema.model_copy(update={"endpoints": [schema.endpoints[1], schema.endpoints[2], schema.endpoints[0]]})
+    assert reordered.index().operation_ids == ["getUsersById", "getHealth", "getUsers"]
+    assert reordered.index().collisions == {}
+
+    paths = TeraOpenApiAdapter(schema).convert()["paths"]
+    assert paths["/users"]["get"]["operationId"] == "getUsers"
+    assert paths["/users/{id}"]["get"]["operationId"] == "getUsersById"
+    nested = TeraSchema(
+        api={"name": "N", "version": "1"}, endpoints=[_endpoint("/users/{id}/posts/{post_id}", method="DELETE")]
+    )
+    assert nested.index().operation_ids == ["deleteUsersByIdPostsByPostId"]
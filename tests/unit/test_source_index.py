@@ -0,0 +1,48 @@
+import textwrap
+from tera.adapters import FileLoader
+from tera.services import LinterService
+
+DOCS = textwrap.dedent("""\
+    api:
+      name: Lines
+      version: "1"
+    endpoints:
+      - path: /a
+        method: GET
+        summary: ok
+        responses:
+          success: {}
+      - path: /b
+        method: POST
+        summary: write
+        params:
+          query:
+            - name: q
+              bogus: 1
+        responses:
+          success: {}
+""")
+
+def test_index_is_built_while_loading(tmp_path):
+    docs = tmp_path / "docs.yaml"
+    docs.write_text(DOCS, encoding="utf-8")
+
+    data, issues, index = FileLoader.load_with_index(docs)
+
+    assert issues == []
+    assert data["endpoints"][1]["path"] == "/b"
+    assert index.lookup(("endpoints", 1)) == (10, 5)
+    assert index.lookup(("endpoints", 1, "params", "query", 0, "bogus")) == (16, 11)
+    # Caminhos sem nó próprio caem no ancestral mais próximo.
+    assert index.line_of(("endpoints", 0, "responses", "success", "status")) == 9
+
+def test_schema_and_rule_issues_carry_lines(tmp_path):
+    docs = tmp_path / "docs.yaml"
+    docs.write_text(DOCS, encoding="utf-8")
+
+    [schema_error] = LinterService().lint(docs)
+    assert (schema_error.code, schema_error.line) == ("schema_error", 16)
+
+    docs.write_text(DOCS.replace("          bogus: 1\n", ""), encoding="utf-8")
+    lines = {issue.code: issue.line for issue in LinterService().lint(docs)}
+    assert lines == {"missing_api_description": 1, "unsafe_operation": 10}
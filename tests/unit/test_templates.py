@@ -0,0 +1,49 @@
+from jinja2 import Environment
+from tera.writers import MarkdownWriter, HtmlWriter
+from tera.writers import templates
+
+def _count_compiles(monkeypatch):
+    compiled = []
+    original = Environment.compile
+
+    def counting_compile(self, source, name=None, filename=None, *args, **kwargs):
+        compiled.append(name)
+        return original(self, source, name, filename, *args, **kwargs)
+
+    monkeypatch.setattr(Environment, "compile", counting_compile)
+    return compiled
+
+def test_templates_compile_once_and_reuse_bytecode(minimal_schema_model, tmp_path, monkeypatch):
+    """O template compila uma vez por processo; um processo novo usa o bytecode salvo no cache do usuário."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "user-cache"))
+    monkeypatch.setattr(templates, "_environments", {})
+    compiled = _count_compiles(monkeypatch)
+
+    for i in range(3):
+        MarkdownWriter(tmp_path / f"docs{i}.md").write(minimal_schema_model)
+        HtmlWriter(tmp_path / f"docs{i}.html").write(minimal_schema_model)
+    assert sorted(compiled) == ["markdown.md.j2", "redoc.html.j2"]
+    assert len(list((tmp_path / "user-cache" / "tera" / templates.BYTECODE_DIR_NAME).iterdir())) == 2
+    # Never inside the project, where a repository could ship crafted bytecode.
+    assert not (tmp_path / ".tera" / "cache" / templates.BYTECODE_DIR_NAME).exists()
+
+    # Simulates a new run: fresh environments, bytecode from disk.
+    monkeypatch.setattr(templates, "_environments", {})
+    MarkdownWriter(tmp_path / "again.md").write(minimal_schema_model)
+    assert len(compiled) == 2
+    assert (tmp_path / "again.md").read_text() == (tmp_path / "docs0.md").read_text()
+
+def test_user_template_dirs_override_builtin_templates(minimal_schema_model, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    custom = tmp_path / "my_templates"
+    custom.mkdir()
+    (custom / "markdown.md.j2").write_text("Custom docs for {{ api.name }}\n", encoding="utf-8")
+
+    MarkdownWriter(tmp_path / "custom.md", template_dirs=[custom]).write(minimal_schema_model)
+    MarkdownWriter(tmp_path / "builtin.md").write(minimal_schema_model)
+    HtmlWriter(tmp_path / "docs.html", template_dirs=[custom]).write(minimal_schema_model)
+
+    assert (tmp_path / "custom.md").read_text() == "Custom docs for Test API"
+    assert (tmp_path / "builtin.md").read_text().startswith("# Test API")
+    assert "Test API" in (tmp_path / "docs.html").read_text()
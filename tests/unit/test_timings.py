@@ -0,0 +1,52 @@
+import yaml
+from tera.core import timings
+from tera.drivers.yaml_driver import YamlFileDriver
+from tera.services import run_pipeline, LinterService
+from tera.writers import OpenApiJsonWriter, MarkdownWriter
+
+def _write_docs(path, schema):
+    path.write_text(yaml.safe_dump(schema.model_dump(mode="json", exclude_none=True)), encoding="utf-8")
+    return path
+
+def test_build_reports_every_stage(minimal_schema_model, tmp_path):
+    """Um build reporta load/parse/validate, a conversão e cada writer, na ordem de início."""
+    source = _write_docs(tmp_path / "docs.yaml", minimal_schema_model)
+    writers = [OpenApiJsonWriter(tmp_path / "spec.json"), MarkdownWriter(tmp_path / "docs.md")]
+
+    with timings.collect() as collected:
+        run_pipeline(YamlFileDriver(source), writers)
+
+    stages = {stage["name"]: stage for stage in collected.summary()}
+    names = [stage["name"] for stage in collected.summary()]
+    assert names[:3] == ["load", "parse", "validate"]
+    assert {"write", "convert", "write.openapi-json", "write.markdown"} <= set(names)
+
+    endpoints = len(minimal_schema_model.endpoints)
+    assert stages["load"]["items"] == stages["validate"]["items"] == endpoints
+    assert stages["write"]["items"] == 2
+    assert all(stage["calls"] == 1 and stage["wall"] >= 0 for stage in stages.values())
+    assert not timings.enabled()
+
+def test_hooks_receive_records_and_can_be_removed(minimal_schema_model, tmp_path):
+    source = _write_docs(tmp_path / "docs.yaml", minimal_schema_model)
+    records = []
+
+    timings.add_hook(records.append)
+    try:
+        LinterService().lint(source)
+    finally:
+        timings.remove_hook(records.append)
+    LinterService().lint(source)
+
+    assert [record.name for record in records] == ["parse", "validate", "rules"]
+    assert all(isinstance(record, timings.StageRecord) for record in records)
+
+def test_parallel_lint_reports_worker_stages(minimal_schema_model, tmp_path):
+    """Com processos, as etapas medidas nos workers chegam aos hooks do processo pai."""
+    files = [_write_docs(tmp_path / name, minimal_schema_model) for name in ("a.yaml", "b.yaml")]
+
+    with timings.collect() as collected:
+        LinterService().lint_files(files, jobs=2)
+
+    calls = {stage["name"]: stage["calls"] for stage in collected.summary()}
+    assert calls == {"lint": 1, "parse": 2, "validate": 2, "rules": 2}
@@ -0,0 +1,58 @@
+import sys
+import textwrap
+from tera.domain import TeraSchema, TrustedBuilder
+from tera.drivers.flask_driver import FlaskAppDriver
+from tera.drivers.inspection.scan_cache import ScanCache
+
+APP = textwrap.dedent('''
+    from flask import Flask
+
+    app = Flask("trusted")
+
+    @app.get("/users/<int:user_id>")
+    def user(user_id: int, page: int = 1):
+        """Reads a user."""
+        return ""
+
+    @app.get("/orders/<int:user_id>")
+    def order(user_id: int, page: int = 1):
+        """Reads an order."""
+        return ""
+
+    @app.get("/flags")
+    def flags(page: bool = True):
+        """Lists the flags."""
+        return ""
+''')
+
+def test_identical_parts_are_shared():
+    """Campos iguais viram uma única instância; o tipo do exemplo faz parte da identidade."""
+    builder = TrustedBuilder()
+    first = builder.param(name="page", example=1, description="Query Parameter")
+    assert builder.param(name="page", example=1, description="Query Parameter") is first
+    assert builder.param(name="page", example=True, description="Query Parameter") is not first
+    assert builder.responses(201, {"message": "Success"}) is builder.responses(201, {"message": "Success"})
+    assert builder.responses(200, {"message": "Success"}) is not builder.responses(201, {"message": "Success"})
+
+def test_scanned_schema_equals_validated_one(tmp_path, monkeypatch):
+    (tmp_path / "trusted_app.py").write_text(APP, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sys.modules.pop("trusted_app", None)
+
+    schema = FlaskAppDriver("trusted_app:app").load()
+    users, orders, flags = schema.endpoints
+
+    # Built without validation, but exactly what validating the same data gives.
+    assert TeraSchema.model_validate(schema.model_dump()) == schema
+    assert users.params is orders.params
+    assert users.responses is flags.responses
+    assert flags.params.query[0].example is True
+
+    # Endpoints validated back from the scan cache are shared the same way.
+    cache = ScanCache("trusted", cache_dir=tmp_path / "cache")
+    FlaskAppDriver("trusted_app:app", scan_cache=cache).load()
+    cache.save()
+    cache = ScanCache("trusted", cache_dir=tmp_path / "cache")
+    restored = FlaskAppDriver("trusted_app:app", scan_cache=cache).load()
+    assert cache.reused == 3 and restored == schema
+    assert restored.endpoints[0].params is restored.endpoints[1].params
@@ -0,0 +1,28 @@
+import io
+import pytest
+import yaml
+from tera.core import yaml_io
+
+DOC = {
+    "api": {"name": "Backends", "description": "Descrição com acentos e linha separada"},
+    "endpoints": [{"path": "/x", "example": {"nested": [1, 2.5, None, True, "texto " * 30]}}],
+}
+
+def test_python_backend_can_be_forced():
+    name, loader, dumper = yaml_io._select_backend("python")
+    assert name == "python"
+    assert loader is yaml.SafeLoader and dumper is yaml.SafeDumper
+
+@pytest.mark.skipif(not yaml_io.HAS_LIBYAML, reason="PyYAML sem libyaml")
+def test_backends_are_interchangeable():
+    """Os dois backends devem ler e escrever exatamente o mesmo conteúdo."""
+    _, py_loader, py_dumper = yaml_io._select_backend("python")
+    _, c_loader, c_dumper = yaml_io._select_backend("libyaml")
+    options = dict(sort_keys=False, allow_unicode=True, default_flow_style=False, indent=2)
+
+    py_text = yaml_io.dump(DOC, dumper=py_dumper, **options)
+    c_text = yaml_io.dump(DOC, dumper=c_dumper, **options)
+
+    assert py_text == c_text
+    assert yaml_io.safe_load(io.StringIO(py_text), loader=c_loader) == DOC
+    assert yaml_io.safe_load(io.StringIO(c_text), loader=py_loader) == DOC